@@ -1,11 +1,14 @@
-import chardet
-import copy
 import os
 
+from collections import OrderedDict
 from SCARCommon import *
+from SCARReader import Encodings, LazySource, Manifest, ResultWriter, compileMarkers, detectEncoding, encodingKey, isCompressed, readRecords
 
-from concurrent.futures import ThreadPoolExecutor
-from parse import *
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+ANALYZE_ENGINES = ('thread', 'process')
+LAZY_CACHE      = 4096      # 다시 분석한 지연 생성 로그를 보관할 최대 개수
+EMPTY_REQUEST   = ('', '')  # OCPP 요청이 아닌 로그의 요청 키
 
 def info(log):
     if log[:1] == '\n':
@@ -14,6 +17,144 @@ def info(log):
 
     print(f'[{now()}] [SCARAnalyzer] {log}')
 
+# 작업자 수 (양의 정수 또는 숫자 문자열), 잘못된 값은 None
+def parseWorkers(workers):
+    if type(workers) == str and workers.strip().isdigit():
+        workers = int(workers)
+
+    if type(workers) != int or workers <= 0:
+        return None
+    return workers
+
+# 지연 생성 로그 (시간/대상/요청 키와 원본 위치만 보관, 나머지는 읽을 때 원본 레코드를 다시 분석)
+@plainType
+class LazyLogInfo(LogRecord):
+    __slots__ = ('source', 'nOffset', 'nSize', 'nConnectorId', 'requestKey', 'response')
+
+    def __init__(self, logInfo, source, nOffset, nSize, nConnectorId):
+        self.strDateTime  = logInfo.strDateTime
+        self.nTime        = logInfo.nTime
+        self.strTarget    = logInfo.strTarget
+        self.source       = source
+        self.nOffset      = nOffset
+        self.nSize        = nSize
+        self.nConnectorId = nConnectorId
+        self.requestKey   = logInfo.getRequestKey()
+        if self.requestKey == EMPTY_REQUEST:
+            self.requestKey = EMPTY_REQUEST
+        self.response     = None     # 이후 반영된 응답 (응답, 응답 시간)
+
+    @property
+    def strEVSEEvent(self):
+        return LazyLogs().load(self).strEVSEEvent
+
+    @property
+    def strCommand(self):
+        return LazyLogs().load(self).strCommand
+
+    @property
+    def connector1(self):
+        return LazyLogs().load(self).connector1
+
+    @property
+    def connector2(self):
+        return LazyLogs().load(self).connector2
+
+    @property
+    def ocppMessage(self):
+        return LazyLogs().load(self).ocppMessage
+
+    def getRequestKey(self):
+        return self.requestKey
+
+    def setResponse(self, strResponse, strTime):
+        self.response = (strResponse, strTime)
+        LazyLogs().discard(self)
+
+# 지연 생성 로그 재분석 (최근 사용한 LAZY_CACHE 개만 보관)
+class LazyLogs:
+    _instance = None
+    _lock = threading.Lock()
+    _logs = OrderedDict()
+    _analyzer = None
+
+    def __new__(cls):
+        if cls._instance == None:
+            with cls._lock:
+                if cls._instance == None:
+                    cls._instance = super(LazyLogs, cls).__new__(cls)
+        return cls._instance
+
+    def load(self, lazyInfo):
+        with self._lock:
+            logInfo = self._logs.get(lazyInfo)
+            if logInfo != None:
+                self._logs.move_to_end(lazyInfo)
+                return logInfo
+
+        logInfo = self.replay(lazyInfo)
+
+        with self._lock:
+            self._logs[lazyInfo] = logInfo
+            while len(self._logs) > LAZY_CACHE:
+                self._logs.popitem(last=False)
+
+        return logInfo
+
+    # 레코드 시작 시점 상태에서 원본 줄을 다시 분석 (원본이 바뀐 경우 시간만 있는 로그)
+    def replay(self, lazyInfo):
+        if self._analyzer == None:
+            self._analyzer = SCARAnalyzer()
+
+        logInfo = LogInfo()
+        try:
+            analyzeInfo = AnalyzeInfo()
+            analyzeInfo.connectorId = lazyInfo.nConnectorId
+            for line in lazyInfo.source.readLines(lazyInfo.nOffset, lazyInfo.nSize):
+                self._analyzer.analyzeLog(analyzeInfo, line)
+
+            if len(analyzeInfo.logs) > 0:
+                logInfo = analyzeInfo.logs[-1]
+
+        except Exception as e:
+            info(f'replay - Exception [{lazyInfo.source.file}] [{e}]')
+
+        logInfo.strDateTime = lazyInfo.strDateTime
+        logInfo.nTime       = lazyInfo.nTime
+        logInfo.strTarget   = lazyInfo.strTarget
+        if lazyInfo.response != None and logInfo.ocppMessage is not EMPTY_MESSAGE:
+            logInfo.setResponse(*lazyInfo.response)
+
+        return logInfo
+
+    def discard(self, lazyInfo):
+        with self._lock:
+            self._logs.pop(lazyInfo, None)
+
+    def clear(self):
+        with self._lock:
+            self._logs = OrderedDict()
+
+# 파일 단위 분석 (기본 상태에서 분석, 이전 파일 상태와의 연결은 stitchFile 에서 처리)
+def analyzePartial(analyzer, key, file, fileEncoding):
+    partialInfo = PartialAnalyzeInfo()
+    analyzer.analyzeFile(key, partialInfo, file)
+
+    return partialInfo, fileEncoding, Encodings().get(encodingKey(file))
+
+# 프로세스 엔진 작업 (파일 단위 결과와 매니페스트용 지문을 부모 프로세스에 전달)
+def analyzeProcess(config, name, file, fileEncoding):
+    for key, value in config.items():
+        setattr(Config(), key, value)
+
+    Encodings().set(encodingKey(file), fileEncoding)
+
+    fingerprint = None
+    if len(Config().manifestFile) > 0:
+        fingerprint = Manifest().fingerprint(file)
+
+    return fingerprint, analyzePartial(SCARAnalyzer(), name, file, fileEncoding)
+
 class SCARAnalyzer :
 
     analyzeCompleted = None
@@ -23,26 +164,41 @@ class SCARAnalyzer :
 
         self.ocppReqMsg = '================> ['
         self.ocppResMsg = '<================ ['
-        self.keyMsgs    = [ 'CORE LIB START',
-                            'ws connected',
-                            'ws disconnected',
-                            'Push Stop Button',
-                            'Emergency Button emeStatus',
-                            'VPOS -> HMI NAYAX < Vend',
-                            '"TransactionEvent",',
-                            '"RequestStartTransaction",',
-                            '"RequestStopTransaction",',
-                            '"Authorize",',
-                            '"StatusNotification",',
-                            '"NotifyEvent",',
-                            ', Plug in for id',
-                            ', Plug Out for id',
-                            'RECV MAINBOARD STATUS index',
-                            'evse prev status :',
-                            'evse aftr status :',
-                            'mbStatusProcessing',
-                            '] Sequence Name1 ['    ]
-        
+        # 키 메시지 테이블 : (마커, 처리 함수, 인자)
+        # 마커가 여러 개 포함된 경우 앞선 항목이 우선
+        self.keyMsgs    = [ ('CORE LIB START',              self.parseEvent,        'Start App'),
+                            ('ws connected',                self.parseEvent,        'WS Connected'),
+                            ('ws disconnected',             self.parseEvent,        'WS Disconnected'),
+                            ('Push Stop Button',            self.parseEvent,        'User Stop'),
+                            ('Emergency Button emeStatus',  self.parseEmergency,    None),
+                            ('VPOS -> HMI NAYAX < Vend',    self.parseNayax,        None),
+                            ('"TransactionEvent",',         self.parseTransaction,  None),
+                            ('"RequestStartTransaction",',  self.parseRequest,      ('RequestStartTransaction', parseRequestStartReq)),
+                            ('"RequestStopTransaction",',   self.parseRequest,      ('RequestStopTransaction', parseRequestStopReq)),
+                            ('"Authorize",',                self.parseRequest,      ('Authorize', parseAuthorizeReq)),
+                            ('"StatusNotification",',       self.parseNotification, None),
+                            ('"NotifyEvent",',              self.parseNotify,       None),
+                            (', Plug in for id',            self.parsePlug,         1),
+                            (', Plug Out for id',           self.parsePlug,         2),
+                            ('RECV MAINBOARD STATUS index', self.parseMainboard,    None),
+                            ('evse prev status :',          self.parseEvseStatus,   'prev'),
+                            ('evse aftr status :',          self.parseEvseStatus,   'aftr'),
+                            ('mbStatusProcessing',          self.parseCode,         None),
+                            ('] Sequence Name1 [',          self.parseSequence,     None) ]
+        self.keyMatcher = KeyMatcher([keyMsg[0] for keyMsg in self.keyMsgs])
+        # 파일 읽기 시 바이트 단위로 선별할 마커 (키 메시지 + DSP 명령)
+        self.recordPattern = compileMarkers([keyMsg[0] for keyMsg in self.keyMsgs] + ['dspmanager.cpp:'])
+
+        self.dspCommands = { 'init'               : 'Init',
+                             'CommunicationStart' : 'Comm.Start',
+                             'start'              : 'Start',
+                             'stop'               : 'Stop' }
+
+        self.ocppResParsers = { 'TransactionEvent'        : parseTransactionRes,
+                                'RequestStartTransaction' : parseRequestStartRes,
+                                'RequestStopTransaction'  : parseRequestStopRes,
+                                'Authorize'               : parseAuthorizeRes }
+
     def set_analyze_completed_callback(self, callback):
         self.analyzeCompleted = callback
 
@@ -58,6 +214,21 @@ class SCARAnalyzer :
     def requestAnalyze(self):
         self.runAnalyze = True
 
+    def setEngine(self, engine, workers=None):
+        if engine not in ANALYZE_ENGINES:
+            info(f'setEngine - Invalid Engine [{engine}]')
+            return False
+
+        Config().analyzeEngine = engine
+        if workers != None:
+            nWorkers = parseWorkers(workers)
+            if nWorkers == None:
+                # 잘못된 값은 기본값 (CPU 수) 사용
+                info(f'setEngine - Invalid Workers [{workers}]')
+                nWorkers = 0
+            Config().analyzeWorkers = nWorkers
+        return True
+
     def analyze(self):
         print('')
 
@@ -66,62 +237,231 @@ class SCARAnalyzer :
             return
 
         if Config().logPath != None and len(Config().logPath) > 0:
-            cpu_count = os.cpu_count()
-            max_workers = cpu_count * 2
+            # 이전 분석 결과 (변경되지 않은 파일은 재분석하지 않음)
+            if len(Config().manifestFile) > 0:
+                Manifest().load(cachePath(Config().manifestFile))
+
+            if Config().analyzeEngine == 'process':
+                self.analyzeProcesses()
+            else:
+                # ANALYZE_WORKERS 미지정 (0) 이면 CPU 수 x 2
+                max_workers = Config().analyzeWorkers if Config().analyzeWorkers > 0 else os.cpu_count() * 2
+
+                info(f'Path [{Config().logPath}] Thread [{max_workers}]')
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for srcName, srcFiles in LogList().srcDicts.items():
+                        executor.submit(self.analyzeSrc, srcName, srcFiles)
+
+            if len(Config().manifestFile) > 0:
+                Manifest().save(set(file for srcFiles in LogList().srcDicts.values() for file in srcFiles))
+
+    # 파일 단위 프로세스 분석 (GIL 회피), 충전기별 파일 순서대로 Analyzed 에 연결
+    def analyzeProcesses(self):
+        max_workers = Config().analyzeWorkers if Config().analyzeWorkers > 0 else os.cpu_count()
+        max_workers = max(1, min(max_workers, sum(len(files) for files in LogList().srcDicts.values())))
+
+        info(f'Path [{Config().logPath}] Process [{max_workers}]')
+
+        config = dict(vars(Config()))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures  = {}
+            partials = {}
+            stitched = {}
+            for srcName, srcFiles in LogList().srcDicts.items():
+                Analyzed().remove(srcName)
+
+                partials[srcName] = {}
+                stitched[srcName] = (self.resultInfo(srcName), 0, set())
+                for index, file in enumerate(srcFiles):
+                    if len(Config().manifestFile) > 0:
+                        partial = Manifest().get(file)
+                        if partial != None:
+                            partials[srcName][index] = partial
+                            continue
+
+                    future = executor.submit(analyzeProcess, config, srcName, file, detectEncoding(file))
+                    futures[future] = (srcName, index)
+
+            # 캐시된 파일 결과 먼저 연결
+            for srcName in LogList().srcDicts:
+                self.stitchPartials(srcName, partials, stitched)
+
+            for future in as_completed(futures):
+                srcName, index = futures[future]
+                try:
+                    fingerprint, partials[srcName][index] = future.result()
+                    if fingerprint != None:
+                        Manifest().set(LogList().srcDicts[srcName][index], fingerprint, partials[srcName][index])
+
+                except Exception as e:
+                    info(f'analyzeProcesses - Exception [{srcName}] [{e}]')
+                    partials[srcName][index] = None
+
+                self.stitchPartials(srcName, partials, stitched)
+
+    # 파일 순서대로 도착한 결과까지 연결
+    def stitchPartials(self, srcName, partials, stitched):
+        srcFiles = LogList().srcDicts[srcName]
+        analyzeInfo, partialAnalyzed, requestKeys = stitched[srcName]
+        while partialAnalyzed in partials[srcName]:
+            self.stitchFile(srcName, analyzeInfo, srcFiles[partialAnalyzed], partials[srcName].pop(partialAnalyzed), requestKeys)
+
+            partialAnalyzed += 1
+            self.publish(srcName, analyzeInfo, partialAnalyzed == len(srcFiles))
+
+        stitched[srcName] = (analyzeInfo, partialAnalyzed, requestKeys)
+
+    # 파일 단위 분석 결과를 Analyzed 에 반영 (분석 중에는 충전기별 analyzeInfo 를 잠금 없이 사용)
+    def publish(self, name, analyzeInfo, bCompleted):
+        Analyzed().set(name, analyzeInfo)
+
+        if bCompleted == True:
+            self.result(name)
+        if self.analyzeCompleted :
+            self.analyzeCompleted(name, bCompleted)
+
+    # 파일 결과 연결 (이전 파일 상태에 의존하는 경우 해당 파일만 순차 재분석)
+    def stitchFile(self, name, analyzeInfo, file, partial, requestKeys):
+        start = len(analyzeInfo.logs)
 
-            info(f'Path [{Config().logPath}] Thread [{max_workers}]')
+        if partial == None or detectEncoding(file) != partial[1]:
+            self.analyzeFile(name, analyzeInfo, file)
 
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                for srcName, srcFiles in LogList().srcDicts.items():
-                    executor.submit(self.analyzeSrc, srcName, srcFiles)
+        elif self.stitchLeading(name, analyzeInfo, file, partial[0]) == True:
+            partialInfo, fileEncoding, lastEncoding = partial
+
+            for logInfo in analyzeInfo.logs[start:]:
+                requestKeys.add((logInfo.ocppMessage.strUUID, logInfo.ocppMessage.strMessageId))
+            start = len(analyzeInfo.logs)
+
+            responses = None
+            if partialInfo.conflicts(analyzeInfo, requestKeys) == False:
+                responses = self.stitchResponses(analyzeInfo, partialInfo)
+
+            if responses == None:
+                self.analyzeFile(name, analyzeInfo, file, skipLeading=True)
+            else:
+                for uuid, index, strResponse, strTime, rawIndex, rawLog in responses:
+                    if strResponse != None:
+                        analyzeInfo.setResponse(index, strResponse, strTime)
+                    del analyzeInfo.ocppUUIDs[uuid]
+
+                partialInfo.mergeInto(analyzeInfo, [(rawIndex, rawLog) for uuid, index, strResponse, strTime, rawIndex, rawLog in responses])
+                Encodings().set(encodingKey(file), lastEncoding)
+
+        for logInfo in analyzeInfo.logs[start:]:
+            requestKeys.add((logInfo.ocppMessage.strUUID, logInfo.ocppMessage.strMessageId))
+
+        analyzeInfo.expireRequests(Config().requestExpiry)
+
+    # 첫 로그 이전 줄은 이전 파일 마지막 로그에 이어서 처리 (분석 중단 시 False)
+    def stitchLeading(self, name, analyzeInfo, file, partialInfo):
+        for log in partialInfo.leadingLines:
+            if self.analyzeLog(analyzeInfo, log) == False:
+                info(f'Src [{name}] File [{file}] Stopped')
+                return False
+
+        return True
+
+    # 이전 파일 요청에 대한 응답 확인 (반영 중 예외가 발생하는 경우 None, 재분석)
+    def stitchResponses(self, analyzeInfo, partialInfo):
+        responses = []
+        stitched  = set()
+        for uuid, rawIndex, strTime, rawLog, ocppMessage in partialInfo.responses:
+            if uuid in stitched or uuid not in analyzeInfo.ocppUUIDs:
+                continue
+            stitched.add(uuid)
+
+            key, index = analyzeInfo.findRequest(uuid)
+            strResponse = None
+            if index >= 0:
+                try:
+                    strResponse = self.makeResponse(analyzeInfo.logs[index], ocppMessage, strTime)
+                except Exception as e:
+                    return None
+
+            responses.append((uuid, index, strResponse, strTime, rawIndex, rawLog))
+
+        return responses
 
     def analyzeSrc(self, name, files):
         # info(f'Analyze - Src [{name}] Files [{len(files)}]')
         Analyzed().remove(name)
-        Analyzed().set(name, AnalyzeInfo())
+        analyzeInfo = self.resultInfo(name)
 
         partialAnalyzed = 0
+        requestKeys = set()
 
-        # info(f'analyzeSrc - Src [{name}] Logs [{len(Analyzed().get(name).logs)}] Start')
+        # info(f'analyzeSrc - Src [{name}] Logs [{len(analyzeInfo.logs)}] Start')
 
-        for file in files:
-            # 대상 파일별 로그 수집
-            # info(f'Analyze - Start :: Src [{name}] File [{file}]')
-            self.analyzeFile(name, file)
+        try:
+            for file in files:
+                # 대상 파일별 로그 수집
+                # info(f'Analyze - Start :: Src [{name}] File [{file}]')
+                if len(Config().manifestFile) > 0:
+                    self.stitchFile(name, analyzeInfo, file, self.cachedPartial(name, file), requestKeys)
+                else:
+                    self.analyzeFile(name, analyzeInfo, file)
+                    analyzeInfo.expireRequests(Config().requestExpiry)
 
-            partialAnalyzed += 1
-            if partialAnalyzed == len(files):
-                self.result(name)
-            if self.analyzeCompleted :
-                self.analyzeCompleted(name, (partialAnalyzed == len(files)))
+                partialAnalyzed += 1
+                self.publish(name, analyzeInfo, partialAnalyzed == len(files))
 
-            # info(f'Analyze - End   :: Src [{name}] Logs [{len(Analyzed().get(name).logs)}] Completed [{partialAnalyzed == len(files)}]')
+                # info(f'Analyze - End   :: Src [{name}] Logs [{len(analyzeInfo.logs)}] Completed [{partialAnalyzed == len(files)}]')
+
+        except Exception as e:
+            info(f'analyzeSrc - Exception [{name}] [{e}]')
+            if analyzeInfo.writer != None:
+                analyzeInfo.writer.abort()
+
+    # 매니페스트에 저장된 파일 결과 (없거나 변경된 경우 파일 단위로 분석하여 저장)
+    def cachedPartial(self, name, file):
+        partial = Manifest().get(file)
+        if partial == None:
+            fingerprint = Manifest().fingerprint(file)
+            partial = analyzePartial(self, f'{name}:{file}', file, detectEncoding(file))
+            Manifest().set(file, fingerprint, partial)
+
+        return partial
 
     # 로그 처리
-    def analyzeFile(self, name, file):
+    def analyzeFile(self, name, analyzeInfo, file, skipLeading=False):
         fileEncoding = None
         try:
             lineCount = 0
 
-            with open(file, 'rb') as f:
-                result = chardet.detect(f.read())
-                fileEncoding = result['encoding']
+            fileEncoding = detectEncoding(file)
+
+            # 압축되지 않은 파일은 원본 위치를 읽을 수 있으므로 지연 생성 로그로 보관
+            source = None
+            if Config().lazyEvents == True and isCompressed(file) == False:
+                source = LazySource(file, fileEncoding)
 
-            with open(file, 'r', encoding=fileEncoding) as f:
-                while True:
-                    line = f.readline()
-                    if len(line) == 0 or self.analyzeLog(name, line) == False:
-                        break
+            for lineNumber, line, span in readRecords(file, fileEncoding, self.recordPattern):
+                # 첫 로그 이전 줄은 이미 처리된 경우 (stitch)
+                if skipLeading == True:
+                    if line.find(':00][') <= 0:
+                        lineCount = lineNumber
+                        continue
+                    skipLeading = False
 
-                    lineCount += 1
+                lazySpan = None
+                if source != None and span != None:
+                    lazySpan = (source, span[0], span[1])
+
+                if self.analyzeLog(analyzeInfo, line, lazySpan) == False:
+                    break
+
+                lineCount = lineNumber
 
         except Exception as e:
             info(f'analyzeFile - Exception [{file}] [{e}]')
 
         info(f'Src [{name}] File [{file}] Encode [{fileEncoding}] Line [{lineCount}]')
 
-    # 특정 로그 확인
-    def analyzeLog(self, name, log):
+    # 특정 로그 확인 (span : 지연 생성 로그용 원본 위치 (원본, 위치, 크기))
+    def analyzeLog(self, analyzeInfo, log, span=None):
         try:
             logElements = []
 
@@ -129,19 +469,28 @@ class SCARAnalyzer :
                 return True
 
             elif log.find(':00][') <= 0:
-                if Analyzed().get(name).prevLog[LogElement.MESSAGE].find(self.ocppReqMsg) >= 0 or \
-                   Analyzed().get(name).prevLog[LogElement.MESSAGE].find(self.ocppResMsg) >= 0:
-                    Analyzed().get(name).prevLog[LogElement.MESSAGE] = '['
+                if analyzeInfo.deferLine(log) == True:
+                    return True
+
+                analyzeInfo.lazyRecord = self.extendRecord(analyzeInfo.lazyRecord, span)
 
-                Analyzed().get(name).prevLog[LogElement.MESSAGE] += log.replace('\n', '').strip()
-                logElements = Analyzed().get(name).prevLog
+                if analyzeInfo.prevLog[LogElement.MESSAGE].find(self.ocppReqMsg) >= 0 or \
+                   analyzeInfo.prevLog[LogElement.MESSAGE].find(self.ocppResMsg) >= 0:
+                    analyzeInfo.prevLog[LogElement.MESSAGE] = '['
+
+                analyzeInfo.prevLog[LogElement.MESSAGE] += log.replace('\n', '').strip()
+                logElements = analyzeInfo.prevLog
 
                 if len(log) > 2 or log[0] != ']':
                     return True
 
             else:
                 # info(f'analyzeLog - 1')
-                Analyzed().get(name).prevLog.clear()
+                analyzeInfo.prevLog = []
+                analyzeInfo.lazyRecord = None
+                if span != None:
+                    source, nOffset, nSize = span
+                    analyzeInfo.lazyRecord = (source, nOffset, nOffset + nSize, analyzeInfo.recordState())
                 # info(f'analyzeLog - 2')
 
                 tempLog = ''
@@ -168,12 +517,12 @@ class SCARAnalyzer :
 
                 # info(f'analyzeLog - 5')
 
-            Analyzed().get(name).prevLog = logElements
+            analyzeInfo.prevLog = logElements
             if len(logElements) >= int(LogElement.ORIGIN) and \
                logElements[LogElement.MESSAGE].find(self.ocppReqMsg) < 0 and \
                logElements[LogElement.MESSAGE].find(self.ocppResMsg) < 0 and \
                logElements[LogElement.ORIGIN].find('[OFFLINE]') < 0:
-                if self.analyzeMsg(name, logElements) == False:
+                if self.analyzeMsg(analyzeInfo, logElements, span) == False:
                     return False
 
         except Exception as e:
@@ -182,278 +531,66 @@ class SCARAnalyzer :
 
         return True
 
-    def analyzeMsg(self, name, logElements):
+    def analyzeMsg(self, analyzeInfo, logElements, span=None):
         logInfo = LogInfo()
         message = logElements[LogElement.MESSAGE]
 
-        Analyzed().get(name).matched = 0
-        for index, key in enumerate(self.keyMsgs):
-            if message.find(key) >= 0:
-                logInfo.strDateTime = logElements[LogElement.TIME]
-                Analyzed().get(name).matched = 1
-
-                try:
-                    if key == 'CORE LIB START':
-                        logInfo.strEVSEEvent = 'Start App'
-
-                    elif key == 'ws connected':
-                        logInfo.strEVSEEvent = 'WS Connected'
+        analyzeInfo.matched = 0
+        index = self.keyMatcher.match(message)
+        if index >= 0:
+            key, parser, arg = self.keyMsgs[index]
+            logInfo.strDateTime = logElements[LogElement.TIME]
+            logInfo.nTime       = parseTime(logInfo.strDateTime)
+            analyzeInfo.matched = 1
 
-                    elif key == 'ws disconnected':
-                        logInfo.strEVSEEvent = 'WS Disconnected'
+            try:
+                if parser(analyzeInfo, logInfo, message, arg) == False:
+                    return True
 
-                    elif key == 'Push Stop Button':
-                        logInfo.strEVSEEvent = 'User Stop'
-
-                    elif key == 'Emergency Button emeStatus':
-                        currentStatus = parse('{etc}Emergency Button emeStatus {emergencyStatus}', message)
-                        if currentStatus['emergencyStatus'] == '1':
-                            logInfo.strEVSEEvent = f'Emergency On'
-                        elif currentStatus['emergencyStatus'] == '0':
-                            logInfo.strEVSEEvent = f'Emergency Off'
+            except Exception as e:
+                info(f'analyzeMsg #1 - Exception [{e}] [{message}]')
+                return False
 
-                        if Analyzed().get(name).prevEmergency == logInfo.strEVSEEvent:
-                            Analyzed().get(name).matched = 0
-                        else:
-                            Analyzed().get(name).prevEmergency = logInfo.strEVSEEvent
-
-                    elif key == 'VPOS -> HMI NAYAX < Vend':
-                        currentStatus = parse('VPOS -> HMI NAYAX < Vend {paymentStatus}', message)
-                        logInfo.strEVSEEvent = f"Nayax {currentStatus['paymentStatus']}"
-
-                    elif key == '"TransactionEvent",':
-                        uuid, transactionEvent = parseJson(message)
-                        if len(uuid) <= 0:
-                            return True
-
-                        ocppMessage = parseTransactionReq(transactionEvent)
-                        ocppMessage.strMessageId = 'TransactionEvent'
-                        ocppMessage.strUUID = uuid
-
-                        logInfo.ocppMessage = ocppMessage
-
-                        if ocppMessage.strEventType == 'Updated' and ocppMessage.strTriggerReason == 'MeterValuePeriodic':
-                            return True
-
-                        Analyzed().get(name).ocppUUIDs[uuid] = 'TransactionEvent'
-
-                    elif key == '"RequestStartTransaction",':
-                        uuid, requestStartTransaction = parseJson(message)
-                        if len(uuid) <= 0:
-                            return True
-
-                        Analyzed().get(name).ocppUUIDs[uuid] = 'RequestStartTransaction'
-                        ocppMessage = parseRequestStartReq(requestStartTransaction)
-                        ocppMessage.strMessageId = 'RequestStartTransaction'
-                        ocppMessage.strUUID = uuid
-
-                        logInfo.ocppMessage = ocppMessage
-
-                    elif key == '"RequestStopTransaction",':
-                        uuid, requestStopTransaction = parseJson(message)
-                        if len(uuid) <= 0:
-                            return True
-
-                        Analyzed().get(name).ocppUUIDs[uuid] = 'RequestStopTransaction'
-                        ocppMessage = parseRequestStopReq(requestStopTransaction)
-                        ocppMessage.strMessageId = 'RequestStopTransaction'
-                        ocppMessage.strUUID = uuid
-
-                        logInfo.ocppMessage = ocppMessage
-
-                    elif key == '"Authorize",':
-                        uuid, authorize = parseJson(message)
-                        if len(uuid) <= 0:
-                            return True
-
-                        Analyzed().get(name).ocppUUIDs[uuid] = 'Authorize'
-                        ocppMessage = parseAuthorizeReq(authorize)
-                        ocppMessage.strMessageId = 'Authorize'
-                        ocppMessage.strUUID = uuid
-
-                        logInfo.ocppMessage = ocppMessage
-
-                    elif key == '"StatusNotification",':
-                        uuid, notification = parseJson(message)
-                        if len(uuid) <= 0:
-                            return True
-
-                        ocppMessage = parseNotificationReq(notification)
-                        connectorInfo = ConnectorInfo()
-                        connectorInfo.strNotification = ocppMessage.strEventType
-                        if ocppMessage.strConnectorId == '1':
-                            logInfo.connector1 = connectorInfo
-                        elif ocppMessage.strConnectorId == '2':
-                            logInfo.connector2 = connectorInfo
-
-                    elif key == '"NotifyEvent",':
-                        uuid, notify = parseJson(message)
-                        if len(uuid) <= 0:
-                            return True
-
-                        ocppMessage = parseNotifyReq(notify)
-                        ocppMessage.strMessageId = 'NotifyEvent'
-                        ocppMessage.strUUID = uuid
-
-                        logInfo.ocppMessage = ocppMessage
-
-                    elif key == ', Plug in for id':
-                        connectorStatus = parse('{etc}Plug in for id {connectorId}', message)
-                        connectorInfo = ConnectorInfo()
-                        connectorInfo.nConnection = 1
-
-                        if int(connectorStatus['connectorId']) == 1:
-                            logInfo.connector1 = connectorInfo
-                        else:
-                            logInfo.connector2 = connectorInfo
-
-                    elif key == ', Plug Out for id':
-                        connectorStatus = parse('{etc}Plug Out for id {connectorId}', message)
-                        connectorInfo = ConnectorInfo()
-                        connectorInfo.nConnection = 2
-
-                        if int(connectorStatus['connectorId']) == 1:
-                            logInfo.connector1 = connectorInfo
-                        else:
-                            logInfo.connector2 = connectorInfo
-
-                    elif key == 'RECV MAINBOARD STATUS index':
-                        evseStatus = parse('{etc1}RECV MAINBOARD STATUS index ({mainboardIndex}) connectorId({connectorId}){etc2}', message)
-                        Analyzed().get(name).connectorId = int(evseStatus['connectorId'])
-                        Analyzed().get(name).matched = 2
-
-                    elif key == 'evse prev status :' and Analyzed().get(name).connectorId != 0:
-                        evseStatus = parse('evse prev status : {connectorStatus}', message)
-                        if Analyzed().get(name).connectorId != 0:
-                            connectorInfo = ConnectorInfo()
-                            connectorInfo.strPreviousStatus = evseStatus['connectorStatus']
-
-                            if Analyzed().get(name).connectorId == 1:
-                                logInfo.connector1 = connectorInfo
-                            else:
-                                logInfo.connector2 = connectorInfo
-
-                    elif key == 'evse aftr status :' and Analyzed().get(name).connectorId != 0:
-                        evseStatus = parse('evse aftr status : {connectorStatus}', message)
-                        if Analyzed().get(name).connectorId != 0:
-                            connectorInfo = ConnectorInfo()
-                            connectorInfo.strCurrentStatus = evseStatus['connectorStatus']
-
-                            if Analyzed().get(name).connectorId == 1:
-                                logInfo.connector1 = connectorInfo
-                            else:
-                                logInfo.connector2 = connectorInfo
-                            Analyzed().get(name).connectorId = 0
-
-                    elif key == 'mbStatusProcessing':
-                        currentConnector = {}
-                        if message.find('connectorId : [') > 0:
-                            currentConnector = parse('{etc1}connectorId : [{connectorId}]{etc2}', message)
-                        elif message.find('connectorId [') > 0:
-                            currentConnector = parse('{etc1}connectorId [{connectorId}]{etc2}', message)
-
-                        if currentConnector:
-                            Analyzed().get(name).connectorId = int(currentConnector['connectorId'])
-
-                        currentCode = parse('{etc1}errorCode [{fault}] errorCodePLC [{faultPLC}] finishCode [{finish}]{etc2}', message)
-                        if currentCode != None and Analyzed().get(name).connectorId != 0:
-                            connectorInfo = ConnectorInfo()
-                            connectorInfo.strCodeFinish   = currentCode['finish']
-                            connectorInfo.strCodeError    = currentCode['fault']
-                            connectorInfo.strCodeErrorPLC = currentCode['faultPLC']
-
-                            if Analyzed().get(name).connectorId == 1:
-                                logInfo.connector1 = connectorInfo
-                            else:
-                                logInfo.connector2 = connectorInfo
-
-                            # info(f'Log [{len(Analyzed().get(name).logs)}] - ConnectorId [{Analyzed().get(name).connectorId}] Finish [{connectorInfo.strCodeFinish}] Error [{connectorInfo.strCodeError}] PLC [{connectorInfo.strCodeErrorPLC}]')
-                            Analyzed().get(name).connectorId = 0
-                        else:
-                            return True
-
-                    elif key == '] Sequence Name1 [':
-                        sequenceName = parse('{etc}ConnectorId [{connectorId}] Sequence Name1 [{sBit1}] [{sInt1}] Sequence Name2 [{sBit2}] [{sInt2}]', message)
-                        if sequenceName is not None:
-                            connectorInfo = ConnectorInfo()
-
-                            connectorInfo.strSequenceName1 = sequenceName['sBit1']
-                            connectorInfo.strSequenceName2 = sequenceName['sBit2']
-
-                            if sequenceName['connectorId'] == '1':
-                                logInfo.connector1 = connectorInfo
-                            else:
-                                logInfo.connector2 = connectorInfo
+        if analyzeInfo.matched == 0 and message in self.dspCommands and logElements[LogElement.ORIGIN].find('dspmanager.cpp:') >= 0:
+            logInfo.strDateTime = logElements[LogElement.TIME]
+            logInfo.nTime       = parseTime(logInfo.strDateTime)
+            logInfo.strCommand = self.dspCommands[message]
+            analyzeInfo.matched = 1
 
-                except Exception as e:
-                    info(f'analyzeMsg #1 - Exception [{e}] [{message}]')
-                    return False
+        if analyzeInfo.matched == 0:
+            if message.find('"NotifyReport"') > 0:
+                return True
 
-                break
-
-        if Analyzed().get(name).matched == 0 and logElements[LogElement.ORIGIN].find('dspmanager.cpp:') >= 0:
-            if message == 'init' or message == 'CommunicationStart' or message == 'start' or message == 'stop':
-                logInfo.strDateTime = logElements[LogElement.TIME]
-                if message == 'init':
-                    logInfo.strCommand = 'Init'
-                elif message == 'CommunicationStart':
-                    logInfo.strCommand = 'Comm.Start'
-                elif message == 'start':
-                    logInfo.strCommand = 'Start'
-                elif message == 'stop':
-                    logInfo.strCommand = 'Stop'
-                Analyzed().get(name).matched = 1
-
-        if Analyzed().get(name).matched == 0:
-            if message.find('"NotifyReport"') > 0 or isJson(message) == False:
+            frame = decodeFrame(message, res=True, bStrict=True)
+            if frame == None:
                 return True
 
             try:
-                uuid, ocppMessage = parseJson(message, res=True)
+                uuid, ocppMessage = frame.strUUID, frame.payload
                 if len(uuid) > 0:
-                    for key, value in Analyzed().get(name).ocppUUIDs.items():
-                        if uuid.find(key) >= 0:
-                            for index, logInfo in enumerate(Analyzed().get(name).logs):
-                                if type(logInfo) == LogInfo and logInfo.ocppMessage.strUUID == uuid and logInfo.ocppMessage.strMessageId == value:
-                                    msgId = Analyzed().get(name).logs[index].ocppMessage.strMessageId
-
-                                    prevLogInfo = None
-                                    prevLogInfo = copy.deepcopy(Analyzed().get(name).logs[index])
-
-                                    if prevLogInfo != None:
-                                        shortTime = parse('{date} {time}-{zone}', logElements[LogElement.TIME])
-
-                                        if msgId == 'TransactionEvent':
-                                            prevLogInfo.ocppMessage.strResponse = f"{shortTime['time']} {parseTransactionRes(ocppMessage).strResponse}"
-                                        elif msgId == 'RequestStartTransaction':
-                                            prevLogInfo.ocppMessage.strResponse = f"{shortTime['time']} {parseRequestStartRes(ocppMessage).strResponse}"
-                                        elif msgId == 'RequestStopTransaction':
-                                            prevLogInfo.ocppMessage.strResponse = f"{shortTime['time']} {parseRequestStopRes(ocppMessage).strResponse}"
-                                        elif msgId == 'Authorize':
-                                            prevLogInfo.ocppMessage.strResponse = f"{shortTime['time']} {parseAuthorizeRes(ocppMessage).strResponse}"
-
-                                        if len(prevLogInfo.ocppMessage.strResponse) > 0:
-                                            prevLogInfo.ocppMessage.strResponseTime = logElements[LogElement.TIME]
-                                        if len(prevLogInfo.ocppMessage.strResponse) > 0:
-                                            Analyzed().setLogs(name, index, prevLogInfo)
-
-                                    break
-
-                            Analyzed().get(name).matched = 2
-                            del Analyzed().get(name).ocppUUIDs[uuid]
-                            break
+                    key, index = analyzeInfo.findRequest(uuid)
+                    if key != None:
+                        if index >= 0:
+                            strResponse = self.makeResponse(analyzeInfo.logs[index], ocppMessage, logElements[LogElement.TIME])
+                            if strResponse != None:
+                                analyzeInfo.setResponse(index, strResponse, logElements[LogElement.TIME])
+
+                        analyzeInfo.matched = 2
+                        del analyzeInfo.ocppUUIDs[uuid]
+                    else:
+                        analyzeInfo.deferResponse(uuid, logElements, ocppMessage)
 
             except Exception as e:
                 info(f'analyzeMsg #2 - Exception [{e}] [{message}]')
                 return False
 
-        if Analyzed().get(name).matched != 0:
+        if analyzeInfo.matched != 0:
             try:
-                if Analyzed().get(name).matched == 1:
-                    Analyzed().append(name, logInfo)
+                if analyzeInfo.matched == 1:
+                    analyzeInfo.addLog(self.lazyLog(analyzeInfo, logInfo, span))
 
                 rawLog = f'[{logElements[LogElement.TIME]}] {logElements[LogElement.MESSAGE]}'
-                Analyzed().append(name, rawLog)
+                analyzeInfo.addRaw(rawLog)
 
             except Exception as e:
                 info(f'analyzeMsg #3 - Exception [{e}] [{message}]')
@@ -461,19 +598,221 @@ class SCARAnalyzer :
 
         return True
 
-    def result(self, name):
-        logFile = ''
-        if len(name) > 0:
-            logFile = f'{name}{Config().dstFile}'
+    # 레코드에 바로 이어지는 줄이면 범위 확장 (사이에 건너뛴 줄이 있으면 지연 생성하지 않음)
+    def extendRecord(self, lazyRecord, span):
+        if lazyRecord == None or span == None:
+            return None
+
+        source, nOffset, nSize = span
+        if lazyRecord[0] is not source or lazyRecord[2] != nOffset:
+            return None
+
+        return (source, lazyRecord[1], nOffset + nSize, lazyRecord[3])
+
+    # 현재 레코드 범위를 알면 지연 생성 로그로 변환
+    def lazyLog(self, analyzeInfo, logInfo, span):
+        lazyRecord = analyzeInfo.lazyRecord
+        if span == None or lazyRecord == None or lazyRecord[0] is not span[0]:
+            return logInfo
+
+        source, nStart, nEnd, nConnectorId = lazyRecord
+        return LazyLogInfo(logInfo, source, nStart, nEnd - nStart, nConnectorId)
+
+    # 요청 로그에 반영할 응답 (없으면 None)
+    def makeResponse(self, logInfo, ocppMessage, strTime):
+        msgId = logInfo.ocppMessage.strMessageId
+
+        strResponse = logInfo.ocppMessage.strResponse
+        shortTime = extract('ShortTime', strTime)
+
+        if msgId in self.ocppResParsers:
+            strResponse = f"{shortTime['time']} {self.ocppResParsers[msgId](ocppMessage).strResponse}"
+
+        if len(strResponse) <= 0:
+            return None
+
+        return strResponse
+
+    def parseEvent(self, analyzeInfo, logInfo, message, event):
+        logInfo.strEVSEEvent = event
+        return True
+
+    def parseEmergency(self, analyzeInfo, logInfo, message, arg):
+        currentStatus = extract('Emergency', message)
+        if currentStatus['emergencyStatus'] == '1':
+            logInfo.strEVSEEvent = f'Emergency On'
+        elif currentStatus['emergencyStatus'] == '0':
+            logInfo.strEVSEEvent = f'Emergency Off'
+
+        if analyzeInfo.changeEmergency(logInfo.strEVSEEvent) == False:
+            analyzeInfo.matched = 0
+        return True
+
+    def parseNayax(self, analyzeInfo, logInfo, message, arg):
+        currentStatus = extract('Nayax', message)
+        logInfo.strEVSEEvent = internStr(f"Nayax {currentStatus['paymentStatus']}")
+        return True
+
+    def parseTransaction(self, analyzeInfo, logInfo, message, arg):
+        frame = decodeFrame(message, skip=SKIP_METER_VALUE_PERIODIC)
+        if frame == None or frame.bSkipped == True or len(frame.strUUID) <= 0:
+            return False
+
+        uuid = frame.strUUID
+        ocppMessage = parseTransactionReq(frame.payload)
+        ocppMessage.strMessageId = 'TransactionEvent'
+        ocppMessage.strUUID = uuid
+
+        logInfo.ocppMessage = ocppMessage
+
+        if ocppMessage.strEventType == 'Updated' and ocppMessage.strTriggerReason == 'MeterValuePeriodic':
+            return False
+
+        analyzeInfo.addRequest(uuid, 'TransactionEvent', logInfo.nTime)
+        return True
+
+    def parseRequest(self, analyzeInfo, logInfo, message, arg):
+        messageId, requestParser = arg
+
+        uuid, request = parseJson(message)
+        if len(uuid) <= 0:
+            return False
+
+        analyzeInfo.addRequest(uuid, messageId, logInfo.nTime)
+        ocppMessage = requestParser(request)
+        ocppMessage.strMessageId = messageId
+        ocppMessage.strUUID = uuid
+
+        logInfo.ocppMessage = ocppMessage
+        return True
+
+    def parseNotification(self, analyzeInfo, logInfo, message, arg):
+        uuid, notification = parseJson(message)
+        if len(uuid) <= 0:
+            return False
+
+        ocppMessage = parseNotificationReq(notification)
+        connectorInfo = ConnectorInfo()
+        connectorInfo.strNotification = ocppMessage.strEventType
+        if ocppMessage.strConnectorId == '1':
+            logInfo.connector1 = connectorInfo
+        elif ocppMessage.strConnectorId == '2':
+            logInfo.connector2 = connectorInfo
+        return True
+
+    def parseNotify(self, analyzeInfo, logInfo, message, arg):
+        uuid, notify = parseJson(message)
+        if len(uuid) <= 0:
+            return False
+
+        ocppMessage = parseNotifyReq(notify)
+        ocppMessage.strMessageId = 'NotifyEvent'
+        ocppMessage.strUUID = uuid
+
+        logInfo.ocppMessage = ocppMessage
+        return True
+
+    def parsePlug(self, analyzeInfo, logInfo, message, connection):
+        if connection == 1:
+            connectorStatus = extract('PlugIn', message)
+        else:
+            connectorStatus = extract('PlugOut', message)
+        connectorInfo = ConnectorInfo()
+        connectorInfo.nConnection = connection
+
+        if int(connectorStatus['connectorId']) == 1:
+            logInfo.connector1 = connectorInfo
         else:
-            logFile = f'analyze{Config().dstFile}'
+            logInfo.connector2 = connectorInfo
+        return True
 
-        logResult = os.path.join(Config().logPath, logFile)
-        # info(f'result - file [{logFile}] len [{len(Analyzed().get(name).rawLogs)}] result [{logResult}]')
+    def parseMainboard(self, analyzeInfo, logInfo, message, arg):
+        evseStatus = extract('Mainboard', message)
+        analyzeInfo.connectorId = int(evseStatus['connectorId'])
+        analyzeInfo.matched = 2
+        return True
 
-        with open(logResult, 'w') as f:
-            for rawLog in Analyzed().get(name).rawLogs:
-                f.write(rawLog + '\n')
+    def parseEvseStatus(self, analyzeInfo, logInfo, message, status):
+        if analyzeInfo.connectorId == 0:
+            return True
+
+        connectorInfo = ConnectorInfo()
+        if status == 'prev':
+            evseStatus = extract('EvsePrev', message)
+            connectorInfo.strPreviousStatus = internStr(evseStatus['connectorStatus'])
+        else:
+            evseStatus = extract('EvseAftr', message)
+            connectorInfo.strCurrentStatus = internStr(evseStatus['connectorStatus'])
+
+        if analyzeInfo.connectorId == 1:
+            logInfo.connector1 = connectorInfo
+        else:
+            logInfo.connector2 = connectorInfo
+
+        if status == 'aftr':
+            analyzeInfo.connectorId = 0
+        return True
+
+    def parseCode(self, analyzeInfo, logInfo, message, arg):
+        currentConnector = {}
+        if message.find('connectorId : [') > 0:
+            currentConnector = extract('ConnectorIdColon', message)
+        elif message.find('connectorId [') > 0:
+            currentConnector = extract('ConnectorId', message)
+
+        if currentConnector:
+            analyzeInfo.connectorId = int(currentConnector['connectorId'])
+
+        currentCode = extract('Code', message)
+        if currentCode == None or analyzeInfo.connectorId == 0:
+            return False
+
+        connectorInfo = ConnectorInfo()
+        connectorInfo.strCodeFinish   = internStr(currentCode['finish'])
+        connectorInfo.strCodeError    = internStr(currentCode['fault'])
+        connectorInfo.strCodeErrorPLC = internStr(currentCode['faultPLC'])
+
+        if analyzeInfo.connectorId == 1:
+            logInfo.connector1 = connectorInfo
+        else:
+            logInfo.connector2 = connectorInfo
+
+        analyzeInfo.connectorId = 0
+        return True
+
+    def parseSequence(self, analyzeInfo, logInfo, message, arg):
+        sequenceName = extract('Sequence', message)
+        if sequenceName is not None:
+            connectorInfo = ConnectorInfo()
+
+            connectorInfo.strSequenceName1 = internStr(sequenceName['sBit1'])
+            connectorInfo.strSequenceName2 = internStr(sequenceName['sBit2'])
+
+            if sequenceName['connectorId'] == '1':
+                logInfo.connector1 = connectorInfo
+            else:
+                logInfo.connector2 = connectorInfo
+        return True
+
+    # 결과 로그를 분석 중 기록하는 충전기 분석 정보
+    def resultInfo(self, name):
+        analyzeInfo = AnalyzeInfo()
+        analyzeInfo.stream(ResultWriter(resultPath(name), resultCompress()), Config().resultPreview)
+        return analyzeInfo
+
+    def result(self, name):
+        logResult = resultPath(name)
+        analyzeInfo = Analyzed().get(name)
+        # info(f'result - file [{logResult}] len [{len(analyzeInfo.rawLogs)}]')
+
+        if analyzeInfo.writer != None:
+            analyzeInfo.finish()
+            return logResult
+
+        writer = ResultWriter(logResult, resultCompress())
+        for rawLog in analyzeInfo.rawLogs:
+            writer.write(rawLog)
+        writer.close()
 
         return logResult
 
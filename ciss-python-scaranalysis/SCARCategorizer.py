@@ -1,10 +1,19 @@
-import copy
 import os
+import shutil
+import tempfile
 
 from SCARCommon import *
+from SCARExporter import isExportFormat, makeExporter
+from SCARReader import fileHash
+from SCARSummarizer import SCARSummarizer
+from SCARWriter import SheetWriter, StyleCache, streamWorkbook
 
-from openpyxl import load_workbook, Workbook, styles, utils
-from parse import *
+from openpyxl import load_workbook, utils
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+SHARD_SHEET      = 'Shards'     # 충전기별 상세 파일 목록 시트 (DETAIL_SHARD)
+SNAPSHOT_VERSION = 2            # 스냅샷 행 형식이 바뀌면 증가 (이전 스냅샷 무시)
 
 def info(log):
     if log[:1] == '\n':
@@ -13,6 +22,74 @@ def info(log):
 
     print(f'[{now()}] [SCARCategorizer] {log}')
 
+# 충전기별 상세 파일 작성 (프로세스 엔진 작업, 로그 위치별 대상 셀을 부모 프로세스에 전달)
+def categorizeProcess(config, srcName, logInfos):
+    for key, value in config.items():
+        setattr(Config(), key, value)
+
+    return SCARCategorizer().makeShard(srcName, logInfos)
+
+# 상세 파일 스냅샷 경로 (DetailResult.xlsx -> DetailResult.snapshot.jsonl)
+def snapshotPath(path):
+    return f'{os.path.splitext(path)[0]}.snapshot.jsonl'
+
+# 상세 파일과 내용 해시가 같은 스냅샷의 (충전기, 행 값 목록), 없거나 상세 파일이 바뀐 경우 None
+#   1행 : { 'version', 'hash' }, 이후 시트마다 { 'sheet' : 충전기 } 다음에 행 값 배열
+def readSnapshot(path):
+    try:
+        with open(snapshotPath(path), encoding='utf-8') as f:
+            header = loadJson(f.readline())
+            if type(header) != dict or header.get('version') != SNAPSHOT_VERSION or header.get('hash') != fileHash(path):
+                return None
+
+            sheets = []
+            for line in f:
+                values = loadJson(line)
+                if type(values) == dict:
+                    sheets.append((str(values['sheet']), []))
+                elif type(values) == list and len(sheets) > 0:
+                    sheets[-1][1].append(values)
+                else:
+                    raise ValueError('invalid row')
+
+        return sheets
+
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        info(f'readSnapshot - Exception [{snapshotPath(path)}] [{e}]')
+        return None
+
+# 상세 시트에 기록한 행 값 (빈 값은 None) 을 임시 파일에 JSON 줄로 모았다가
+# 상세 파일 저장 후 상세 파일 내용 해시와 함께 스냅샷으로 기록
+class DetailSnapshot :
+
+    def __init__(self):
+        self.spool = tempfile.TemporaryFile('w+', encoding='utf-8')
+
+    def addSheet(self, srcName):
+        self.spool.write(dumpJson({ 'sheet' : srcName }) + '\n')
+
+    def write(self, values):
+        self.spool.write(dumpJson([value if value != None and len(str(value)) > 0 else None for value in values]) + '\n')
+
+    def save(self, path):
+        try:
+            with open(f'{snapshotPath(path)}.tmp', 'w', encoding='utf-8') as f:
+                f.write(dumpJson({ 'version' : SNAPSHOT_VERSION, 'hash' : fileHash(path) }) + '\n')
+                self.spool.seek(0)
+                shutil.copyfileobj(self.spool, f)
+            os.replace(f'{snapshotPath(path)}.tmp', snapshotPath(path))
+
+        except Exception as e:
+            info(f'DetailSnapshot - Save Exception [{snapshotPath(path)}] [{e}]')
+
+        finally:
+            self.close()
+
+    def close(self):
+        self.spool.close()
+
 class SCARCategorizer :
 
     categorizeCompleted = None
@@ -24,17 +101,16 @@ class SCARCategorizer :
 
         self.workbook     = None
         self.worksheet    = None
-        self.cellColor    = None
-        self.fontColor    = None
+        self.writer       = None
+        self.styleCache   = None
+        self.snapshot     = None
+        self.badColumns   = []
 
         self.detailColumn = ['DateTime', 'EVSE Event', 'Command', 'SequenceName1', 'SequenceName2',
                             'Connection', 'Status', 'Noti', 'Finish', 'Error', 'ErrorPLC',
                             'Connection', 'Status', 'Noti', 'Finish', 'Error', 'ErrorPLC',
                             'MessageId', 'Response', 'UUID', 'ConnectorId', 'EventType', 'ChargingState', 'TriggerReason', 'StoppedReason', 'TransactionId', 'IdTag', 'MeterValue', 'SoC']
 
-        self.borderThin = styles.Side(border_style='thin', color='000000')
-        self.borderThick = styles.Side(border_style='thick', color='000000')
-
     def run(self):
         while True:
             if self.runSave == True:
@@ -52,34 +128,56 @@ class SCARCategorizer :
     def loadCategorize(self):
         self.runLoad = True
 
+    # 상세 워크북 작성, 완료 여부 반환
     def makeWorkbook(self):
         print('')
 
-        if os.path.exists(Config().detailPath) == False:
-            self.workbook = Workbook()
+        if os.path.isdir(Config().detailPath) == True:
+            info(f'Invalid File State [{Config().detailPath}]')
+            return False
+
+        # 데이터만 필요한 경우 엑셀 대신 열 형식 파일로 내보내기
+        if Config().detailExport != 'xlsx':
+            try:
+                self.exportDetail()
+                if self.categorizeCompleted :
+                    self.categorizeCompleted(True)
+                return True
+            except Exception as e:
+                info(f'makeWorkbook - Export Error [{e}]')
+                if self.categorizeCompleted :
+                    self.categorizeCompleted(False)
+                return False
+
+        # 매번 새 워크북을 스트리밍으로 작성
+        self.workbook = streamWorkbook()
+        self.styleCache = StyleCache(self.workbook)
+        self.snapshot = DetailSnapshot() if Config().detailShard == False else None
+
+        # Summary Sheet 는 첫 시트로 먼저 만들고 상세 시트의 대상 셀이 정해진 뒤 채움 (SUMMARY_SPLIT 이면 Summarizer 가 별도 파일로 작성)
+        summaryWriter = None
+        if Config().summarySplit == False:
+            summaryWriter = SheetWriter(self.workbook, 'Summary', self.styleCache)
+
+        # Detail Sheet (충전기별 파일로 나누는 경우 색인 시트만 작성)
+        if Config().detailShard == True:
+            bDetail = self.makeShards()
         else:
-            if os.path.isdir(Config().detailPath) == False:
-                self.workbook = load_workbook(Config().detailPath)
-            else:
-                info(f'Invalid File State [{Config().detailPath}]')
-                return
-
-        worksheet = None
-        for name in self.workbook.sheetnames:
-            if name == 'Sheet':
-                worksheet = self.workbook[name]
-                worksheet.title = 'Summary'
-            else:
-                self.workbook.remove(self.workbook[name])
+            bDetail = self.makeDetail()
 
-        if worksheet == None:
-            self.workbook.create_sheet('Summary')
+        bCompleted = False
+        if bDetail == True:
+            if summaryWriter != None:
+                SCARSummarizer().writeSummary(summaryWriter)
 
-        # Detail Sheet
-        if self.makeDetail() == True:
             # Completed
             try:
                 self.workbook.save(Config().detailPath)
+                if self.snapshot != None:
+                    self.snapshot.save(Config().detailPath)
+                if summaryWriter != None:
+                    Analyzed().setSummarized(Config().detailPath)
+                bCompleted = True
                 if self.categorizeCompleted :
                     self.categorizeCompleted(True)
             except PermissionError:
@@ -87,265 +185,402 @@ class SCARCategorizer :
                 if self.categorizeCompleted :
                     self.categorizeCompleted(False)
 
+        if self.snapshot != None:
+            self.snapshot.close()
+
+        self.writer = None
+        self.styleCache = None
+        self.snapshot = None
+        self.workbook = None
+
+        return bCompleted
+
     def makeDetail(self):
         for srcName, logInfos in Analyzed().getLogs():
             info(f'makeDetail [{srcName}] [{len(logInfos)}]')
 
-            self.fontColor = None
-            worksheet = None
-            for name in self.workbook.sheetnames:
-                if name == 'Sheet':
-                    worksheet = self.workbook[name]
-                    worksheet.title = srcName
-                    break
-                elif name == srcName:
-                    self.workbook.remove(self.workbook[srcName])
-                    self.workbook.create_sheet(srcName)
-                    worksheet = self.workbook[srcName]
-                    break
-
-            if worksheet == None:
-                self.workbook.create_sheet(srcName)
+            self.setTargets(srcName, logInfos, self.writeDetail(srcName, logInfos))
 
-            try:
-                self.workbook.save(Config().detailPath)
-            except PermissionError:
-                info('makeWorkbook - PermissionError')
-                if self.categorizeCompleted : 
-                    self.categorizeCompleted(False)
-                return False
+        return True
+
+    # 충전기별 상세 파일을 프로세스에서 동시에 작성 (큰 충전기부터 시작)
+    def makeShards(self):
+        srcLogs = sorted(Analyzed().getLogs(), key=lambda srcLog: len(srcLog[1]), reverse=True)
+
+        max_workers = Config().detailWorkers if Config().detailWorkers > 0 else os.cpu_count()
+        max_workers = max(1, min(max_workers, len(srcLogs)))
+
+        info(f'makeShards [{len(srcLogs)}] Process [{max_workers}]')
+
+        bCompleted = True
+        config = dict(vars(Config()))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for srcName, logInfos in srcLogs:
+                future = executor.submit(categorizeProcess, config, srcName, logInfos)
+                futures[future] = (srcName, logInfos)
 
-            self.worksheet = self.workbook[srcName]
-
-            self.worksheet.cell(2, 5).border = styles.Border(right=self.borderThin)
-            self.worksheet.merge_cells(start_row=2, start_column=6, end_row=2, end_column=11)
-            self.setWorkcell(2, 6, f'Connector #1', color='D8D8D8')
-
-            self.worksheet.cell(2, 11).border = styles.Border(right=self.borderThin)
-            self.worksheet.merge_cells(start_row=2, start_column=12, end_row=2, end_column=17)
-            self.setWorkcell(2, 12, f'Connector #2', color='D8D8D8')
-
-            self.worksheet.cell(2, 17).border = styles.Border(right=self.borderThin)
-            self.worksheet.merge_cells(start_row=2, start_column=18, end_row=2, end_column=29)
-            self.setWorkcell(2, 18, f'OCPP Message', color='D8D8D8')
-
-            index = 0
-            for column in self.detailColumn:
-                self.setWorkcell(3, 1 + index, column, color='D8D8D8')
-
-                border = None
-                if index == 4 or index == 10 or index == 16:
-                    border = self.borderThin
-                self.worksheet.cell(3, 1 + index).border = styles.Border(right=border, bottom=self.borderThick)
-
-                index += 1
-
-            index = 0
-            for logIdx, logInfo in enumerate(logInfos):
-                if type(logInfo) != LogInfo:
-                    continue
-                elif len(logInfo.connector1.strPreviousStatus) > 0 or len(logInfo.connector2.strPreviousStatus) > 0:
-                    continue
-
-                self.cellColor = None
-                if index % 2 == 1:
-                    self.cellColor = 'F2F2F2'
-
-                self.fontColor = None
-                if logInfo.ocppMessage.bOffline == True:
-                    self.fontColor = '909090'
-
-                self.setWorkcell(4 + index, 1, logInfo.strDateTime)                     # 'DateTime'
-                self.setWorkcell(4 + index, 2, logInfo.strEVSEEvent)                    # 'EVSEEvent'
-                self.setWorkcell(4 + index, 3, logInfo.strCommand)                      # 'Command'
-                self.setWorkcell(4 + index, 4, logInfo.connector1.strSequenceName1 if len(logInfo.connector1.strSequenceName1) > 0 else logInfo.connector2.strSequenceName1)    # 'SequenceName1'
-                self.setWorkcell(4 + index, 5, logInfo.connector1.strSequenceName2 if len(logInfo.connector1.strSequenceName1) > 0 else logInfo.connector2.strSequenceName2)    # 'SequenceName2'
-
-                self.setWorkcell(4 + index, 6, logInfo.connector1.getConnection())      # 'Connection'
-                self.setWorkcell(4 + index, 7, logInfo.connector1.strCurrentStatus if len(logInfo.connector1.strCurrentStatus) > 0 else logInfo.connector1.strPreviousStatus)     # 'Status'
-                self.setWorkcell(4 + index, 8, logInfo.connector1.strNotification, red=logInfo.connector1.getBadStatus())  # 'Noti'
-                self.setWorkcell(4 + index, 9, logInfo.connector1.getCodeFinish())      # 'Finish'
-                self.setWorkcell(4 + index, 10, logInfo.connector1.getCodeError())      # 'Error'
-                self.setWorkcell(4 + index, 11, logInfo.connector1.getCodeErrorPLC())   # 'ErrorPLC'
-
-                self.setWorkcell(4 + index, 12, logInfo.connector2.getConnection())     # 'Connection'
-                self.setWorkcell(4 + index, 13, logInfo.connector2.strCurrentStatus if len(logInfo.connector2.strCurrentStatus) > 0 else logInfo.connector2.strPreviousStatus)    # 'Status'
-                self.setWorkcell(4 + index, 14, logInfo.connector2.strNotification, red=logInfo.connector2.getBadStatus()) # 'Noti'
-                self.setWorkcell(4 + index, 15, logInfo.connector2.getCodeFinish())     # 'Finish'
-                self.setWorkcell(4 + index, 16, logInfo.connector2.getCodeError())      # 'Error'
-                self.setWorkcell(4 + index, 17, logInfo.connector2.getCodeErrorPLC())   # 'ErrorPLC'
-
-                self.setWorkcell(4 + index, 18, logInfo.ocppMessage.strMessageId)       # 'MessageId'
-                self.setWorkcell(4 + index, 19, logInfo.ocppMessage.strResponse, red=logInfo.ocppMessage.getBadResponse()) # 'Response'
-                self.setWorkcell(4 + index, 20, logInfo.ocppMessage.strUUID)            # 'UUID'
-                self.setWorkcell(4 + index, 21, logInfo.ocppMessage.strConnectorId)     # 'ConnectorId'
-                self.setWorkcell(4 + index, 22, logInfo.ocppMessage.strEventType)       # 'EventType'
-                self.setWorkcell(4 + index, 23, logInfo.ocppMessage.strChargingState)   # 'ChargingState'
-                self.setWorkcell(4 + index, 24, logInfo.ocppMessage.strTriggerReason)   # 'TriggerReason'
-                self.setWorkcell(4 + index, 25, logInfo.ocppMessage.strStoppedReason)   # 'StoppedReason'
-                self.setWorkcell(4 + index, 26, logInfo.ocppMessage.strTransactionId)   # 'TransactionId'
-                self.setWorkcell(4 + index, 27, logInfo.ocppMessage.strIdTag)           # 'IdTag'
-                self.setWorkcell(4 + index, 28, logInfo.ocppMessage.strMeterValue)      # 'MeterValue'
-                self.setWorkcell(4 + index, 29, logInfo.ocppMessage.strSoC)             # 'SoC'
-
-                self.worksheet.cell(4 + index, 5).border = styles.Border(right=self.borderThin)
-                self.worksheet.cell(4 + index, 11).border = styles.Border(right=self.borderThin)
-                self.worksheet.cell(4 + index, 17).border = styles.Border(right=self.borderThin)
-
-                if logInfo.ocppMessage.strMessageId != 'TransactionEvent' or logInfo.ocppMessage.strEventType == 'Started':
-                    logInfo.strTarget = f'{utils.get_column_letter(18)}{4 + index}'
-
-                if len(logInfo.strTarget) > 0:
-                    Analyzed().setLogs(srcName, logIdx, logInfo)
-
-                index += 1
-
-            self.worksheet.freeze_panes = 'B4'
-            self.worksheet.sheet_view.zoomScale = 55
-            for column_cells in self.worksheet.columns:
-                length = max(len(str(cell.value)) * 1.1 for cell in column_cells)
-                self.worksheet.column_dimensions[column_cells[0].column_letter].width = length
+            for future in as_completed(futures):
+                srcName, logInfos = futures[future]
+                try:
+                    self.setTargets(srcName, logInfos, future.result())
+                    info(f'makeShards [{srcName}] [{len(logInfos)}]')
+
+                except PermissionError:
+                    info(f'makeShards - PermissionError [{shardPath(srcName)}]')
+                    bCompleted = False
+
+                except Exception as e:
+                    info(f'makeShards - Exception [{srcName}] [{e}]')
+                    bCompleted = False
+
+        if bCompleted == False:
+            if self.categorizeCompleted :
+                self.categorizeCompleted(False)
+            return False
+
+        # 색인 시트 : 충전기, 로그 수, 상세 파일 링크
+        self.writer = SheetWriter(self.workbook, SHARD_SHEET, self.styleCache)
+        for index, column in enumerate(['Charger', 'Logs', 'Detail']):
+            self.setWorkcell(2, 1 + index, column, style='SCAR Title')
+
+        for index, (srcName, logInfos) in enumerate(Analyzed().getLogs()):
+            fileName = os.path.basename(shardPath(srcName))
+            self.setWorkcell(3 + index, 1, srcName)
+            self.setWorkcell(3 + index, 2, len(logInfos))
+            self.setWorkcell(3 + index, 3, fileName, link=f"{fileName}#'{srcName}'!A1")
+
+        self.writer.freezePanes = 'A3'
+        self.writer.close()
 
         return True
 
+    def makeShard(self, srcName, logInfos):
+        self.workbook = streamWorkbook()
+        self.styleCache = StyleCache(self.workbook)
+        self.snapshot = DetailSnapshot()
+
+        try:
+            targets = self.writeDetail(srcName, logInfos)
+            self.workbook.save(shardPath(srcName))
+            self.snapshot.save(shardPath(srcName))
+        finally:
+            self.snapshot.close()
+
+        return targets
+
+    def setTargets(self, srcName, logInfos, targets):
+        for logIdx, strTarget in targets:
+            logInfo = logInfos[logIdx]
+            logInfo.strTarget = strTarget
+            Analyzed().setLogs(srcName, logIdx, logInfo)
+
+    # 충전기 상세 시트 작성, 요약에서 연결할 (로그 위치, 대상 셀) 목록 반환
+    def writeDetail(self, srcName, logInfos):
+        targets = []
+
+        self.writer = SheetWriter(self.workbook, srcName, self.styleCache)
+        if self.snapshot != None:
+            self.snapshot.addSheet(srcName)
+        self.writer.formats.stripeRows(4)
+
+        self.writer.setCell(2, 5, style='SCAR Cell Right')
+        self.writer.mergeCells(start_row=2, start_column=6, end_row=2, end_column=11)
+        self.setWorkcell(2, 6, f'Connector #1', style='SCAR Header')
+
+        self.writer.setCell(2, 11, style='SCAR Cell Right')
+        self.writer.mergeCells(start_row=2, start_column=12, end_row=2, end_column=17)
+        self.setWorkcell(2, 12, f'Connector #2', style='SCAR Header')
+
+        self.writer.setCell(2, 17, style='SCAR Cell Right')
+        self.writer.mergeCells(start_row=2, start_column=18, end_row=2, end_column=29)
+        self.setWorkcell(2, 18, f'OCPP Message', style='SCAR Header')
+
+        index = 0
+        for column in self.detailColumn:
+            if index == 4 or index == 10 or index == 16:
+                self.setWorkcell(3, 1 + index, column, style='SCAR Title Right')
+            else:
+                self.setWorkcell(3, 1 + index, column, style='SCAR Title')
+
+            index += 1
+
+        index = 0
+        for logIdx, logInfo in self.detailLogs(logInfos):
+            self.badColumns = []
+
+            # 빨간 글자 : 'Noti' (커넥터 1/2), 'Response'
+            bads = { 8  : logInfo.connector1.getBadStatus(),
+                     14 : logInfo.connector2.getBadStatus(),
+                     19 : logInfo.ocppMessage.getBadResponse() }
+            values = self.detailRow(logInfo)
+            if self.snapshot != None:
+                self.snapshot.write(values)
+
+            for column, value in enumerate(values, 1):
+                if column == 5 or column == 11 or column == 17:
+                    self.setWorkcell(4 + index, column, value, style='SCAR Cell Right')
+                else:
+                    self.setWorkcell(4 + index, column, value, red=bads.get(column, False))
+
+            # 오프라인 메시지는 회색 글자 (빨간 글자 셀 제외)
+            if logInfo.ocppMessage.bOffline == True:
+                self.writer.formats.formatRow(4 + index, font='909090', exclude=self.badColumns)
+
+            if logInfo.ocppMessage.strMessageId != 'TransactionEvent' or logInfo.ocppMessage.strEventType == 'Started':
+                targets.append((logIdx, f'{utils.get_column_letter(18)}{4 + index}'))
+
+            index += 1
+
+        self.writer.freezePanes = 'B4'
+        self.writer.zoomScale = 55
+        self.writer.close()
+
+        return targets
+
+    # 상세 시트에 기록할 로그 (로그 위치, 로그), 상태 변경 기록은 제외
+    def detailLogs(self, logInfos):
+        for logIdx, logInfo in enumerate(logInfos):
+            if isinstance(logInfo, LogRecord) == False:
+                continue
+            elif len(logInfo.connector1.strPreviousStatus) > 0 or len(logInfo.connector2.strPreviousStatus) > 0:
+                continue
+
+            yield logIdx, logInfo
+
+    # 상세 시트 / 내보내기 공통 행 값 (detailColumn 순서)
+    def detailRow(self, logInfo):
+        connector1  = logInfo.connector1
+        connector2  = logInfo.connector2
+        ocppMessage = logInfo.ocppMessage
+
+        return [logInfo.strDateTime,                # 'DateTime'
+                logInfo.strEVSEEvent,               # 'EVSEEvent'
+                logInfo.strCommand,                 # 'Command'
+                connector1.strSequenceName1 if len(connector1.strSequenceName1) > 0 else connector2.strSequenceName1,   # 'SequenceName1'
+                connector1.strSequenceName2 if len(connector1.strSequenceName1) > 0 else connector2.strSequenceName2,   # 'SequenceName2'
+
+                connector1.getConnection(),         # 'Connection'
+                connector1.strCurrentStatus if len(connector1.strCurrentStatus) > 0 else connector1.strPreviousStatus,  # 'Status'
+                connector1.strNotification,         # 'Noti'
+                connector1.getCodeFinish(),         # 'Finish'
+                connector1.getCodeError(),          # 'Error'
+                connector1.getCodeErrorPLC(),       # 'ErrorPLC'
+
+                connector2.getConnection(),         # 'Connection'
+                connector2.strCurrentStatus if len(connector2.strCurrentStatus) > 0 else connector2.strPreviousStatus,  # 'Status'
+                connector2.strNotification,         # 'Noti'
+                connector2.getCodeFinish(),         # 'Finish'
+                connector2.getCodeError(),          # 'Error'
+                connector2.getCodeErrorPLC(),       # 'ErrorPLC'
+
+                ocppMessage.strMessageId,           # 'MessageId'
+                ocppMessage.strResponse,            # 'Response'
+                ocppMessage.strUUID,                # 'UUID'
+                ocppMessage.strConnectorId,         # 'ConnectorId'
+                ocppMessage.strEventType,           # 'EventType'
+                ocppMessage.strChargingState,       # 'ChargingState'
+                ocppMessage.strTriggerReason,       # 'TriggerReason'
+                ocppMessage.strStoppedReason,       # 'StoppedReason'
+                ocppMessage.strTransactionId,       # 'TransactionId'
+                ocppMessage.strIdTag,               # 'IdTag'
+                ocppMessage.strMeterValue,          # 'MeterValue'
+                ocppMessage.strSoC]                 # 'SoC'
+
+    # 엑셀 대신 열 형식 파일로 상세 로그 내보내기 ('Charger' + detailColumn)
+    def exportDetail(self):
+        exporter = makeExporter(Config().detailExport, 'detail', ['Charger'] + self.detailColumn)
+        try:
+            for srcName, logInfos in Analyzed().getLogs():
+                info(f'exportDetail [{srcName}] [{len(logInfos)}]')
+
+                for logIdx, logInfo in self.detailLogs(logInfos):
+                    exporter.write([srcName] + self.detailRow(logInfo))
+
+            exporter.close()
+        except Exception:
+            exporter.abort()
+            raise
+
+    def setExport(self, format):
+        if isExportFormat(format) == False:
+            info(f'setExport - Invalid Format [{format}]')
+            return False
+
+        Config().detailExport = format
+        return True
+
     def readWorkbook(self):
         print('')
 
         if os.path.exists(Config().detailPath) == False:
             return
 
-        if os.path.isdir(Config().detailPath) == False:
-            self.workbook = load_workbook(Config().detailPath)
-        else:
+        if os.path.isdir(Config().detailPath) == True:
             info(f'Invalid File State [{Config().detailPath}]')
             return
 
         # info('readWorkbook')
 
-        self.worksheet = None
-        for name in self.workbook.sheetnames:
-            if name != 'Summary':
-                self.worksheet = self.workbook[name]
-                self.readDetail()
+        nSheets = self.readFile(Config().detailPath)
         if self.categorizeCompleted :
-            self.categorizeCompleted(self.worksheet != None)
+            self.categorizeCompleted(nSheets > 0)
+
+    # 상세 파일 읽기 (최신 스냅샷이 있으면 스냅샷에서, 없으면 엑셀을 읽기 전용으로), 읽은 시트 수 반환
+    def readFile(self, path):
+        sheets = readSnapshot(path)
+        if sheets != None:
+            info(f'readFile - Snapshot [{snapshotPath(path)}]')
+            for srcName, rows in sheets:
+                self.readDetail(srcName, rows)
+            return len(sheets)
+
+        nSheets = 0
+        workbook = load_workbook(path, read_only=True)
+        try:
+            for name in workbook.sheetnames:
+                if name == SHARD_SHEET:
+                    nSheets += self.readShards(workbook[name])
+                elif name != 'Summary':
+                    self.readDetail(name, workbook[name].iter_rows(min_row=4, max_col=len(self.detailColumn), values_only=True))
+                    nSheets += 1
+        finally:
+            workbook.close()
+
+        return nSheets
+
+    # 색인 시트에 기록된 충전기별 상세 파일 읽기
+    def readShards(self, worksheet):
+        nSheets = 0
+        for row in worksheet.iter_rows(min_row=3, max_col=1, values_only=True):
+            if len(row) <= 0 or row[0] is None:
+                break
+
+            srcName = str(row[0])
+            if os.path.isfile(shardPath(srcName)) == True:
+                nSheets += self.readFile(shardPath(srcName))
+            else:
+                info(f'readShards - No File [{shardPath(srcName)}]')
+
+        return nSheets
+
+    # 상세 시트 행 값 (detailColumn 순서) 으로 로그 복원, 충전기 단위로 모아 Analyzed 에 한 번에 반영
+    def readDetail(self, srcName, rows):
+        analyzeInfo = AnalyzeInfo()
+        nColumns = len(self.detailColumn)
 
-    def readDetail(self):
         rowIndex = 4
         strPreviousStatus = { 1:'None' , 2:'None' }
         strPreviousSequence = { 1:'' , 2:'' }
-        while True:
-            firstCell = self.worksheet.cell(row=rowIndex, column=1).value
-            if firstCell is None:
+        for row in rows:
+            if len(row) <= 0 or row[0] is None:
                 break  # 첫 번째 열이 비어 있으면 종료
 
-            rowData = [self.worksheet.cell(row=rowIndex, column=colIndex).value for colIndex in range(1, 30)]
-            if len(rowData) > 0:
-                logInfo = LogInfo()
-                logInfo.clear()
-                logInfo.strDateTime         = rowData[0] if rowData[0] != None else ''
-                logInfo.strEVSEEvent        = rowData[1] if rowData[1] != None else ''
-                logInfo.strCommand          = rowData[2] if rowData[2] != None else ''
-
-                connector = ConnectorInfo()
-                connector.clear()
-                connector.nConnection       = 1 if rowData[5] == 'On' else (2 if rowData[5] == 'Off' else 0)
-                connector.strCurrentStatus  = rowData[6] if rowData[6] != None else ''
-                connector.strNotification   = rowData[7] if rowData[7] != None else ''
-                connector.strCodeFinish     = rowData[8] if rowData[8] != None else ''
-                connector.strCodeError      = rowData[9] if rowData[9] != None else ''
-                connector.strCodeErrorPLC   = rowData[10] if rowData[10] != None else ''
-                if strPreviousStatus[1] == 'finish' or strPreviousStatus[1] == 'thankYou' or strPreviousStatus[1] == 'fault':
-                    if len(strPreviousSequence[1]) <= 0:
-                        connector.strSequenceName1  = rowData[3] if rowData[3] != None else ''
-                        connector.strSequenceName2  = rowData[4] if rowData[4] != None else ''
-                        strPreviousSequence[1] = f'{connector.strSequenceName1}{connector.strSequenceName2}'
-                else:
-                    strPreviousSequence[1] = ''
-                logInfo.connector1 = copy.deepcopy(connector)
-
-                connector.clear()
-                connector.nConnection       = 1 if rowData[11] == 'On' else (2 if rowData[11] == 'Off' else 0)
-                connector.strCurrentStatus  = rowData[12] if rowData[12] != None else ''
-                connector.strNotification   = rowData[13] if rowData[13] != None else ''
-                connector.strCodeFinish     = rowData[14] if rowData[14] != None else ''
-                connector.strCodeError      = rowData[15] if rowData[15] != None else ''
-                connector.strCodeErrorPLC   = rowData[16] if rowData[16] != None else ''
-                if strPreviousStatus[2] == 'finish' or strPreviousStatus[2] == 'thankYou' or strPreviousStatus[2] == 'fault':
-                    if len(strPreviousSequence[2]) <= 0:
-                        connector.strSequenceName1  = rowData[3] if rowData[3] != None else ''
-                        connector.strSequenceName2  = rowData[4] if rowData[4] != None else ''
-                        strPreviousSequence[2] = f'{connector.strSequenceName1}{connector.strSequenceName2}'
-                else:
-                    strPreviousSequence[2] = ''
-                logInfo.connector2 = copy.deepcopy(connector)
-
-                ocppMessage = OCPPMessageInfo()
-                ocppMessage.clear()
-                ocppMessage.strMessageId     = rowData[17] if rowData[17] != None else ''
-                ocppMessage.strResponse      = rowData[18] if rowData[18] != None else ''
-                ocppMessage.strUUID          = rowData[19] if rowData[19] != None else ''
-                ocppMessage.strConnectorId   = rowData[20] if rowData[20] != None else ''
-                ocppMessage.strEventType     = rowData[21] if rowData[21] != None else ''
-                ocppMessage.strChargingState = rowData[22] if rowData[22] != None else ''
-                ocppMessage.strTriggerReason = rowData[23] if rowData[23] != None else ''
-                ocppMessage.strStoppedReason = rowData[24] if rowData[24] != None else ''
-                ocppMessage.strTransactionId = rowData[25] if rowData[25] != None else ''
-                ocppMessage.strIdTag         = rowData[26] if rowData[26] != None else ''
-                ocppMessage.strMeterValue    = rowData[27] if rowData[27] != None else ''
-                ocppMessage.strSoC           = rowData[28] if rowData[28] != None else ''
-                if ocppMessage.strMessageId == 'Authorize':
-                    strTime     = ocppMessage.strResponse
-                    strDateTime = logInfo.strDateTime.split(' ', maxsplit=1)
-                    strOffset   = strDateTime[1].split('-', maxsplit=1)[1]
-                    if ocppMessage.strResponse.find(' ') > 0:
-                        strTime = ocppMessage.strResponse.split(' ', maxsplit=1)[0]
-
-                    ocppMessage.strResponseTime = f'{strDateTime[0]} {strTime}-{strOffset}'
-
-                logInfo.ocppMessage = copy.deepcopy(ocppMessage)
-
-                if logInfo.strEVSEEvent == 'Start App':
-                    strPreviousStatus = {1:'None' , 2:'None'}
-
-                elif len(logInfo.connector1.strCurrentStatus) > 0:
-                    statusInfo = LogInfo()
-                    statusInfo.connector1.strPreviousStatus = strPreviousStatus[1]
-                    Analyzed().append(self.worksheet.title, statusInfo)
-                    strPreviousStatus[1] = logInfo.connector1.strCurrentStatus
-
-                elif len(logInfo.connector2.strCurrentStatus) > 0:
-                    statusInfo = LogInfo()
-                    statusInfo.connector2.strPreviousStatus = strPreviousStatus[2]
-                    Analyzed().append(self.worksheet.title, statusInfo)
-                    strPreviousStatus[2] = logInfo.connector2.strCurrentStatus
-
-                if logInfo.ocppMessage.strMessageId != 'TransactionEvent' or logInfo.ocppMessage.strEventType == 'Started':
-                    logInfo.strTarget = f'{utils.get_column_letter(18)}{rowIndex}'
-
-                Analyzed().append(self.worksheet.title, logInfo)
+            rowData = ['' if value is None else internStr(value) for value in row]
+            if len(rowData) < nColumns:
+                rowData.extend([''] * (nColumns - len(rowData)))
+
+            logInfo = LogInfo()
+            logInfo.strDateTime         = rowData[0]
+            logInfo.nTime               = parseTime(logInfo.strDateTime) if type(logInfo.strDateTime) == str else None
+            logInfo.strEVSEEvent        = rowData[1]
+            logInfo.strCommand          = rowData[2]
+
+            connector = ConnectorInfo()
+            connector.nConnection       = 1 if rowData[5] == 'On' else (2 if rowData[5] == 'Off' else 0)
+            connector.strCurrentStatus  = rowData[6]
+            connector.strNotification   = rowData[7]
+            connector.strCodeFinish     = rowData[8]
+            connector.strCodeError      = rowData[9]
+            connector.strCodeErrorPLC   = rowData[10]
+            if strPreviousStatus[1] == 'finish' or strPreviousStatus[1] == 'thankYou' or strPreviousStatus[1] == 'fault':
+                if len(strPreviousSequence[1]) <= 0:
+                    connector.strSequenceName1  = rowData[3]
+                    connector.strSequenceName2  = rowData[4]
+                    strPreviousSequence[1] = f'{connector.strSequenceName1}{connector.strSequenceName2}'
+            else:
+                strPreviousSequence[1] = ''
+            logInfo.connector1 = connector
+
+            connector = ConnectorInfo()
+            connector.nConnection       = 1 if rowData[11] == 'On' else (2 if rowData[11] == 'Off' else 0)
+            connector.strCurrentStatus  = rowData[12]
+            connector.strNotification   = rowData[13]
+            connector.strCodeFinish     = rowData[14]
+            connector.strCodeError      = rowData[15]
+            connector.strCodeErrorPLC   = rowData[16]
+            if strPreviousStatus[2] == 'finish' or strPreviousStatus[2] == 'thankYou' or strPreviousStatus[2] == 'fault':
+                if len(strPreviousSequence[2]) <= 0:
+                    connector.strSequenceName1  = rowData[3]
+                    connector.strSequenceName2  = rowData[4]
+                    strPreviousSequence[2] = f'{connector.strSequenceName1}{connector.strSequenceName2}'
+            else:
+                strPreviousSequence[2] = ''
+            logInfo.connector2 = connector
+
+            ocppMessage = OCPPMessageInfo()
+            ocppMessage.clear()
+            ocppMessage.strMessageId     = rowData[17]
+            ocppMessage.strResponse      = rowData[18]
+            ocppMessage.strUUID          = rowData[19]
+            ocppMessage.strConnectorId   = rowData[20]
+            ocppMessage.strEventType     = rowData[21]
+            ocppMessage.strChargingState = rowData[22]
+            ocppMessage.strTriggerReason = rowData[23]
+            ocppMessage.strStoppedReason = rowData[24]
+            ocppMessage.strTransactionId = rowData[25]
+            ocppMessage.strIdTag         = rowData[26]
+            ocppMessage.strMeterValue    = rowData[27]
+            ocppMessage.strSoC           = rowData[28]
+            if ocppMessage.strMessageId == 'Authorize':
+                strTime     = ocppMessage.strResponse
+                shortTime   = extract('ShortTime', logInfo.strDateTime)
+                if ocppMessage.strResponse.find(' ') > 0:
+                    strTime = ocppMessage.strResponse.split(' ', maxsplit=1)[0]
+
+                if shortTime != None:
+                    ocppMessage.strResponseTime = f"{shortTime['date']} {strTime}-{shortTime['zone']}"
+
+            logInfo.ocppMessage = ocppMessage
+
+            if logInfo.strEVSEEvent == 'Start App':
+                strPreviousStatus = {1:'None' , 2:'None'}
+
+            elif len(logInfo.connector1.strCurrentStatus) > 0:
+                statusInfo = LogInfo()
+                statusInfo.connector1 = ConnectorInfo()
+                statusInfo.connector1.strPreviousStatus = strPreviousStatus[1]
+                analyzeInfo.addLog(statusInfo)
+                strPreviousStatus[1] = logInfo.connector1.strCurrentStatus
+
+            elif len(logInfo.connector2.strCurrentStatus) > 0:
+                statusInfo = LogInfo()
+                statusInfo.connector2 = ConnectorInfo()
+                statusInfo.connector2.strPreviousStatus = strPreviousStatus[2]
+                analyzeInfo.addLog(statusInfo)
+                strPreviousStatus[2] = logInfo.connector2.strCurrentStatus
+
+            if logInfo.ocppMessage.strMessageId != 'TransactionEvent' or logInfo.ocppMessage.strEventType == 'Started':
+                logInfo.strTarget = f'{utils.get_column_letter(18)}{rowIndex}'
+
+            analyzeInfo.addLog(logInfo)
 
             rowIndex += 1
 
-        info(f'readDetail - Src [{self.worksheet.title}] Size [{Analyzed().sizeLogs(self.worksheet.title)}]')
+        Analyzed().set(srcName, analyzeInfo)
+
+        info(f'readDetail - Src [{srcName}] Size [{Analyzed().sizeLogs(srcName)}]')
 
-    def setWorkcell(self, row, column, text, center=True, color=None, red=False, link=None):
+    def setWorkcell(self, row, column, text, style='SCAR Cell', red=False, link=None):
+        value = None
         if text != None and len(str(text)) > 0:
             if link != None:
-                self.worksheet.cell(row, column, f'=HYPERLINK("{link}", "{text}")')
+                value = f'=HYPERLINK("{link}", "{text}")'
             else:
-                self.worksheet.cell(row, column, text)
-
-        if center == True:
-            self.worksheet.cell(row, column).alignment = styles.Alignment(horizontal='center')
+                value = text
 
         if red == True:
-            self.worksheet.cell(row, column).font = styles.Font(name='맑은 고딕', size=11, bold=True, color='FF0000')
-        elif self.fontColor != None:
-            self.worksheet.cell(row, column).font = styles.Font(name='맑은 고딕', size=11, color=self.fontColor)
-
-        background = self.cellColor
-        if color != None:
-            background = color
-        if background != None:
-            self.worksheet.cell(row, column).fill = styles.PatternFill(start_color=background, end_color=background, fill_type='solid')
+            style = style.replace('SCAR Cell', 'SCAR Bad')
+            self.badColumns.append(column)
+
+        self.writer.setCell(row, column, value, style=style)
@@ -1,15 +1,27 @@
-import copy
+import hashlib
 import json
 import os
+import re
+import sys
 import threading
 import yaml
 import zipfile
 
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from openpyxl import load_workbook
-from parse import *
 from typing import Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 class LogElement(object):
@@ -32,6 +44,24 @@ class Config:
             cls._instance.detailPath = ''
             cls._instance.siteFile   = ''
             cls._instance.siteList   = {}
+            cls._instance.manifestFile   = ''
+            cls._instance.cacheDir       = ''
+            cls._instance.requestExpiry  = 0
+            cls._instance.resultCompress = ''
+            cls._instance.resultPreview  = 0
+            cls._instance.followState    = ''
+            cls._instance.followInterval = 1.0
+            cls._instance.followEvents   = 10000
+            cls._instance.analyzeEngine  = 'thread'
+            cls._instance.analyzeWorkers = 0
+            cls._instance.lazyEvents     = False
+            cls._instance.codeFile       = 'SCARCodes.yaml'
+            cls._instance.codeFirmware   = ''
+            cls._instance.detailShard    = False
+            cls._instance.detailWorkers  = 0
+            cls._instance.detailExport   = 'xlsx'
+            cls._instance.summaryExport  = 'xlsx'
+            cls._instance.summarySplit   = False
         return cls._instance
 
     def clear(self):
@@ -44,6 +74,24 @@ class Config:
         self.detailPath = ''
         self.siteFile   = ''
         self.siteList   = {}
+        self.manifestFile   = ''
+        self.cacheDir       = ''
+        self.requestExpiry  = 0
+        self.resultCompress = ''
+        self.resultPreview  = 0
+        self.followState    = ''
+        self.followInterval = 1.0
+        self.followEvents   = 10000
+        self.analyzeEngine  = 'thread'
+        self.analyzeWorkers = 0
+        self.lazyEvents     = False
+        self.codeFile       = 'SCARCodes.yaml'
+        self.codeFirmware   = ''
+        self.detailShard    = False
+        self.detailWorkers  = 0
+        self.detailExport   = 'xlsx'
+        self.summaryExport  = 'xlsx'
+        self.summarySplit   = False
 
 class LogList:
     _instance = None
@@ -61,7 +109,337 @@ class LogList:
         self.dstDicts  = {}
         self.fileCount = 10
 
+# 압축 파일 멤버 목록 캐시 (크기/수정 시각이 같으면 재검사하지 않음)
+class Archives:
+    _instance = None
+    _lock = threading.Lock()
+    _archives : Dict[str, tuple] = {}
+
+    def __new__(cls):
+        if cls._instance == None:
+            with cls._lock:
+                if cls._instance == None:
+                    cls._instance = super(Archives, cls).__new__(cls)
+        return cls._instance
+
+    def members(self, archivePath):
+        stat = os.stat(archivePath)
+        key = (stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            cached = self._archives.get(archivePath)
+        if cached != None and cached[0] == key:
+            return cached[1]
+
+        members = None
+        if zipfile.is_zipfile(archivePath) == False:
+            print(f"⚠️ 유효하지 않은 zip 파일: {archivePath}")
+        else:
+            try:
+                with zipfile.ZipFile(archivePath) as zipFile:
+                    members = [member.filename for member in zipFile.infolist() if member.is_dir() == False]
+            except zipfile.BadZipFile:
+                print(f" zip 파일 읽기 실패 (BadZipFile): {archivePath}")
+
+        with self._lock:
+            self._archives[archivePath] = (key, members)
+
+        return members
+
+    def clear(self):
+        with self._lock:
+            self._archives = {}
+
+# 코드 <-> 이름 변환표 (정방향/역방향 모두 dict 조회)
+class CodeTable:
+    def __init__(self, codes, bIgnoreCase=False):
+        self.bIgnoreCase = bIgnoreCase
+        self.codes       = {}
+        self.labels      = {}
+
+        for code, label in codes.items():
+            code = str(code).lower() if bIgnoreCase == True else str(code)
+            self.codes[code] = label
+            # 같은 이름이 여러 코드에 있으면 먼저 등록된 코드
+            if type(label) == str:
+                self.labels.setdefault(label, code)
+
+    def decode(self, code, default=''):
+        if self.bIgnoreCase == True:
+            code = code.lower()
+        return self.codes.get(code, default)
+
+    # 열 단위 변환 (codes 순서대로 이름 목록)
+    def decodeMany(self, codes, default=''):
+        if self.bIgnoreCase == True:
+            codes = [code.lower() for code in codes]
+
+        get = self.codes.get
+        return [get(code, default) for code in codes]
+
+    def encode(self, label, default=''):
+        return self.labels.get(label, default)
+
+    def __len__(self):
+        return len(self.codes)
+
+# 충전기 코드표 (CODE_FILE 에서 1회 읽고, 종류/펌웨어별 변환표를 만들어 재사용)
+class CodeCatalog:
+    _instance = None
+    _lock = threading.Lock()
+    _catalog = None
+    _tables : Dict[tuple, CodeTable] = {}
+
+    VERSION = 1     # 읽을 수 있는 코드표 형식 버전
+
+    def __new__(cls):
+        if cls._instance == None:
+            with cls._lock:
+                if cls._instance == None:
+                    cls._instance = super(CodeCatalog, cls).__new__(cls)
+        return cls._instance
+
+    def load(self):
+        catalog = {}
+        path = os.path.join(BASE_DIR, Config().codeFile or 'SCARCodes.yaml')
+        try:
+            with open(path, encoding='utf-8') as f:
+                catalog = yaml.safe_load(f) or {}
+
+            if catalog.get('VERSION', 0) > self.VERSION:
+                print(f"⚠️ 지원하지 않는 코드표 버전: {path} [{catalog.get('VERSION')}]")
+                catalog = {}
+
+        except (OSError, yaml.YAMLError) as e:
+            print(f"⚠️ 코드표 읽기 실패: {path} [{e}]")
+
+        return catalog
+
+    # 종류 (FINISH / ERROR / PLC) 의 변환표 (firmware : 없으면 CODE_FIRMWARE 설정)
+    def table(self, kind, firmware=None):
+        if firmware == None:
+            firmware = Config().codeFirmware
+
+        key = (kind, firmware)
+        table = self._tables.get(key)
+        if table == None:
+            with self._lock:
+                if self._catalog == None:
+                    self._catalog = self.load()
+
+                codes = dict(self._catalog.get(kind) or {})
+                if len(firmware) > 0:
+                    overrides = (self._catalog.get('FIRMWARE') or {}).get(firmware) or {}
+                    codes.update(overrides.get(kind) or {})
+
+                table = self._tables.setdefault(key, CodeTable(codes))
+
+        return table
+
+    def decode(self, kind, code, firmware=None):
+        return self.table(kind, firmware).decode(code)
+
+    def decodeMany(self, kind, codes, firmware=None):
+        return self.table(kind, firmware).decodeMany(codes)
+
+    def encode(self, kind, label, firmware=None):
+        return self.table(kind, firmware).encode(label)
+
+    def clear(self):
+        with self._lock:
+            self._catalog = None
+            self._tables  = {}
+
+# 행 전체의 코드 이름을 열 단위로 변환하여 각 ReasonInfo 에 보관
+def decodeDetailCodes(reasonInfos):
+    catalog = CodeCatalog()
+    finishes = catalog.decodeMany('FINISH', [reasonInfo.strCodeFinish for reasonInfo in reasonInfos])
+    errors   = catalog.decodeMany('ERROR', [reasonInfo.strCodeError for reasonInfo in reasonInfos])
+    plcs     = catalog.decodeMany('PLC', [reasonInfo.strCodeErrorPLC for reasonInfo in reasonInfos])
+
+    for reasonInfo, labels in zip(reasonInfos, zip(finishes, errors, plcs)):
+        reasonInfo.setDetailLabels(labels)
+
+# parse 형식 문자열을 정규식으로 1회 컴파일 ('{name}' -> 최소 일치 그룹)
+def compileFormat(format):
+    pattern = ''
+    for index, token in enumerate(re.split(r'\{(\w+)\}', format)):
+        pattern += f'(?P<{token}>.+?)' if index % 2 == 1 else re.escape(token)
+
+    return re.compile(f'\\A{pattern}\\Z', re.IGNORECASE | re.DOTALL)
+
+# 메시지 유형별 필드 형식 (parse 형식 문자열, SCARAnalyzer / SCARCategorizer / SCARSummarizer 공용)
+EXTRACT_FORMATS = { 'Emergency'   : '{etc}Emergency Button emeStatus {emergencyStatus}',
+                    'Nayax'       : 'VPOS -> HMI NAYAX < Vend {paymentStatus}',
+                    'PlugIn'      : '{etc}Plug in for id {connectorId}',
+                    'PlugOut'     : '{etc}Plug Out for id {connectorId}',
+                    'Mainboard'   : '{etc1}RECV MAINBOARD STATUS index ({mainboardIndex}) connectorId({connectorId}){etc2}',
+                    'EvsePrev'    : 'evse prev status : {connectorStatus}',
+                    'EvseAftr'    : 'evse aftr status : {connectorStatus}',
+                    'ConnectorId' : '{etc1}connectorId [{connectorId}]{etc2}',
+                    'ConnectorIdColon' : '{etc1}connectorId : [{connectorId}]{etc2}',
+                    'Code'        : '{etc1}errorCode [{fault}] errorCodePLC [{faultPLC}] finishCode [{finish}]{etc2}',
+                    'Sequence'    : '{etc}ConnectorId [{connectorId}] Sequence Name1 [{sBit1}] [{sInt1}] Sequence Name2 [{sBit2}] [{sInt2}]',
+                    'ShortTime'   : '{date} {time}-{zone}',
+                    'Response'    : '{time} {response}',
+                    'FileName'    : '{dateTime}_{chargerId}_{etc}' }
+
+EXTRACTORS = { key : compileFormat(format) for key, format in EXTRACT_FORMATS.items() }
+
+def extract(key, text):
+    return EXTRACTORS[key].match(text)
+
+class KeyMatcher:
+    def __init__(self, keys):
+        self.keys    = list(keys)
+        self.indexes = {}
+        for index, key in enumerate(self.keys):
+            self.indexes.setdefault(key, index)
+
+        # 전체 키를 하나의 패턴으로 컴파일 (라인당 1회 탐색)
+        self.pattern = re.compile('|'.join(re.escape(key) for key in self.indexes))
+
+    def match(self, message):
+        found = self.pattern.search(message)
+        if found == None:
+            return -1
+
+        # 여러 키가 포함된 경우 목록상 앞선 키 우선
+        index = self.indexes[found.group()]
+        for prior in range(index):
+            if message.find(self.keys[prior]) >= 0:
+                return prior
+
+        return index
+
+# 반복되는 값 (상태, 이벤트 타입, 커넥터 ID 등) 은 같은 문자열 객체를 공유
+def internStr(value):
+    return sys.intern(value) if type(value) == str else value
+
+# 변경할 수 없는 공유 객체 (값이 없는 커넥터/메시지)
+def readOnly(cls):
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f'{cls.__name__} is read-only [{name}]')
+        super(cls, self).__setattr__(name, value)
+
+    cls.__setattr__ = __setattr__
+    return cls
+
+# 파일로 보관하는 분석 상태의 JSON 변환 (pickle 대신 사용, 등록된 클래스와 공유 객체만 복원)
+#   tuple / set / deque / 문자열 외 키의 dict : { '#' : 종류, 'v' : 값 }
+#   등록된 클래스 객체 : { '#' : 클래스 이름, 'v' : 속성, '&' : 번호 }, 같은 객체를 다시 만나면 { '#' : 'ref', 'v' : 번호 }
+PLAIN_TYPES     = {}
+PLAIN_CONSTANTS = {}
+
+def plainType(cls):
+    PLAIN_TYPES[cls.__name__] = cls
+    return cls
+
+def plainConstant(name, value):
+    PLAIN_CONSTANTS[name] = value
+    return value
+
+def plainSlots(cls):
+    return [slot for base in reversed(cls.__mro__) for slot in base.__dict__.get('__slots__', ())]
+
+def toPlain(value, memo=None):
+    if memo == None:
+        memo = {}
+
+    kind = type(value)
+    if value == None or kind in (str, int, float, bool):
+        return value
+    if kind == list:
+        return [toPlain(item, memo) for item in value]
+    if kind == tuple:
+        return { '#' : 'tuple', 'v' : [toPlain(item, memo) for item in value] }
+    if kind == set:
+        return { '#' : 'set', 'v' : [toPlain(item, memo) for item in value] }
+    if kind == deque:
+        return { '#' : 'deque', 'v' : [toPlain(item, memo) for item in value], 'n' : value.maxlen }
+    if kind == dict:
+        if '#' not in value and all(type(key) == str for key in value):
+            return { key : toPlain(item, memo) for key, item in value.items() }
+        return { '#' : 'dict', 'v' : [[toPlain(key, memo), toPlain(item, memo)] for key, item in value.items()] }
+
+    for name, constant in PLAIN_CONSTANTS.items():
+        if value is constant:
+            return { '#' : name }
+
+    if PLAIN_TYPES.get(kind.__name__) is not kind:
+        raise TypeError(f'toPlain - Unsupported type [{kind.__name__}]')
+
+    if id(value) in memo:
+        return { '#' : 'ref', 'v' : memo[id(value)] }
+    memo[id(value)] = len(memo)
+
+    if hasattr(value, 'plainState'):
+        state = value.plainState()
+    elif hasattr(value, '__dict__'):
+        state = vars(value)
+    else:
+        state = { slot : getattr(value, slot) for slot in plainSlots(kind) if hasattr(value, slot) }
+
+    return { '#' : kind.__name__, 'v' : { key : toPlain(item, memo) for key, item in state.items() }, '&' : memo[id(value)] }
+
+def fromPlain(value, memo=None):
+    if memo == None:
+        memo = {}
+
+    kind = type(value)
+    if kind == list:
+        return [fromPlain(item, memo) for item in value]
+    if kind != dict:
+        return value
+
+    tag = value.get('#')
+    if tag == None:
+        return { key : fromPlain(item, memo) for key, item in value.items() }
+    if tag == 'tuple':
+        return tuple(fromPlain(item, memo) for item in value['v'])
+    if tag == 'set':
+        return set(fromPlain(item, memo) for item in value['v'])
+    if tag == 'deque':
+        return deque((fromPlain(item, memo) for item in value['v']), maxlen=value['n'])
+    if tag == 'dict':
+        return { fromPlain(key, memo) : fromPlain(item, memo) for key, item in value['v'] }
+    if tag == 'ref':
+        return memo[value['v']]
+    if tag in PLAIN_CONSTANTS:
+        return PLAIN_CONSTANTS[tag]
+
+    cls = PLAIN_TYPES.get(tag)
+    if cls == None:
+        raise TypeError(f'fromPlain - Unsupported type [{tag}]')
+
+    state = { key : fromPlain(item, memo) for key, item in value['v'].items() }
+    if hasattr(cls, 'fromPlainState'):
+        obj = cls.fromPlainState(state)
+    else:
+        obj = cls.__new__(cls)
+        if hasattr(obj, '__dict__'):
+            # 메서드/속성 이름은 인스턴스 값으로 덮어쓰지 않음
+            for key in state:
+                if key.startswith('__') or hasattr(cls, key):
+                    raise TypeError(f'fromPlain - Unknown attribute [{tag}.{key}]')
+            obj.__dict__.update(state)
+        else:
+            slots = set(plainSlots(cls))
+            for key, item in state.items():
+                if key not in slots:
+                    raise TypeError(f'fromPlain - Unknown slot [{tag}.{key}]')
+                object.__setattr__(obj, key, item)
+
+    memo[value['&']] = obj
+    return obj
+
+
+@plainType
 class ConnectorInfo:
+    __slots__ = ('nConnection', 'strPreviousStatus', 'strCurrentStatus', 'strNotification',
+                 'strCodeFinish', 'strCodeError', 'strCodeErrorPLC', 'strSequenceName1', 'strSequenceName2')
+
     def __init__(self):
         self.nConnection       = 0
         self.strPreviousStatus = ''
@@ -110,7 +488,12 @@ class ConnectorInfo:
                (len(self.strCodeError) > 0 and self.strCodeError != '0') or \
                (len(self.strCodeErrorPLC) > 0 and self.strCodeErrorPLC != '0')
 
+@plainType
 class OCPPMessageInfo:
+    __slots__ = ('strMessageId', 'strResponse', 'strResponseTime', 'strUUID', 'strConnectorId', 'strEventType',
+                 'strChargingState', 'strStoppedReason', 'strTriggerReason', 'strTransactionId', 'strIdTag',
+                 'strSoC', 'strMeterValue', 'strTimestamp', 'bOffline')
+
     def __init__(self):
         self.strMessageId     = ''
         self.strResponse      = ''
@@ -146,7 +529,7 @@ class OCPPMessageInfo:
         self.bOffline         = False
 
     def getBadResponse(self, bSub=False):
-        ocppResponse = parse('{time} {response}', self.strResponse)
+        ocppResponse = extract('Response', self.strResponse)
         bResponse = False
         strResponse = ''
 
@@ -159,24 +542,59 @@ class OCPPMessageInfo:
         else:
             return bResponse, strResponse
 
-class LogInfo:
+@readOnly
+class EmptyConnectorInfo(ConnectorInfo):
+    __slots__ = ()
+
+    def __reduce__(self):
+        return 'EMPTY_CONNECTOR'
+
+@readOnly
+class EmptyOCPPMessageInfo(OCPPMessageInfo):
+    __slots__ = ()
+
+    def __reduce__(self):
+        return 'EMPTY_MESSAGE'
+
+EMPTY_CONNECTOR = plainConstant('EMPTY_CONNECTOR', EmptyConnectorInfo())
+EMPTY_MESSAGE   = plainConstant('EMPTY_MESSAGE', EmptyOCPPMessageInfo())
+
+# 분석 결과 로그 공통 (LogInfo, 지연 생성 로그)
+class LogRecord:
+    __slots__ = ('strDateTime', 'nTime', 'strTarget')   # nTime : strDateTime 의 epoch 밀리초 (분석 시 1회 변환)
+
+# 값이 없는 커넥터/메시지는 공유 객체 사용 (값을 설정할 때는 새 객체를 할당)
+@plainType
+class LogInfo(LogRecord):
+    __slots__ = ('strEVSEEvent', 'strCommand', 'connector1', 'connector2', 'ocppMessage')
+
     def __init__(self):
         self.strDateTime  = ''
+        self.nTime        = None
         self.strEVSEEvent = ''
         self.strCommand   = ''
         self.strTarget    = ''
-        self.connector1   = ConnectorInfo()
-        self.connector2   = ConnectorInfo()
-        self.ocppMessage  = OCPPMessageInfo()
+        self.connector1   = EMPTY_CONNECTOR
+        self.connector2   = EMPTY_CONNECTOR
+        self.ocppMessage  = EMPTY_MESSAGE
 
     def clear(self):
         self.strDateTime  = ''
+        self.nTime        = None
         self.strEVSEEvent = ''
         self.strCommand   = ''
         self.strTarget    = ''
-        self.connector1.clear()
-        self.connector2.clear()
-        self.ocppMessage.clear()
+        self.connector1   = EMPTY_CONNECTOR
+        self.connector2   = EMPTY_CONNECTOR
+        self.ocppMessage  = EMPTY_MESSAGE
+
+    # 응답 대조용 요청 키 (UUID, messageId)
+    def getRequestKey(self):
+        return (self.ocppMessage.strUUID, self.ocppMessage.strMessageId)
+
+    def setResponse(self, strResponse, strTime):
+        self.ocppMessage.strResponse     = strResponse
+        self.ocppMessage.strResponseTime = strTime
 
 class ReasonInfo:
     def __init__(self):
@@ -189,6 +607,7 @@ class ReasonInfo:
         self.strCodeErrorPLC   = ''
         self.strSequenceName1  = ''
         self.strSequenceName2  = ''
+        self.detailLabels      = None   # ((finish, error, PLC 코드), 코드 이름) : 코드가 같으면 다시 변환하지 않음
 
     def clear(self):
         self.strCommand        = ''
@@ -200,6 +619,7 @@ class ReasonInfo:
         self.strCodeErrorPLC   = ''
         self.strSequenceName1  = ''
         self.strSequenceName2  = ''
+        self.detailLabels      = None
 
     def getCodeFinish(self):
         return self.strCodeFinish if len(self.strCodeFinish) > 0 and self.strCodeFinish != '0' else ''
@@ -210,10 +630,18 @@ class ReasonInfo:
     def getCodeErrorPLC(self):
         return self.strCodeErrorPLC if len(self.strCodeErrorPLC) > 0 and self.strCodeErrorPLC != '0' else ''
 
+    # finish / error / PLC 코드 이름
+    def getDetailLabels(self):
+        codes = (self.strCodeFinish, self.strCodeError, self.strCodeErrorPLC)
+        if self.detailLabels == None or self.detailLabels[0] != codes:
+            self.detailLabels = (codes, (finishToStr(codes[0]), errorToStr(codes[1]), errorPLCToStr(codes[2])))
+        return self.detailLabels[1]
+
+    def setDetailLabels(self, labels):
+        self.detailLabels = ((self.strCodeFinish, self.strCodeError, self.strCodeErrorPLC), labels)
+
     def getDetailCode(self):
-        strDetailFinish   = finishToStr(self.strCodeFinish)
-        strDetailError    = errorToStr(self.strCodeError)
-        strDetailErrorPLC = errorPLCToStr(self.strCodeErrorPLC)
+        strDetailFinish, strDetailError, strDetailErrorPLC = self.getDetailLabels()
 
         strDetailCode = ''
         if len(strDetailFinish) > 0:
@@ -249,9 +677,9 @@ class SummaryInfo:
         self.strConnectorId   = ''
         self.strCard          = ''
         self.strExtraData     = ''
-        self.strStartDate     = ''
-        self.strChargingDate  = ''
-        self.strEndDate       = ''
+        self.nStartTime       = None    # epoch 밀리초 (표시할 때 formatTime 으로 변환)
+        self.nChargingTime    = None
+        self.nEndTime         = None
         self.strStartkWh      = ''
         self.strEndkWh        = ''
         self.strTransactionId = ''
@@ -266,9 +694,9 @@ class SummaryInfo:
         self.strConnectorId   = ''
         self.strCard          = ''
         self.strExtraData     = ''
-        self.strStartDate     = ''
-        self.strChargingDate  = ''
-        self.strEndDate       = ''
+        self.nStartTime       = None    # epoch 밀리초 (표시할 때 formatTime 으로 변환)
+        self.nChargingTime    = None
+        self.nEndTime         = None
         self.strStartkWh      = ''
         self.strEndkWh        = ''
         self.strTransactionId = ''
@@ -278,16 +706,28 @@ class SummaryInfo:
         self.strCellColor     = ''
         self.reasonInfo.clear()
 
+    @property
+    def strStartDate(self):
+        return formatTime(self.nStartTime)
+
+    @property
+    def strChargingDate(self):
+        return formatTime(self.nChargingTime)
+
+    @property
+    def strEndDate(self):
+        return formatTime(self.nEndTime)
+
     def getChargingTime(self):
         strChargingTime = 0
-        if len(self.strChargingDate) > 0 and len(self.strEndDate) > 0:
-            strChargingTime = calculateTime(self.strEndDate, self.strChargingDate)
+        if self.nChargingTime != None and self.nEndTime != None:
+            strChargingTime = elapsedSecs(self.nEndTime, self.nChargingTime)
         return strChargingTime
 
     def getTotalTime(self):
         strTotalTime = 0
-        if len(self.strStartDate) > 0 and len(self.strEndDate) > 0:
-            strTotalTime = calculateTime(self.strEndDate, self.strStartDate)
+        if self.nStartTime != None and self.nEndTime != None:
+            strTotalTime = elapsedSecs(self.nEndTime, self.nStartTime)
         return strTotalTime
 
     def getTotalkWh(self):
@@ -297,8 +737,20 @@ class SummaryInfo:
         return f'{strTotalkWh / 1000:.3f}' if strTotalkWh > 0 else ''
 
     def getHyperLink(self):
-        return f'#\'{self.strCharger}\'!{self.strTarget}' if len(self.strTarget) > 0 else None
+        if len(self.strTarget) <= 0:
+            return None
+
+        # 충전기별 상세 파일로 나눈 경우 해당 파일의 시트로 연결
+        if Config().detailShard == True:
+            return f'{os.path.basename(shardPath(self.strCharger))}#\'{self.strCharger}\'!{self.strTarget}'
+
+        # 요약을 별도 파일로 작성한 경우 (SUMMARY_SPLIT) 상세 파일의 시트로 연결
+        if Config().summarySplit == True:
+            return f'{os.path.basename(Config().detailPath)}#\'{self.strCharger}\'!{self.strTarget}'
+
+        return f'#\'{self.strCharger}\'!{self.strTarget}'
 
+@plainType
 class AnalyzeInfo:
     def __init__(self):
         self.matched       = 0
@@ -308,6 +760,12 @@ class AnalyzeInfo:
         self.rawLogs       = []
         self.prevLog       = []
         self.prevEmergency = ''
+        self.requests      = {}     # (UUID, messageId) -> 첫 요청 로그 위치
+        self.requestTimes  = {}     # 응답 대기 UUID -> 요청 시각 (epoch 밀리초)
+        self.latestRequest = 0
+        self.shortestKey   = None   # 등록된 요청 UUID 중 가장 짧은 길이 (부분 일치 확인용)
+        self.writer        = None   # 결과 로그 기록 (없으면 rawLogs 에 모두 보관)
+        self.lazyRecord    = None   # 지연 생성 로그용 현재 레코드 (원본, 시작 위치, 다음 줄 위치, 시작 시점 connectorId)
 
     def clear(self):
         self.matched       = 0
@@ -317,11 +775,242 @@ class AnalyzeInfo:
         self.rawLogs       = []
         self.prevLog       = []
         self.prevEmergency = ''
+        self.requests      = {}
+        self.requestTimes  = {}
+        self.latestRequest = 0
+        self.shortestKey   = None
+        self.writer        = None
+        self.lazyRecord    = None
+
+    def addLog(self, logInfo):
+        self.requests.setdefault(logInfo.getRequestKey(), len(self.logs))
+        self.logs.append(logInfo)
+
+    # 결과 로그 줄 (writer 가 있으면 바로 기록하고 rawLogs 에는 최근 nPreview 줄만 유지)
+    def addRaw(self, rawLog):
+        if self.writer != None:
+            self.writer.write(rawLog)
+        self.rawLogs.append(rawLog)
+
+    def stream(self, writer, nPreview):
+        self.writer  = writer
+        self.rawLogs = deque(self.rawLogs, maxlen=max(0, nPreview))
+
+    # 결과 로그 완료 (임시 파일을 결과 파일로 변경)
+    def finish(self):
+        if self.writer != None:
+            self.writer.close()
+            self.writer = None
+
+    # 요청 로그 위치 재구성 (start 이후 추가된 로그)
+    def indexLogs(self, start=0):
+        if start == 0:
+            self.requests = {}
+
+        for index in range(start, len(self.logs)):
+            self.requests.setdefault(self.logs[index].getRequestKey(), index)
+
+    # 응답 대기 요청 등록 (nTime : 요청 로그의 epoch 밀리초)
+    def addRequest(self, uuid, messageId, nTime):
+        self.ocppUUIDs[uuid] = messageId
+
+        if self.shortestKey == None or len(uuid) < self.shortestKey:
+            self.shortestKey = len(uuid)
+
+        if nTime != None:
+            self.requestTimes[uuid] = nTime
+            self.latestRequest = max(self.latestRequest, nTime)
+
+    # 가장 최근 요청보다 nExpiry 초 이상 오래된 응답 대기 요청 제외 (파일 단위로 호출)
+    def expireRequests(self, nExpiry):
+        if nExpiry <= 0:
+            return
+
+        limit = self.latestRequest - nExpiry * 1000
+        for uuid, nTime in list(self.requestTimes.items()):
+            if uuid not in self.ocppUUIDs:
+                del self.requestTimes[uuid]
+            elif nTime < limit:
+                del self.ocppUUIDs[uuid]
+                del self.requestTimes[uuid]
+
+    def setResponse(self, index, strResponse, strTime):
+        self.logs[index].setResponse(strResponse, strTime)
+
+    # 직전과 동일한 Emergency 상태는 제외
+    def changeEmergency(self, event):
+        if self.prevEmergency == event:
+            return False
+
+        self.prevEmergency = event
+        return True
+
+    # 응답 UUID 에 대응하는 요청 조회 (요청 키, logs 위치)
+    # 응답 UUID 보다 짧은 키가 등록된 적이 없으면 같은 키만 확인, 있으면 먼저 등록된 키부터 부분 일치 확인
+    def findRequest(self, uuid):
+        key = None
+        if self.shortestKey != None and self.shortestKey < len(uuid):
+            for pendingKey in self.ocppUUIDs:
+                if uuid.find(pendingKey) >= 0:
+                    key = pendingKey
+                    break
+        elif uuid in self.ocppUUIDs:
+            key = uuid
+
+        if key == None:
+            return None, -1
+
+        return key, self.requests.get((uuid, self.ocppUUIDs[key]), -1)
+
+    # 지연 생성 로그를 다시 분석할 때 필요한 레코드 시작 시점 상태
+    def recordState(self):
+        return self.connectorId
+
+    # 이전 파일 상태가 필요한 줄, 요청을 찾지 못한 응답 (파일 단위 분석에서 사용)
+    def deferLine(self, log):
+        return False
+
+    def deferResponse(self, uuid, logElements, ocppMessage):
+        return
+
+# 파일 간 이어지는 상태 (쓰기 전에 읽은 경우 이전 파일 상태에 의존)
+def trackedState(key):
+    def getState(self):
+        if key not in self.writes:
+            self.reads.add(key)
+        return self.__dict__[f'_{key}']
+
+    def setState(self, value):
+        self.writes.add(key)
+        self.__dict__[f'_{key}'] = value
+
+    return property(getState, setState)
+
+# 파일 단위 분석 결과 (기본 상태에서 시작, 이전 파일 상태와 연결은 stitch 에서 처리)
+@plainType
+class PartialAnalyzeInfo(AnalyzeInfo):
+    DEFAULTS = { 'connectorId'   : 0,
+                 'prevLog'       : [],
+                 'prevEmergency' : '' }
+
+    connectorId   = trackedState('connectorId')
+    prevLog       = trackedState('prevLog')
+    prevEmergency = trackedState('prevEmergency')
+
+    def __init__(self):
+        self.reads  = set()
+        self.writes = set()
+        super().__init__()
+        self.writes = set()
+
+        self.leadingLines   = []    # 첫 로그 이전의 이어지는 줄 (이전 파일 마지막 로그에 연결)
+        self.lookups        = []    # 파일 내에서 찾은 요청 (UUID, messageId)
+        self.responses      = []    # 파일 내에서 찾지 못한 응답 (UUID, rawLogs 위치, 시간, rawLog, payload)
+        self.firstEmergency = None  # 첫 Emergency 상태 비교 (상태, logs 위치, rawLogs 위치)
+
+    def changeEmergency(self, event):
+        if self.firstEmergency == None:
+            self.firstEmergency = (event, len(self.logs), len(self.rawLogs))
+        return super().changeEmergency(event)
+
+    def deferLine(self, log):
+        if 'prevLog' in self.writes:
+            return False
+
+        self.leadingLines.append(log)
+        return True
+
+    # 읽기로 기록하지 않음 (레코드 분석 중 실제로 읽으면 그때 기록되어 이전 파일 상태와 비교됨)
+    def recordState(self):
+        return self.__dict__['_connectorId']
+
+    def findRequest(self, uuid):
+        key, index = super().findRequest(uuid)
+        if key != None:
+            self.lookups.append((uuid, self.ocppUUIDs[key]))
+        return key, index
+
+    def deferResponse(self, uuid, logElements, ocppMessage):
+        rawLog = f'[{logElements[LogElement.TIME]}] {logElements[LogElement.MESSAGE]}'
+        self.responses.append((uuid, len(self.rawLogs), logElements[LogElement.TIME], rawLog, ocppMessage))
+
+    # 이전 파일까지의 상태로 다시 분석해야 하는지 확인
+    def conflicts(self, analyzeInfo, requestKeys):
+        for key in self.reads:
+            if key != 'prevEmergency' and getattr(analyzeInfo, key) != self.DEFAULTS[key]:
+                return True
+
+        if self.firstEmergency != None and analyzeInfo.prevEmergency != '':
+            event, index, rawIndex = self.firstEmergency
+            if event == '':
+                return True
+            if event == analyzeInfo.prevEmergency:
+                # 제외되었어야 할 로그가 JSON 처리 대상인 경우
+                message = self.rawLogs[rawIndex][len(self.logs[index].strDateTime) + 3:]
+                if decodeFrame(message, res=True, bStrict=True) != None:
+                    return True
+
+        pendings = analyzeInfo.ocppUUIDs
+        if len(pendings) > 0:
+            for key in self.ocppUUIDs:
+                if key in pendings:
+                    return True
+
+            for uuid, messageId in self.lookups:
+                if uuid in pendings:
+                    return True
+
+            # 요청 키가 응답 UUID 에 부분 포함되는 경우 (길이가 같으면 일치 여부로 충분)
+            uuids = [lookup[0] for lookup in self.lookups] + [response[0] for response in self.responses]
+            maxLength = max((len(uuid) for uuid in uuids), default=0)
+            shortKeys = [key for key in pendings if len(key) < maxLength]
+            for uuid in uuids:
+                for key in shortKeys:
+                    if len(key) < len(uuid) and uuid.find(key) >= 0:
+                        return True
+
+        for lookup in self.lookups:
+            if lookup in requestKeys:
+                return True
+
+        return False
+
+    # 이전 파일까지의 결과에 연결 (rawLogs : 이전 파일 요청에 대한 응답 rawLogs 위치, rawLog)
+    def mergeInto(self, analyzeInfo, rawLogs):
+        removed = None
+        if self.firstEmergency != None and analyzeInfo.prevEmergency != '':
+            event, index, removed = self.firstEmergency
+            if event == analyzeInfo.prevEmergency:
+                del self.logs[index]
+                del self.rawLogs[removed]
+            else:
+                removed = None
+
+        for rawIndex, rawLog in reversed(rawLogs):
+            if removed != None and rawIndex > removed:
+                rawIndex -= 1
+            self.rawLogs.insert(rawIndex, rawLog)
+
+        start = len(analyzeInfo.logs)
+        analyzeInfo.logs.extend(self.logs)
+        analyzeInfo.indexLogs(start)
+        for rawLog in self.rawLogs:
+            analyzeInfo.addRaw(rawLog)
+        analyzeInfo.ocppUUIDs.update(self.ocppUUIDs)
+        analyzeInfo.requestTimes.update(self.requestTimes)
+        analyzeInfo.latestRequest = max(analyzeInfo.latestRequest, self.latestRequest)
+        if self.shortestKey != None and (analyzeInfo.shortestKey == None or self.shortestKey < analyzeInfo.shortestKey):
+            analyzeInfo.shortestKey = self.shortestKey
+
+        for key in self.DEFAULTS:
+            if key in self.writes or key in self.reads:
+                setattr(analyzeInfo, key, getattr(self, key))
 
 class Analyzed:
     _instance = None
     _lock = threading.Lock()
     _infos : Dict[str, AnalyzeInfo] = {}
+    _summarized = None      # Summary 시트까지 작성한 상세 파일 (경로, 크기, 수정 시간), 분석 결과가 바뀌면 초기화
 
     def __new__(cls):
         if cls._instance == None:
@@ -343,25 +1032,29 @@ class Analyzed:
             return {src: getattr(infos, "logs") for src, infos in self._infos.items()}.items()
 
     def set(self, key, value):
-        if type(value) == AnalyzeInfo:
+        if isinstance(value, AnalyzeInfo):
             with self._lock:
                 self._infos[key] = value
+                self._summarized = None
 
     def setLogs(self, key, index, value):
-        if type(value) == LogInfo:
+        if isinstance(value, LogRecord):
             with self._lock:
                 self._infos[key].logs[index] = value
+                self._summarized = None
 
     def append(self, key, log):
         with self._lock:
+            self._summarized = None
             infos = self._infos.get(key)
             if infos == None:
                 self._infos[key] = AnalyzeInfo()
                 infos = self._infos.get(key)
-            if type(log) == LogInfo:
-                infos.logs.append(copy.deepcopy(log))
+            # 로그는 복사하지 않고 그대로 보관 (추가 후 호출한 쪽에서 변경하지 않음)
+            if isinstance(log, LogRecord):
+                infos.addLog(log)
             elif type(log) == str:
-                infos.rawLogs.append(copy.deepcopy(log))
+                infos.rawLogs.append(log)
 
     def sizeLogs(self, key):
         with self._lock:
@@ -375,15 +1068,34 @@ class Analyzed:
         with self._lock:
             if target in self._infos:
                 del(self._infos[target])
+                self._summarized = None
 
     def clear(self):
         with self._lock:
             self._infos = {}
+            self._summarized = None
 
     def size(self):
         with self._lock:
             return len(self._infos)
 
+    # 현재 분석 결과로 Summary 시트까지 작성한 상세 파일 기록 (SCARCategorizer)
+    def setSummarized(self, path):
+        with self._lock:
+            self._summarized = summarizedStat(path)
+
+    # 상세 파일의 Summary 시트가 현재 분석 결과로 작성되었고 이후 파일이 바뀌지 않았는지
+    def isSummarized(self, path):
+        with self._lock:
+            return self._summarized != None and self._summarized == summarizedStat(path)
+
+def summarizedStat(path):
+    try:
+        stat = os.stat(path)
+        return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+    except OSError:
+        return None
+
 # 대상 파일 확인
 def getLogFiles():
     loadSiteList()
@@ -416,35 +1128,16 @@ def getLogFiles():
 
     # info(f'SrcPath - [{srcPaths}]')
 
-
-    for srcName, srcPath in srcPaths.items():
-        for path, folder, files in os.walk(srcPath):
-            for file in files:
-                if file.find(Config().logName) >= 0 and file.find(Config().zipExt) >= 0:
-                    full_path = os.path.join(path, file)
-
-                    #  zip 파일 유효성 검사
-                    if not zipfile.is_zipfile(full_path):
-                        print(f"⚠️ 유효하지 않은 zip 파일: {full_path}")
-                        continue
-                    try:
-                        with zipfile.ZipFile(full_path) as zip_file:
-                            zip_file.extractall(path=path)
-                            print(f" 압축 해제 완료: {file}")
-                    except zipfile.BadZipFile:
-                        print(f" 압축 해제 실패 (BadZipFile): {file}")
-                        continue
     LogList().fileCount = 0
     for srcName, srcPath in srcPaths.items():
         #info(f'SrcPath - [{srcName}] [{srcPath}]')
 
         for path, folder, files in os.walk(srcPath):
-            if not os.path.isfile(full_path):
-                continue
             srcFiles = []
             dstFiles = ''
 
             for file in files:
+                full_path = os.path.join(path, file)
                 print(f"[DEBUG] 검사 중: {full_path}")
 
                 if file.find(Config().dstFile) < 0:
@@ -461,12 +1154,24 @@ def getLogFiles():
                     print(f"  ✅ logExt 포함: {file}")
                 else:
                     print(f"  ❌ logExt 없음: {file}")
-                if file.find(Config().dstFile) < 0 and file.find(Config().logName) >= 0 and file.find(Config().logExt) >= 0:
-                    srcFiles.append(os.path.join(path, file))
-                    print(f'[{now()}] [SCARCommon] Src #{len(srcFiles)} [{os.path.join(path, file)}]')
+
+                # zip 파일은 압축 해제 없이 멤버를 가상 경로 (압축 파일 경로/멤버) 로 등록
+                logFiles = []
+                if file.find(Config().logName) >= 0 and file.find(Config().zipExt) >= 0:
+                    for memberName in Archives().members(full_path) or []:
+                        # 이미 압축 해제된 파일이 있는 경우 해당 파일 사용
+                        if isLogFile(os.path.basename(memberName)) == True and os.path.exists(os.path.join(path, memberName)) == False:
+                            logFiles.append((os.path.basename(memberName), os.path.join(full_path, memberName)))
+
+                elif isLogFile(file) == True:
+                    logFiles.append((file, full_path))
+
+                for fileName, filePath in logFiles:
+                    srcFiles.append(filePath)
+                    print(f'[{now()}] [SCARCommon] Src #{len(srcFiles)} [{filePath}]')
 
                     if len(srcName) <= 0:
-                        fileNames = parse('{dateTime}_{chargerId}_{etc}', file)
+                        fileNames = extract('FileName', fileName)
                         if fileNames != None:
                             if fileNames['chargerId'] in Config().siteList:
                                 srcName = Config().siteList[fileNames['chargerId']]
@@ -476,19 +1181,72 @@ def getLogFiles():
                             srcName = 'analyze'
 
             if len(srcFiles) > 0:
-                dstFileName = f'{srcName}{Config().dstFile}'
-                dstFiles = os.path.join(Config().logPath, dstFileName)
-                print(f'[{now()}] [SCARCommon] Dst #{len(LogList().dstDicts) + 1} [{os.path.join(Config().logPath, dstFileName)}]')
+                dstFiles = resultPath(srcName)
+                print(f'[{now()}] [SCARCommon] Dst #{len(LogList().dstDicts) + 1} [{dstFiles}]')
 
                 LogList().fileCount += len(srcFiles)
                 if srcName in LogList().srcDicts:
                     tempFiles = LogList().srcDicts[srcName]
                     srcFiles += tempFiles
-                LogList().srcDicts[srcName] = sorted(srcFiles)
+                LogList().srcDicts[srcName] = sorted(srcFiles, key=extractedPath)
                 LogList().dstDicts[srcName] = dstFiles
 
     print(f'[{now()}] [SCARCommon] Target - Src [{srcName}] File [{LogList().fileCount}]')
 
+# 결과 로그 압축 (gzip/zstd, zstandard 가 없으면 압축하지 않음)
+RESULT_EXTS = { 'gzip' : '.gz',
+                'zstd' : '.zst' }
+
+def resultCompress():
+    compress = Config().resultCompress
+    if compress not in RESULT_EXTS or (compress == 'zstd' and zstandard == None):
+        return ''
+    return compress
+
+def resultPath(name):
+    logFile = f'{name}{Config().dstFile}' if len(name) > 0 else f'analyze{Config().dstFile}'
+    return os.path.join(Config().logPath, logFile + RESULT_EXTS.get(resultCompress(), ''))
+
+# 분석 상태 캐시 경로 (CACHE_DIR/<로그 폴더 경로 해시>/<name>, 분석 대상 폴더에는 기록하지 않음)
+def cachePath(name, folder=None):
+    if folder == None:
+        folder = Config().logPath
+
+    key = hashlib.blake2b(os.path.normcase(os.path.abspath(folder)).encode('utf-8'), digest_size=8).hexdigest()
+    cacheDir = os.path.join(BASE_DIR, Config().cacheDir or 'cache', key)
+    os.makedirs(cacheDir, exist_ok=True)
+
+    return os.path.join(cacheDir, name)
+
+# 충전기별 상세 파일 경로 (DETAIL_SHARD, DetailResult.xlsx -> DetailResult_<충전기>.xlsx)
+def shardPath(name):
+    root, ext = os.path.splitext(Config().detailPath)
+    return f'{root}_{name}{ext}'
+
+def isLogFile(file):
+    return file.find(Config().dstFile) < 0 and file.find(Config().logName) >= 0 and file.find(Config().logExt) >= 0
+
+# 가상 경로 분리 (압축 파일 경로, 멤버 이름)
+def splitArchive(file):
+    zipExt = Config().zipExt or '.zip'
+
+    index = file.find(zipExt + os.sep)
+    while index >= 0:
+        archivePath = file[:index + len(zipExt)]
+        if os.path.isfile(archivePath) == True:
+            return archivePath, file[index + len(zipExt) + 1:]
+        index = file.find(zipExt + os.sep, index + 1)
+
+    return None, None
+
+# 압축 해제 시의 경로 (정렬, 인코딩 캐시 기준)
+def extractedPath(file):
+    archivePath, memberName = splitArchive(file)
+    if archivePath == None:
+        return file
+
+    return os.path.join(os.path.dirname(archivePath), memberName)
+
 def loadSiteList():
     workbook = None
     worksheet = None
@@ -520,6 +1278,24 @@ def getConfig():
         Config().dstFile    = config['DST_FILE']
         Config().siteFile   = config['SITE_FILE']
         Config().detailFile = config['DETAIL_FILE']
+        Config().manifestFile   = config.get('MANIFEST_FILE', '') or ''
+        Config().cacheDir       = config.get('CACHE_DIR', '') or ''
+        Config().requestExpiry  = config.get('REQUEST_EXPIRY', 0)
+        Config().resultCompress = config.get('RESULT_COMPRESS', '') or ''
+        Config().resultPreview  = config.get('RESULT_PREVIEW', 0)
+        Config().followState    = config.get('FOLLOW_STATE', '')
+        Config().followInterval = config.get('FOLLOW_INTERVAL', 1.0)
+        Config().followEvents   = config.get('FOLLOW_EVENTS', 10000)
+        Config().analyzeEngine  = config.get('ANALYZE_ENGINE', 'thread')
+        Config().analyzeWorkers = config.get('ANALYZE_WORKERS', 0)
+        Config().lazyEvents     = config.get('LAZY_EVENTS', False)
+        Config().codeFile       = config.get('CODE_FILE', 'SCARCodes.yaml')
+        Config().codeFirmware   = str(config.get('CODE_FIRMWARE', '') or '')
+        Config().detailShard    = config.get('DETAIL_SHARD', False)
+        Config().detailWorkers  = config.get('DETAIL_WORKERS', 0)
+        Config().detailExport   = config.get('DETAIL_EXPORT', 'xlsx') or 'xlsx'
+        Config().summaryExport  = config.get('SUMMARY_EXPORT', 'xlsx') or 'xlsx'
+        Config().summarySplit   = config.get('SUMMARY_SPLIT', False)
 
     except Exception as e:
         print(f'[{now()}] [SCARCommon] getConfig - Exception [{e}]')
@@ -540,44 +1316,92 @@ def setLogPath(path):
         print(f'[{now()}] [SCARCommon] setConfig - Exception [{e}]')
 
 # JSON 처리
-def parseJson(log, res=False):
+# OCPP-J 프레임 (2: CALL, 3: CALLRESULT, 4: CALLERROR)
+class OCPPFrame:
+    def __init__(self):
+        self.nMessageType = 0
+        self.strUUID      = ''
+        self.strAction    = ''
+        self.payload      = dict()
+        self.bSkipped     = False
+
+# 분석 대상에서 제외되는 TransactionEvent (payload 디코딩 생략)
+SKIP_METER_VALUE_PERIODIC = (re.compile(r'"eventType"\s*:\s*"Updated"'),
+                             re.compile(r'"triggerReason"\s*:\s*"MeterValuePeriodic"'))
+
+# 따옴표 앞의 역슬래시 (최대 3개) 를 제거하고 괄호에 붙은 따옴표 ("[  ]"  "{  }") 는 따옴표도 제거 (라인당 1회 탐색)
+UNESCAPE_JSON = re.compile(r'[\]}]\\{0,3}"|"[\[{]|\\{1,3}"[\[{]?')
+UNESCAPED_JSON = {}
+for count in range(4):
+    for bracket in ']}':
+        UNESCAPED_JSON[bracket + '\\' * count + '"'] = bracket
+    for bracket in '[{':
+        UNESCAPED_JSON['\\' * count + '"' + bracket] = bracket
+    if count > 0:
+        UNESCAPED_JSON['\\' * count + '"'] = '"'
+
+def unescapeJson(log):
+    if log.find('"') < 0:
+        return log
+
+    return UNESCAPE_JSON.sub(lambda match: UNESCAPED_JSON[match.group()], log)
+
+# 라인당 1회 디코딩 (res: CALLRESULT 형식, skip: 해당 패턴이 모두 포함되면 디코딩 생략, bStrict: 원본 라인도 JSON 이어야 함)
+#   bStrict 는 원본을 디코딩하지 않고 isJsonText 로 확인 (라인당 디코딩은 변환한 텍스트 1회)
+def decodeFrame(log, res=False, skip=None, bStrict=False):
     try:
-        log = log.replace('\\\\"', '"')
-        log = log.replace('\\"', '"')
-        log = log.replace('"[', '[')
-        log = log.replace(']"', ']')
-        log = log.replace('"{', '{')
-        log = log.replace('}"', '}')
-
-        if isJson(log) == False:
-            # info(f'parseJson - incomplete json')
-            return '', dict()
-
-        jArray  = json.loads(log)
-        UUID    = jArray[1]
+        text = unescapeJson(log)
+        if bStrict == True and text != log and isJsonText(log) == False:
+            return None
+
+        if skip != None and all(pattern.search(text) != None for pattern in skip):
+            frame = OCPPFrame()
+            frame.bSkipped = True
+            return frame
+
+        if text.lstrip(' \t\n\r')[:1] not in ('[', '{', '"'):
+            return None
+
+        try:
+            jArray = loadJson(text)
+        except Exception:
+            # info(f'decodeFrame - incomplete json')
+            return None
+
+        frame = OCPPFrame()
+        frame.nMessageType = jArray[0]
+        frame.strUUID      = jArray[1]
         if res == False:
-            jObject = jArray[3]
+            frame.strAction = jArray[2]
+            frame.payload   = jArray[3]
         else:
-            jObject = jArray[2]
+            frame.payload   = jArray[2]
 
-        return UUID, jObject
+        return frame
 
     except Exception as e:
-        print(f'[{now()}] [SCARCommon] parseJson - Exception [{e}]')
+        print(f'[{now()}] [SCARCommon] decodeFrame - Exception [{e}]')
+        return None
+
+def parseJson(log, res=False):
+    frame = decodeFrame(log, res)
+    if frame == None:
         return '', dict()
 
+    return frame.strUUID, frame.payload
+
 def parseTransactionReq(json):
     ocppInfo = OCPPMessageInfo()
 
     eventType = json.get('eventType')
     if eventType != None:
-        ocppInfo.strEventType = eventType
+        ocppInfo.strEventType = internStr(eventType)
 
     evse = json.get('evse')
     if evse != None:
         connectorId = evse.get('connectorId')
         if connectorId != None:
-            ocppInfo.strConnectorId = str(connectorId)
+            ocppInfo.strConnectorId = internStr(str(connectorId))
 
     meterValues = json.get('meterValue')
     if meterValues != None:
@@ -613,17 +1437,17 @@ def parseTransactionReq(json):
     if transactionInfo != None:
         chargingState = transactionInfo.get('chargingState')
         if chargingState != None:
-            ocppInfo.strChargingState = chargingState
+            ocppInfo.strChargingState = internStr(chargingState)
         stoppedReason = transactionInfo.get('stoppedReason')
         if stoppedReason != None:
-            ocppInfo.strStoppedReason = stoppedReason
+            ocppInfo.strStoppedReason = internStr(stoppedReason)
         transactionId = transactionInfo.get('transactionId')
         if transactionId != None:
             ocppInfo.strTransactionId = transactionId
 
     triggerReason = json.get('triggerReason')
     if triggerReason != None:
-            ocppInfo.strTriggerReason = triggerReason
+            ocppInfo.strTriggerReason = internStr(triggerReason)
 
     return ocppInfo
 
@@ -703,11 +1527,11 @@ def parseNotificationReq(json):
 
     connectorId = json.get('connectorId')
     if connectorId != None:
-        ocppInfo.strConnectorId = str(connectorId)
+        ocppInfo.strConnectorId = internStr(str(connectorId))
 
     connectorStatus = json.get('connectorStatus')
     if connectorStatus != None:
-        ocppInfo.strEventType = connectorStatus
+        ocppInfo.strEventType = internStr(connectorStatus)
 
     return ocppInfo
 
@@ -723,18 +1547,20 @@ def parseNotifyReq(json):
                 if evse != None:
                     connectorId = evse.get('connectorId')
                     if connectorId != None:
-                        ocppInfo.strConnectorId = str(connectorId)
+                        ocppInfo.strConnectorId = internStr(str(connectorId))
 
             techInfo = eventData.get('techInfo')
             if techInfo != None:
-                ocppInfo.strTriggerReason = techInfo
+                ocppInfo.strTriggerReason = internStr(techInfo)
 
     return ocppInfo
 
 def isJson(object):
     try:
-        jObject = json.loads(object)    # { } 가 포함된 string이 invalid json 인 경우 Exception
-        iterator = iter(jObject)        # { } 가 없는 경우는 string의 경우 Exception
+        if object.lstrip(' \t\n\r')[:1] not in ('[', '{', '"'):
+            return False                # 배열/객체/문자열이 아닌 경우 (iterable 아님)
+
+        jObject = loadJson(object)      # { } 가 포함된 string이 invalid json 인 경우 Exception
 
     except Exception as e:
         # info(f'Exception [{e}]')
@@ -742,22 +1568,115 @@ def isJson(object):
 
     return True
 
+# 원본 라인 JSON 확인 (디코딩 없이) : 문자열은 s, 숫자/리터럴은 0 으로 바꾼 뒤 배열/객체를 안쪽부터 0 으로 줄여 값 1개만 남는지 확인
+JSON_SCALAR = re.compile(r'[ \t\n\r]*(?:("(?:[^"\\\x00-\x1f]|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))*")'
+                         r'|-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?|true|false|null|NaN|-?Infinity)[ \t\n\r]*')
+JSON_CONTAINER = re.compile(r'\[(?:[s0](?:,[s0])*)?\]|\{(?:s:[s0](?:,s:[s0])*)?\}')
+JSON_SHAPE = re.compile(r'[s0\[\]{},:]*')
+
+def isJsonText(text):
+    if text.lstrip(' \t\n\r')[:1] not in ('[', '{', '"'):
+        return False
+
+    shape = JSON_SCALAR.sub(lambda match: 's' if match.group(1) != None else '0', text)
+    shape = shape.replace(' ', '').replace('\t', '').replace('\n', '').replace('\r', '')
+    if JSON_SHAPE.fullmatch(shape) == None:
+        return False
+
+    while len(shape) > 1:
+        reduced = JSON_CONTAINER.sub('0', shape)
+        if reduced == shape:
+            return False
+        shape = reduced
+
+    return shape in ('s', '0')
+
+# 표준 json 만 허용하는 값 (NaN / Infinity, 64비트 범위를 넘는 정수, 짝이 없는 서로게이트)
+JSON_FALLBACK = re.compile(r'NaN|Infinity|[0-9]{20}|\\u[dD][89a-fA-F]')
+
+# orjson 설치 시 우선 사용 (표준 json 만 허용하는 값이 있는 경우에만 표준 json 으로 재확인)
+def loadJson(text):
+    if orjson != None:
+        try:
+            return orjson.loads(text)
+        except ValueError:
+            if JSON_FALLBACK.search(text) == None:
+                raise
+
+    return json.loads(text)
+
+# 파일 기록용 JSON 문자열 (orjson 설치 시 우선 사용)
+def dumpJson(value):
+    if orjson != None:
+        try:
+            return orjson.dumps(value).decode('utf-8')
+        except TypeError:
+            pass
+
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
 def now():
     now = datetime.now()
     return now.isoformat()
 
+EPOCH        = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MILLISECOND  = timedelta(milliseconds=1)
+MINUTE_CACHE = 65536    # 분 단위 시간 캐시 최대 개수 (초과 시 비움)
+MINUTE_TIMES = {}       # 'YYYY-MM-DD HH:MM+HH:MM' -> epoch 밀리초
+TIME_ZONES   = {}       # 시간 오프셋 -> timezone
+
 def convertTime(strTime: str, nOffset: int = 9) -> str:
+    nTime = parseTime(strTime)
+    if nTime == None:
+        raise ValueError(f'convertTime - Exception [Invalid isoformat string: {strTime!r}]')
+
+    return formatTime(nTime, nOffset)
+
+# 로그 시간 -> epoch 밀리초 (형식이 맞지 않으면 None)
+# 충전기 로그 형식 ('YYYY-MM-DD HH:MM:SS.fff+HH:MM') 은 분 단위까지의 값을 캐시하고 초/밀리초만 더함
+def parseTime(strTime):
+    if len(strTime) == 29 and strTime[19] == '.':
+        digits = strTime[17:19] + strTime[20:23]
+        if digits.isdigit() == True and digits < '60000':
+            key = strTime[:16] + strTime[23:]
+            nMinute = MINUTE_TIMES.get(key)
+            if nMinute == None:
+                nMinute = parseIsoTime(key)
+                if len(MINUTE_TIMES) >= MINUTE_CACHE:
+                    MINUTE_TIMES.clear()
+                MINUTE_TIMES[key] = nMinute
+
+            if nMinute != None:
+                return nMinute + int(digits)
+
+    return parseIsoTime(strTime)
+
+def parseIsoTime(strTime):
     try:
-        utcTime = datetime.fromisoformat(strTime.replace('Z', '+00:00'))
+        dateTime = datetime.fromisoformat(strTime.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return None
 
-        zOffset = timezone(timedelta(hours=nOffset))
+    # 시간대가 없으면 로컬 시간
+    if dateTime.tzinfo == None:
+        dateTime = dateTime.astimezone()
 
-        # Convert to Asia/Seoul timezone
-        convertedTime = utcTime.astimezone(zOffset)
-        return convertedTime.strftime('%Y-%m-%d %H:%M:%S')
+    return (dateTime - EPOCH) // MILLISECOND
 
-    except Exception as e:
-        raise ValueError(f'convertTime - Exception [{e}]')
+# epoch 밀리초 -> 'YYYY-MM-DD HH:MM:SS' (nOffset 시간대, 초 미만 버림)
+def formatTime(nTime, nOffset=9):
+    if nTime == None:
+        return ''
+
+    zone = TIME_ZONES.get(nOffset)
+    if zone == None:
+        zone = TIME_ZONES.setdefault(nOffset, timezone(timedelta(hours=nOffset)))
+
+    return datetime.fromtimestamp(nTime // 1000, zone).strftime('%Y-%m-%d %H:%M:%S')
+
+# 두 시간 (epoch 밀리초) 의 차이 (초 단위로 버린 표시 시간 기준)
+def elapsedSecs(nTime1, nTime2):
+    return nTime1 // 1000 - nTime2 // 1000
 
 def calculateTime(strTime1, strTime2):
     time1 = datetime.fromisoformat(strTime1.replace('Z', '+00:00'))
@@ -773,209 +1692,10 @@ def secsToStr(seconds):
     return f'{hh:02}:{mm:02}:{ss:02}' if seconds > 0 else ''
 
 def finishToStr(finish):
-    dictFinishCode = {  '1' : 'FINISH_CODE_USER_STOP',
-                        '2' : 'FINISH_CODE_SESSION_STOP',
-                        '3' : 'FINISH_CODE_S3_STOP',
-                        '4' : 'FINISH_CODE_PAYMENT_TIMEOUT',
-                        '5' : 'FINISH_CODE_EV_STOP',
-                        '6' : 'FINISH_CODE_READY_TO_CHARGE_OFF' }
-    strFinishCode = ''
-    if finish in dictFinishCode:
-        strFinishCode = dictFinishCode[finish]
-    return strFinishCode
+    return CodeCatalog().decode('FINISH', finish)
 
 def errorToStr(error):
-    dictErrorCode = {   '3'    : 'ERR_CODE_PC_MC_CONTACT_ERR',
-                        '7'    : 'ERR_CODE_PWR_MD_AC_UNDER',
-                        '8'    : 'ERR_CODE_PWR_MD_AC_OVER',
-                        '10'   : 'ERR_CODE_OVER_VOLTAGE',
-                        '11'   : 'ERR_CODE_OVER_CURRENT',
-                        '13'   : 'ERR_CODE_EMG_SW_PUSH',
-                        '14'   : 'ERR_CODE_IMD_FAULT',
-                        '41'   : 'ERR_CODE_PRECHARGE_VOLTAGE_NOT_ENOUGH',
-                        '42'   : 'ERR_CODE_SECC_REPORTINIT_RES_TIMEOUT',
-                        '44'   : 'ERR_CODE_SECC_PRECOMMUNICATION_TIMEOUT',
-                        '45'   : 'ERR_CODE_SECC_CHARGE_PARAMETER_TIMEOUT',
-                        '46'   : 'ERR_CODE_SECC_CABLE_CHECK_TIMEOUT',
-                        '47'   : 'ERR_CODE_SECC_PRECHARGE_TIMEOUT',
-                        '48'   : 'ERR_CODE_SECC_CURRENT_DEMAND_TIMEOUT',
-                        '49'   : 'ERR_CODE_COUPLER_TEMP_HIGH',
-                        '53'   : 'ERR_CODE_CONTRACT_TIMEOUT',
-                        '54'   : 'ERR_CODE_CP_LEVEL_12V',
-                        '56'   : 'ERR_CODE_CP_LEVEL_PE',
-                        '74'   : 'ERR_CODE_PP_LEVEL',
-                        '97'   : 'ERR_CODE_MCU_HARD_FAULT',
-                        '121'  : 'ERR_CODE_HMI_COMMUNICATION',
-                        '218'  : 'ERR_CODE_IMD_COMMUNICATION',
-                        '242'  : 'ERR_CODE_DP_DOOR',
-                        '243'  : 'ERR_CODE_CP_DOOR',
-                        '244'  : 'ERR_CODE_BANK_ERROR',
-                        '245'  : 'ERR_CODE_IMD_STATE',
-                        '260'  : 'ERR_CODE_N_TEP_COMMUNICATION',
-                        '261'  : 'ERR_CODE_PC_COMMUNICATION',
-                        '262'  : 'ERR_CODE_PC_RELAYBOX_COMM_ERROR',
-                        '263'  : 'ERR_CODE_PC_ASSIGN_FAIL_ERROR',
-                        '264'  : 'ERR_CODE_PC_RELAYBOX_PWR_MD_FAULT',
-                        '265'  : 'ERR_CODE_PC_DC_SHORT',
-                        '266'  : 'ERR_CODE_PWR_MD',
-                        '270'  : 'ERR_CODE_DP_ID_COLISION',
-                        '271'  : 'ERR_CODE_SECC_ERRCODE',
-                        '272'  : 'ERR_CODE_SECC_READY_TO_CHARGE',
-                        '281'  : 'ERR_CODE_SECC_REQ_OVER_VOLTAGE',
-                        '282'  : 'ERR_CODE_SECC_OUT_MAX_PWR_OVER',
-                        '283'  : 'ERR_CODE_SECC_OUT_MAX_V_OVER',
-                        '284'  : 'ERR_CODE_SECC_OUT_MAX_A_OVER',
-                        '285'  : 'ERR_CODE_CP_FG_SHORT',
-                        '286'  : 'ERR_CODE_CABLECHECK_VOLTAGE_FLOAT',
-                        '287'  : 'ERR_CODE_IMD_VOLTAGE_ERR',
-                        '288'  : 'ERR_CODE_ADC_VOLTAGE_ERR',
-                        '289'  : 'ERR_CODE_ADC_CURRENT_ERR',
-                        '300'  : 'ERR_CODE_WARING_EV_MAX_VOLTAGE_OVER',
-                        '301'  : 'ERR_CODE_PB_ERR_ID_COLLISOIN',
-                        '302'  : 'ERR_CODE_PB_ERR_CAN1_COMM',
-                        '303'  : 'ERR_CODE_PB_ERR_CAN2_COMM',
-                        '304'  : 'ERR_CODE_PB_ERR_PS_LOGIC_COLLISION',
-                        '305'  : 'ERR_CODE_CH_ERR_ASSING_FAIL',
-                        '306'  : 'ERR_CODE_CHARGING_VOLTAGE_OUT_OF_RANGE',
-                        '307'  : 'ERR_CODE_EV_ERROR_Reserved_A',
-                        '308'  : 'ERR_CODE_EV_ERROR_Reserved_B',
-                        '309'  : 'ERR_CODE_CH_ERR_ALL_RLYBOX_ERR',
-                        '310'  : 'ERR_CODE_CHARGING_SYSTEM_INCOMPATIBILITY',
-                        '311'  : 'ERR_CODE_EV_NO_DATA',
-                        '1001' : 'ERR_CODE_OVER_HMI_PWR',
-                        '1002' : 'ERR_CODE_OVER_CPL_CUR',
-                        '1003' : 'ERR_CODE_OVER_CURRENT',
-                        '1101' : 'ERR_CODE_ELCB_SHUTDOWN',
-                        '1102' : 'ERR_CODE_FUSE_DISCONNECT',
-                        '1103' : 'ERR_CODE_AC_SPD_SHUTDOWN',
-                        '1104' : 'ERR_CODE_PWR_MD_AC_UNDER',
-                        '1105' : 'ERR_CODE_PWR_MD_AC_OVER',
-                        '1106' : 'ERR_CODE_PWR_MD_CUR_OVER',
-                        '1107' : 'ERR_CODE_PWR_MD_AC_CUR_OVER_L1',
-                        '1108' : 'ERR_CODE_PWR_MD_AC_CUR_OVER_L2',
-                        '1109' : 'ERR_CODE_PWR_MD_AC_CUR_OVER_L3',
-                        '1201' : 'ERR_CODE_NON_PWR_MD_IN_GRUP',
-                        '2001' : 'ERR_CODE_PWR_MD_01_DC_SHORT',
-                        '2002' : 'ERR_CODE_PWR_MD_02_DC_SHORT',
-                        '2003' : 'ERR_CODE_PWR_MD_03_DC_SHORT',
-                        '2004' : 'ERR_CODE_PWR_MD_04_DC_SHORT',
-                        '2005' : 'ERR_CODE_PWR_MD_05_DC_SHORT',
-                        '2006' : 'ERR_CODE_PWR_MD_06_DC_SHORT',
-                        '2007' : 'ERR_CODE_PWR_MD_07_DC_SHORT',
-                        '2008' : 'ERR_CODE_PWR_MD_08_DC_SHORT',
-                        '2101' : 'ERR_CODE_PWR_MD_01_SHORT_CIRCUIT',
-                        '2102' : 'ERR_CODE_PWR_MD_02_SHORT_CIRCUIT',
-                        '2103' : 'ERR_CODE_PWR_MD_03_SHORT_CIRCUIT',
-                        '2104' : 'ERR_CODE_PWR_MD_04_SHORT_CIRCUIT',
-                        '2105' : 'ERR_CODE_PWR_MD_05_SHORT_CIRCUIT',
-                        '2106' : 'ERR_CODE_PWR_MD_06_SHORT_CIRCUIT',
-                        '2107' : 'ERR_CODE_PWR_MD_07_SHORT_CIRCUIT',
-                        '2108' : 'ERR_CODE_PWR_MD_08_SHORT_CIRCUIT',
-                        '2201' : 'ERR_CODE_PWR_MD_01_BLEED_NOT_WORK',
-                        '2202' : 'ERR_CODE_PWR_MD_02_BLEED_NOT_WORK',
-                        '2203' : 'ERR_CODE_PWR_MD_03_BLEED_NOT_WORK',
-                        '2204' : 'ERR_CODE_PWR_MD_04_BLEED_NOT_WORK',
-                        '2205' : 'ERR_CODE_PWR_MD_05_BLEED_NOT_WORK',
-                        '2206' : 'ERR_CODE_PWR_MD_06_BLEED_NOT_WORK',
-                        '2207' : 'ERR_CODE_PWR_MD_07_BLEED_NOT_WORK',
-                        '2208' : 'ERR_CODE_PWR_MD_08_BLEED_NOT_WORK',
-                        '3001' : 'ERR_CODE_IMD_VOL_DAMAGE',
-                        '3101' : 'ERR_CODE_DC_METER_COMM',
-                        '3102' : 'ERR_CODE_DC_METER_VOL_DAMAGE',
-                        '3103' : 'ERR_CODE_DC_METER_CUR_DAMAGE',
-                        '4001' : 'ERR_CODE_WELDING_MC',
-                        '4101' : 'ERR_CODE_WELDING_RELAY01',
-                        '4102' : 'ERR_CODE_WELDING_RELAY02',
-                        '4103' : 'ERR_CODE_WELDING_RELAY03',
-                        '4104' : 'ERR_CODE_WELDING_RELAY04',
-                        '4105' : 'ERR_CODE_WELDING_RELAY05',
-                        '4106' : 'ERR_CODE_WELDING_RELAY06',
-                        '4201' : 'ERR_CODE_MALFUNC_MC',
-                        '4301' : 'ERR_CODE_MALFUNC_RELAY01',
-                        '4302' : 'ERR_CODE_MALFUNC_RELAY02',
-                        '4303' : 'ERR_CODE_MALFUNC_RELAY03',
-                        '4304' : 'ERR_CODE_MALFUNC_RELAY04',
-                        '4305' : 'ERR_CODE_MALFUNC_RELAY05',
-                        '4306' : 'ERR_CODE_MALFUNC_RELAY06',
-                        '4401' : 'ERR_CODE_TILT_SENSOR',
-                        '4404' : 'ERR_CODE_OVER_TEMP',
-                        '4410' : 'ERR_CODE_SUBMERSION_TEMP',
-                        '9001' : 'ERR_CODE_DUAL_1CHSINGLE_POWERSHARING_MALFUNC',
-                        '9002' : 'ERR_CODE_1CHSINGLE_DUAL_POWERSHARING_MALFUNC',
-                        '9003' : 'ERR_CODE_DUAL_2CHSINGLE_POWERSHARING_MALFUNC',
-                        '9004' : 'ERR_CODE_2CHSINGLE_DUAL_POWERSHARING_MALFUNC',
-                        '9011' : 'ERR_CODE_2CH_RELAY_MALFUNC',
-                        '9012' : 'ERR_CODE_1CH_RELAY_MALFUNC',
-                        '9013' : 'ERR_CODE_BRIDGE_RELAY_MALFUNC',
-                        '9100' : 'ERR_CODE_PWR_MD_NOT_AVAILABLE_MALFUNC'    }
-
-    strErrorCode = ''
-    if error in dictErrorCode:
-        strErrorCode = dictErrorCode[error]
-    return strErrorCode
+    return CodeCatalog().decode('ERROR', error)
 
 def errorPLCToStr(plc):
-    dictPLCCode = { '17'  : 'SECC_INIT_ERROR_IFADDR',
-                    '18'  : 'SECC_INIT_ERROR_THREAD',
-                    '19'  : 'SECC_INIT_ERROR_OPENCHANNEL',
-                    '20'  : 'SECC_INIT_ERROR_KEY',
-                    '33'  : 'SECC_SLAC_ERROR_TIMER_INIT',
-                    '34'  : 'SECC_SLAC_ERROR_TIMER_TIMEOUT',
-                    '36'  : 'SECC_SLAC_ERROR_PARAM_TIMEOUT',
-                    '37'  : 'SECC_SLAC_ERROR_PARAM_SOCKET',
-                    '38'  : 'SECC_SLAC_ERROR_START_ATTEN_CHAR_TIMEOUT',
-                    '39'  : 'SECC_SLAC_ERROR_MNBC_SOUND_TIMEOUT',
-                    '40'  : 'SECC_SLAC_ERROR_ATTEN_CHAR_TIMEOUT',
-                    '41'  : 'SECC_SLAC_ERROR_ATTEN_CHAR_SOCKET',
-                    '47'  : 'SECC_SLAC_ERROR_MATCH_TIMEOUT',
-                    '48'  : 'SECC_SLAC_ERROR_MATCH_SOCKET',
-                    '51'  : 'SECC_SLAC_ERROR_MATCH_TIMEOUT2',
-                    '65'  : 'SECC_SDP_ERROR_INIT_SOCKET',
-                    '66'  : 'SECC_SDP_ERROR_INIT_SOCKOPT1',
-                    '67'  : 'SECC_SDP_ERROR_INIT_SOCKOPT2',
-                    '68'  : 'SECC_SDP_ERROR_INIT_BIND',
-                    '69'  : 'SECC_SDP_ERROR_THREAD_SOCKET1',
-                    '70'  : 'SECC_SDP_ERROR_THREAD_SOCKET2',
-                    '71'  : 'SECC_SDP_ERROR_TIMEOUT',
-                    '80'  : 'SECC_DIN_ERROR_GENERAL',
-                    '81'  : 'SECC_DIN_ERROR_INIT_SOCKET',
-                    '82'  : 'SECC_DIN_ERROR_INIT_SOCKOPT',
-                    '83'  : 'SECC_DIN_ERROR_INIT_BIND',
-                    '84'  : 'SECC_DIN_ERROR_INIT_LISTEN',
-                    '85'  : 'SECC_DIN_ERROR_INIT_SELECT',
-                    '86'  : 'SECC_DIN_ERROR_INIT_ACCEPT',
-                    '87'  : 'SECC_DIN_ERROR_TIMEOUT',
-                    '88'  : 'SECC_DIN_ERROR_V2GTP_HEADER',
-                    '89'  : 'SECC_DIN_ERROR_V2GTP_HEADER_LEN',
-                    '90'  : 'SECC_DIN_ERROR_DECODE_EXI',
-                    '91'  : 'SECC_DIN_ERROR_CREATE_RESPONSE',
-                    '92'  : 'SECC_DIN_ERROR_ENCODE_EXI',
-                    '93'  : 'SECC_DIN_ERROR_V2GTP_HEADER_WRITE',
-                    '94'  : 'SECC_DIN_ERROR_SOCKET_EXCEPTION',
-                    '95'  : 'SECC_DIN_ERROR_SOCKET_SEND',
-                    '96'  : 'SECC_DIN_ERROR_NO_PROTOCOL',
-                    '128' : 'SECC_TLS_ERROR_HELLO_REQUEST',
-                    '129' : 'SECC_TLS_ERROR_CLIENT_HELLO',
-                    '130' : 'SECC_TLS_ERROR_SERVER_HELLO',
-                    '131' : 'SECC_TLS_ERROR_SERVER_CERTIFICATE',
-                    '132' : 'SECC_TLS_ERROR_SERVER_KEY_EXCHANGE',
-                    '133' : 'SECC_TLS_ERROR_CERTIFICATE_REQUEST',
-                    '134' : 'SECC_TLS_ERROR_SERVER_HELLO_DONE',
-                    '135' : 'SECC_TLS_ERROR_CLIENT_CERTIFICATE',
-                    '136' : 'SECC_TLS_ERROR_CLIENT_KEY_EXCHANGE',
-                    '137' : 'SECC_TLS_ERROR_CERTIFICATE_VERIFY',
-                    '138' : 'SECC_TLS_ERROR_CLIENT_CHANGE_CIPHER_SPEC',
-                    '139' : 'SECC_TLS_ERROR_CLIENT_FINISHED',
-                    '140' : 'SECC_TLS_ERROR_SERVER_CHANGE_CIPHER_SPEC',
-                    '141' : 'SECC_TLS_ERROR_SERVER_FINISHED',
-                    '142' : 'SECC_TLS_ERROR_FLUSH_BUFFERS',
-                    '143' : 'SECC_TLS_ERROR_HANDSHAKE_WRAPUP',
-                    '144' : 'SECC_TLS_ERROR_HANDSHAKE_OVER',
-                    '145' : 'SECC_TLS_ERROR_SERVER_NEW_SESSION_TICKET',
-                    '146' : 'SECC_TLS_ERROR_SERVER_HELLO_VERIFY_REQUEST_SENT',
-                    '147' : 'SECC_TLS_ERROR_ALERT_FATAL'    }
-
-    strPLCCode = ''
-    if plc in dictPLCCode:
-        strPLCCode = dictPLCCode[plc]
-    return strPLCCode
+    return CodeCatalog().decode('PLC', plc)
@@ -0,0 +1,143 @@
+import csv
+import json
+import os
+
+from SCARCommon import *
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+EXPORT_BATCH = 4096     # Parquet 행 그룹 단위 (행 수)
+
+def info(log):
+    if log[:1] == '\n':
+        print('')
+        log = log.replace('\n', '')
+
+    print(f'[{now()}] [SCARExporter] {log}')
+
+# 중복된 열 이름은 순번을 붙여 구분 ('Connection' -> 'Connection #1', 'Connection #2')
+def exportColumns(columns):
+    columns = list(columns)
+    for column in set(columns):
+        if columns.count(column) > 1:
+            nth = 0
+            for index, name in enumerate(columns):
+                if name == column:
+                    nth += 1
+                    columns[index] = f'{column} #{nth}'
+    return columns
+
+# 내보내기 파일 경로 (DetailResult.xlsx -> DetailResult.<name>.<ext>)
+def exportPath(name, ext):
+    root, _ = os.path.splitext(Config().detailPath)
+    return f'{root}.{name}{ext}'
+
+# 임시 파일에 기록 후 완료 시 내보내기 파일로 변경 (중간에 실패하면 이전 파일 유지)
+class FileExporter :
+
+    def __init__(self, path):
+        self.path    = path
+        self.tmpPath = f'{path}.tmp'
+
+    def closeFile(self):
+        pass
+
+    def close(self):
+        self.closeFile()
+        os.replace(self.tmpPath, self.path)
+
+    # 내보내기 실패 시 임시 파일 삭제
+    def abort(self):
+        try:
+            self.closeFile()
+        except Exception as e:
+            info(f'abort - Close Exception [{self.tmpPath}] [{e}]')
+
+        if os.path.exists(self.tmpPath) == True:
+            os.remove(self.tmpPath)
+
+class CsvExporter(FileExporter) :
+    ext = '.csv'
+
+    def __init__(self, path, columns):
+        super().__init__(path)
+
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        self.file   = open(self.tmpPath, 'w', newline='', encoding='utf-8-sig')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(columns)
+
+    def write(self, values):
+        self.writer.writerow(['' if value == None else value for value in values])
+
+    def closeFile(self):
+        self.file.close()
+
+class JsonLinesExporter(FileExporter) :
+    ext = '.jsonl'
+
+    def __init__(self, path, columns):
+        super().__init__(path)
+
+        self.file    = open(self.tmpPath, 'w', encoding='utf-8')
+        self.columns = columns
+
+    def write(self, values):
+        self.file.write(json.dumps(dict(zip(self.columns, values)), ensure_ascii=False, default=str))
+        self.file.write('\n')
+
+    def closeFile(self):
+        self.file.close()
+
+# 모든 열을 문자열로 기록 (시트에 표시되는 값과 동일)
+class ParquetExporter(FileExporter) :
+    ext = '.parquet'
+
+    def __init__(self, path, columns):
+        super().__init__(path)
+
+        self.columns = columns
+        self.schema  = pyarrow.schema([(column, pyarrow.string()) for column in columns])
+        self.writer  = pyarrow.parquet.ParquetWriter(self.tmpPath, self.schema)
+        self.batch   = [[] for _ in columns]
+
+    def write(self, values):
+        for batch, value in zip(self.batch, values):
+            batch.append(str(value) if value != None else None)
+
+        if len(self.batch[0]) >= EXPORT_BATCH:
+            self.flush()
+
+    def flush(self):
+        if len(self.batch[0]) > 0:
+            self.writer.write_table(pyarrow.Table.from_arrays(self.batch, schema=self.schema))
+            self.batch = [[] for _ in self.columns]
+
+    def close(self):
+        self.flush()
+        super().close()
+
+    def closeFile(self):
+        self.writer.close()
+
+EXPORTERS = { 'csv'     : CsvExporter,
+              'jsonl'   : JsonLinesExporter,
+              'parquet' : ParquetExporter }
+
+# 'xlsx' 는 기존 엑셀 출력, Parquet 은 pyarrow 가 설치된 경우만 사용
+def isExportFormat(format):
+    if format == 'xlsx':
+        return True
+    if format == 'parquet':
+        return pyarrow != None
+    return format in EXPORTERS
+
+def makeExporter(format, name, columns):
+    exporter = EXPORTERS[format]
+    path = exportPath(name, exporter.ext)
+    info(f'makeExporter [{format}] [{path}]')
+    return exporter(path, exportColumns(columns))
@@ -0,0 +1,352 @@
+import os
+import threading
+import time
+
+from SCARCommon import *
+from SCARAnalyzer import SCARAnalyzer
+from SCARReader import BLOCK_SIZE, detectEncoding, isCompressed, isWideEncoding, splitLine
+
+from collections import deque
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
+MAX_PENDING    = 1000       # 응답 대기 요청 최대 수 (초과 시 오래된 요청부터 제외)
+LATENCY_WINDOW = 1000       # 지연 통계 계산에 사용할 최근 이벤트 수
+STATE_VERSION  = 5
+
+def info(log):
+    if log[:1] == '\n':
+        print('')
+        log = log.replace('\n', '')
+
+    print(f'[{now()}] [SCARFollower] {log}')
+
+class FollowEvent:
+    def __init__(self, nSeq, strSrc, logInfo, bUpdated, fLatency):
+        self.nSeq     = nSeq
+        self.strSrc   = strSrc
+        self.logInfo  = logInfo
+        self.bUpdated = bUpdated        # 응답 수신으로 갱신된 요청 로그
+        self.fLatency = fLatency        # 파일 기록 (mtime) 부터 발행까지 (초)
+
+# 응답으로 갱신된 요청 로그 위치 기록
+@plainType
+class FollowAnalyzeInfo(AnalyzeInfo):
+    def __init__(self):
+        super().__init__()
+        self.updated = []
+
+    def setResponse(self, index, strResponse, strTime):
+        super().setResponse(index, strResponse, strTime)
+        self.updated.append(index)
+
+# 충전기별 추적 상태 (파일, 바이트 오프셋, 분석 상태)
+@plainType
+class FollowState:
+    def __init__(self, strSrc, folders):
+        self.strSrc      = strSrc
+        self.folders     = folders
+        self.strFile     = None
+        self.fileId      = None         # (st_dev, st_ino)
+        self.nOffset     = 0
+        self.analyzeInfo = FollowAnalyzeInfo()
+
+class LatencyStats:
+    def __init__(self):
+        self.nCount   = 0
+        self.fMax     = 0.0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def add(self, fLatency):
+        self.nCount += 1
+        self.fMax = max(self.fMax, fLatency)
+        self.latencies.append(fLatency)
+
+    def get(self):
+        latencies = sorted(self.latencies)
+        if len(latencies) <= 0:
+            return { 'count' : self.nCount, 'max' : self.fMax }
+
+        return { 'count' : self.nCount,
+                 'max'   : self.fMax,
+                 'mean'  : sum(latencies) / len(latencies),
+                 'p50'   : latencies[len(latencies) // 2],
+                 'p95'   : latencies[min(len(latencies) - 1, len(latencies) * 95 // 100)] }
+
+class SCARFollower :
+
+    followEvent = None
+
+    def __init__(self, analyzer=None):
+        self.analyzer = analyzer if analyzer != None else SCARAnalyzer()
+
+        self.states   = {}
+        self.handles  = {}
+        self.unsupported = set()
+        self.events   = deque(maxlen=Config().followEvents if Config().followEvents > 0 else 10000)
+        self.latency  = LatencyStats()
+        self.nSeq     = 0
+
+        self.lock     = threading.Lock()
+        self.stopped  = threading.Event()
+        self.inotify  = None
+
+    def set_follow_event_callback(self, callback):
+        self.followEvent = callback
+
+    # 실시간 분석 (stop 호출 전까지 추가된 줄을 분석하여 이벤트 발행)
+    def follow(self, interval=None):
+        interval = interval if interval != None else Config().followInterval
+
+        self.stopped.clear()
+        self.load()
+        self.watch()
+
+        info(f'Follow - Start [{Config().logPath}] Src [{len(self.states)}] Interval [{interval}] Notify [{self.inotify != None}]')
+        while self.stopped.is_set() == False:
+            if self.poll() == True:
+                self.save()
+            self.wait(interval)
+
+        for handle in self.handles.values():
+            handle.close()
+        self.handles = {}
+        self.save()
+        info(f'Follow - Stop')
+
+    def stop(self):
+        self.stopped.set()
+
+    # 대상 충전기 (getLogFiles 결과의 경로)
+    def watch(self):
+        for srcName, srcFiles in LogList().srcDicts.items():
+            folders = sorted(set(os.path.dirname(file) for file in srcFiles if isCompressed(file) == False))
+            if srcName not in self.states:
+                self.states[srcName] = FollowState(srcName, folders)
+            else:
+                self.states[srcName].folders = folders
+
+        if INotify != None and self.inotify == None:
+            try:
+                self.inotify = INotify()
+                for state in self.states.values():
+                    for folder in state.folders:
+                        self.inotify.add_watch(folder, flags.MODIFY | flags.CREATE | flags.MOVED_TO)
+            except Exception as e:
+                info(f'watch - inotify Exception [{e}]')
+                self.inotify = None
+
+    def wait(self, interval):
+        if self.inotify != None:
+            self.inotify.read(timeout=int(interval * 1000))
+        else:
+            self.stopped.wait(interval)
+
+    def poll(self):
+        bChanged = False
+        for state in list(self.states.values()):
+            try:
+                bChanged = self.pollSrc(state) or bChanged
+            except Exception as e:
+                info(f'poll - Exception [{state.strSrc}] [{e}]')
+
+        return bChanged
+
+    # 현재 파일의 추가된 줄 처리, 회전 (이름 변경/잘림/새 파일) 확인
+    def pollSrc(self, state):
+        bChanged = False
+        while True:
+            if state.strFile == None or os.path.exists(state.strFile) == False:
+                files = self.listFiles(state)
+                if len(files) <= 0:
+                    return bChanged
+                self.open(state, max(files, key=os.path.getmtime), 0)
+
+            bChanged = self.readAppended(state) or bChanged
+
+            nextFile = self.rotated(state)
+            if nextFile == None:
+                return bChanged
+
+            info(f'pollSrc - Rotate [{state.strSrc}] [{state.strFile}] -> [{nextFile}]')
+            self.open(state, nextFile, 0)
+            bChanged = True
+
+    def listFiles(self, state):
+        files = []
+        for folder in state.folders:
+            try:
+                for file in os.listdir(folder):
+                    if isLogFile(file) == True and isCompressed(file) == False:
+                        files.append(os.path.join(folder, file))
+            except FileNotFoundError:
+                continue
+
+        return sorted(files)
+
+    def open(self, state, file, nOffset):
+        handle = self.handles.pop(state.strSrc, None)
+        if handle != None:
+            handle.close()
+
+        handle = open(file, 'rb')
+        stat = os.fstat(handle.fileno())
+        if state.strFile == file and state.fileId == (stat.st_dev, stat.st_ino) and stat.st_size >= nOffset:
+            handle.seek(nOffset)
+        else:
+            nOffset = 0
+
+        state.strFile = file
+        state.fileId  = (stat.st_dev, stat.st_ino)
+        state.nOffset = nOffset
+        self.handles[state.strSrc] = handle
+
+    # 현재 파일을 끝까지 읽은 뒤 다음에 읽을 파일 (없으면 None)
+    def rotated(self, state):
+        try:
+            stat = os.stat(state.strFile)
+        except FileNotFoundError:
+            stat = None
+
+        # 이름 변경 후 같은 이름으로 새 파일 생성
+        if stat != None and (stat.st_dev, stat.st_ino) != state.fileId:
+            return state.strFile
+
+        # 잘린 경우 (copytruncate) 처음부터
+        if stat != None and stat.st_size < state.nOffset:
+            state.fileId = None
+            return state.strFile
+
+        # 날짜별 새 파일 (이름이 뒤에 오고 현재 파일 이후에 기록된 파일)
+        files = [file for file in self.listFiles(state) if file > state.strFile and os.path.getmtime(file) >= stat.st_mtime] if stat != None else []
+        if len(files) > 0:
+            return files[0]
+
+        return None
+
+    def readAppended(self, state):
+        handle = self.handles.get(state.strSrc)
+        if handle == None:
+            self.open(state, state.strFile, state.nOffset)
+            handle = self.handles[state.strSrc]
+
+        fileEncoding = detectEncoding(state.strFile)
+        if isWideEncoding(fileEncoding) == True:
+            if state.strFile not in self.unsupported:
+                self.unsupported.add(state.strFile)
+                info(f'readAppended - Unsupported Encoding [{state.strFile}] [{fileEncoding}]')
+            return False
+
+        bChanged = False
+        while True:
+            handle.seek(state.nOffset)
+            block = handle.read(BLOCK_SIZE)
+            fWritten = os.fstat(handle.fileno()).st_mtime
+
+            # 완성된 줄까지만 처리 (개행 없이 블록을 넘는 줄은 그대로 처리)
+            end = block.rfind(b'\n') + 1
+            if end <= 0 and len(block) >= BLOCK_SIZE:
+                end = len(block)
+            if end <= 0:
+                return bChanged
+
+            lines = []
+            for rawLine in block[:end].splitlines(True):
+                lines += splitLine(rawLine.decode(fileEncoding or 'utf-8', errors='replace'))
+
+            self.analyze(state, lines, fWritten)
+            state.nOffset += end
+            bChanged = True
+
+    # 추가된 줄 분석 후 새 로그/응답으로 갱신된 요청 로그 발행
+    # 추적 결과는 충전기별 추적 상태에만 보관 (일괄 분석 결과 (Analyzed) 는 변경하지 않음)
+    def analyze(self, state, lines, fWritten):
+        analyzeInfo = state.analyzeInfo
+
+        start = len(analyzeInfo.logs)
+        for line in lines:
+            self.analyzer.analyzeLog(analyzeInfo, line)
+
+        for index in sorted(set(index for index in analyzeInfo.updated if index < start)):
+            self.publish(state.strSrc, analyzeInfo.logs[index], True, fWritten)
+        for logInfo in analyzeInfo.logs[start:]:
+            self.publish(state.strSrc, logInfo, False, fWritten)
+
+        analyzeInfo.updated = []
+        self.compact(analyzeInfo)
+
+    # 응답 대기 중인 요청 로그만 유지 (메모리 제한)
+    def compact(self, analyzeInfo):
+        analyzeInfo.expireRequests(Config().requestExpiry)
+        while len(analyzeInfo.ocppUUIDs) > MAX_PENDING:
+            del analyzeInfo.ocppUUIDs[next(iter(analyzeInfo.ocppUUIDs))]
+
+        analyzeInfo.logs = [logInfo for logInfo in analyzeInfo.logs
+                            if analyzeInfo.ocppUUIDs.get(logInfo.ocppMessage.strUUID) == logInfo.ocppMessage.strMessageId]
+        analyzeInfo.indexLogs()
+        analyzeInfo.rawLogs = []
+
+    def publish(self, strSrc, logInfo, bUpdated, fWritten):
+        fLatency = max(0.0, time.time() - fWritten)
+        with self.lock:
+            self.nSeq += 1
+            event = FollowEvent(self.nSeq, strSrc, logInfo, bUpdated, fLatency)
+            self.events.append(event)
+            self.latency.add(fLatency)
+
+        if self.followEvent :
+            self.followEvent(event)
+
+    # 발행된 이벤트 (nSeq 이후)
+    def getEvents(self, nSeq=0):
+        with self.lock:
+            return [event for event in self.events if event.nSeq > nSeq]
+
+    def getStats(self):
+        with self.lock:
+            stats = self.latency.get()
+
+        stats['sources'] = { state.strSrc : { 'file' : state.strFile, 'offset' : state.nOffset, 'pending' : len(state.analyzeInfo.ocppUUIDs) }
+                             for state in list(self.states.values()) }
+        return stats
+
+    # 추적 상태 파일 (로그 폴더가 아닌 캐시 경로)
+    def statePath(self):
+        if Config().followState == None or len(Config().followState) <= 0:
+            return None
+
+        return cachePath(Config().followState)
+
+    # 오프셋/분석 상태 복원 (파일이 같고 오프셋 이상인 경우에만 이어서 읽음)
+    def load(self):
+        path = self.statePath()
+        if path == None or os.path.exists(path) == False:
+            return
+
+        try:
+            with open(path, encoding='utf-8') as f:
+                saved = loadJson(f.read())
+
+            if saved.get('version') == STATE_VERSION:
+                self.states = fromPlain(saved['states'])
+                self.nSeq   = saved['seq']
+                info(f'load - [{path}] Src [{len(self.states)}]')
+
+        except Exception as e:
+            info(f'load - Exception [{path}] [{e}]')
+
+    def save(self):
+        path = self.statePath()
+        if path == None:
+            return
+
+        try:
+            with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+                f.write(dumpJson({ 'version' : STATE_VERSION, 'seq' : self.nSeq, 'states' : toPlain(self.states) }))
+            os.replace(f'{path}.tmp', path)
+
+        except Exception as e:
+            info(f'save - Exception [{path}] [{e}]')
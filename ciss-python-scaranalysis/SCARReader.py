@@ -0,0 +1,536 @@
+import chardet
+import codecs
+import gzip
+import hashlib
+import io
+import mmap
+import os
+import re
+import threading
+import zipfile
+
+from collections import OrderedDict
+from SCARCommon import *
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+SAMPLE_SIZE = 64 * 1024     # 인코딩 판별용 앞/뒤 샘플 크기
+WRITE_SIZE  = 1024 * 1024   # 결과 로그 쓰기 버퍼 크기
+BLOCK_SIZE  = 4 * 1024 * 1024   # 바이트 선별용 블록 크기 (줄 단위로 끊음)
+SPAN_HANDLES = 16               # 지연 생성 로그 원본 읽기용으로 열어 둘 최대 파일 수
+MANIFEST_VERSION = 6            # 파일 단위 분석 결과 형식이 바뀌면 증가 (이전 매니페스트 무시)
+
+# 바이트 선별이 가능한 인코딩 (ASCII 호환, '\n' / ':' / '0' 이 멀티바이트 문자 안에 나오지 않음)
+RECORD_ENCODINGS = ('ascii', 'utf-8', 'utf-8-sig', 'euc_kr', 'cp949', 'euc_jp', 'shift_jis', 'cp932',
+                    'gb2312', 'gbk', 'gb18030', 'big5', 'big5hkscs', 'koi8-r', 'koi8-u', 'tis-620')
+
+# 이전 줄에 이어 붙는 줄 (빈 줄 제외, ':00][' 가 없거나 줄 맨 앞에 있는 경우)
+CONTINUATION = re.compile(rb'\n(?!\r?(?:\n|\Z))(?::00\]\[|(?![^\n]*:00\]\[))')
+# JSON 으로 디코딩될 수 있는 메시지 ([F1]/[F3] 뒤 첫 글자)
+JSON_MESSAGE = rb'\[F[13]\] [ \t\x0b\x0c\r]*[\[{"\\\x00-\x09\x0b-\x1f\x80-\xff]'
+
+def info(log):
+    if log[:1] == '\n':
+        print('')
+        log = log.replace('\n', '')
+
+    print(f'[{now()}] [SCARReader] {log}')
+
+class Encodings:
+    _instance = None
+    _lock = threading.Lock()
+    _encodings : Dict[str, str] = {}
+
+    def __new__(cls):
+        if cls._instance == None:
+            with cls._lock:
+                if cls._instance == None:
+                    cls._instance = super(Encodings, cls).__new__(cls)
+        return cls._instance
+
+    def get(self, key):
+        with self._lock:
+            return self._encodings.get(key)
+
+    def set(self, key, value):
+        with self._lock:
+            self._encodings[key] = value
+
+    def clear(self):
+        with self._lock:
+            self._encodings = {}
+
+# 파일 단위 분석 결과 캐시 (경로 -> 크기, 수정 시각, 내용 해시, 분석 결과 (toPlain 형식))
+class Manifest:
+    _instance = None
+    _lock = threading.Lock()
+    _path = None
+    _files : Dict[str, tuple] = {}
+    _dirty = False
+
+    def __new__(cls):
+        if cls._instance == None:
+            with cls._lock:
+                if cls._instance == None:
+                    cls._instance = super(Manifest, cls).__new__(cls)
+        return cls._instance
+
+    def load(self, path):
+        with self._lock:
+            if self._path == path:
+                return
+            self._path  = path
+            self._files = {}
+            self._dirty = False
+
+        try:
+            with open(path, encoding='utf-8') as f:
+                manifest = loadJson(f.read())
+
+            # 지연 생성 로그 설정이 다르면 결과 형식이 다르므로 사용하지 않음
+            if manifest.get('version') == MANIFEST_VERSION and manifest.get('lazyEvents') == Config().lazyEvents:
+                with self._lock:
+                    self._files = { file : tuple(entry) for file, entry in manifest['files'].items() }
+
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            info(f'Manifest - Load Exception [{path}] [{e}]')
+
+    # 분석 전에 구한 지문 (분석 중 추가된 내용은 다음 분석에서 변경으로 처리)
+    def fingerprint(self, file):
+        return fileStat(file) + (fileHash(file),)
+
+    # 변경되지 않은 파일의 분석 결과 (크기/수정 시각이 다르면 내용 해시로 확인)
+    def get(self, file):
+        with self._lock:
+            entry = self._files.get(file)
+        if entry == None:
+            return None
+
+        size, mtime, digest, result = entry
+        try:
+            stat = fileStat(file)
+            if stat != (size, mtime):
+                if fileHash(file) != digest:
+                    return None
+
+                with self._lock:
+                    self._files[file] = stat + (digest, result)
+                    self._dirty = True
+
+            return fromPlain(result)
+
+        except Exception as e:
+            info(f'Manifest - Get Exception [{file}] [{e}]')
+            return None
+
+    # 연결 (stitch) 과정에서 결과가 변경되므로 저장 시점에 JSON 형식으로 변환
+    def set(self, file, fingerprint, partial):
+        plain = toPlain(partial)
+        with self._lock:
+            self._files[file] = fingerprint + (plain,)
+            self._dirty = True
+
+    # 현재 대상 파일만 유지하여 저장 (변경된 내용이 없으면 저장하지 않음)
+    def save(self, files):
+        with self._lock:
+            if any(file not in files for file in self._files):
+                self._files = {file: entry for file, entry in self._files.items() if file in files}
+                self._dirty = True
+
+            if self._dirty == False or self._path == None:
+                return
+
+            manifest = { 'version' : MANIFEST_VERSION, 'lazyEvents' : Config().lazyEvents, 'files' : dict(self._files) }
+            path = self._path
+            self._dirty = False
+
+        try:
+            with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+                f.write(dumpJson(manifest))
+            os.replace(f'{path}.tmp', path)
+
+        except Exception as e:
+            info(f'Manifest - Save Exception [{path}] [{e}]')
+
+    def clear(self):
+        with self._lock:
+            self._path  = None
+            self._files = {}
+            self._dirty = False
+
+# 결과 로그 기록 (임시 파일에 순서대로 기록 후 완료 시 결과 파일로 변경, 첫 줄 기록 시 생성)
+class ResultWriter:
+    def __init__(self, path, compress=''):
+        self.path     = path
+        self.tmpPath  = f'{path}.tmp'
+        self.compress = compress
+        self.handle   = None
+        self.nLines   = 0
+
+    def open(self):
+        if self.compress == 'gzip':
+            return gzip.open(self.tmpPath, 'wt')
+        elif self.compress == 'zstd':
+            return zstandard.open(self.tmpPath, 'wt')
+
+        return open(self.tmpPath, 'w', buffering=WRITE_SIZE)
+
+    def write(self, rawLog):
+        if self.handle == None:
+            self.handle = self.open()
+
+        self.handle.write(rawLog + '\n')
+        self.nLines += 1
+
+    def close(self):
+        if self.handle == None:
+            self.handle = self.open()
+
+        self.handle.close()
+        self.handle = None
+        os.replace(self.tmpPath, self.path)
+
+    # 분석 중단 시 임시 파일 삭제 (이전 결과 파일 유지)
+    def abort(self):
+        if self.handle != None:
+            self.handle.close()
+            self.handle = None
+
+        if os.path.exists(self.tmpPath) == True:
+            os.remove(self.tmpPath)
+
+# 지연 생성 로그의 원본 파일 (분석 시점과 크기/수정 시각이 다르면 읽지 않음)
+@plainType
+class LazySource:
+    def __init__(self, file, fileEncoding):
+        self.file         = file
+        self.fileEncoding = fileEncoding
+        self.stat         = fileStat(file)
+
+    # 매니페스트에는 경로/인코딩만 보관 (내용 해시로 확인한 뒤 복원하므로 현재 파일 상태 사용)
+    def plainState(self):
+        return { 'file' : self.file, 'fileEncoding' : self.fileEncoding }
+
+    @classmethod
+    def fromPlainState(cls, state):
+        return cls(state['file'], state['fileEncoding'])
+
+    # (위치, 크기) 의 줄 목록 (readRecords 와 같이 줄 단위로 디코딩)
+    def readLines(self, nOffset, nSize):
+        block = Spans().read(self, nOffset, nSize)
+
+        lines = []
+        start = 0
+        while start < len(block):
+            end = block.find(b'\n', start) + 1
+            if end <= 0:
+                end = len(block)
+
+            lines.extend(splitLine(block[start:end].decode(self.fileEncoding or 'utf-8')))
+            start = end
+
+        return lines
+
+# 지연 생성 로그 원본 읽기 (최근 사용한 파일 SPAN_HANDLES 개는 열어 둠)
+class Spans:
+    _instance = None
+    _lock = threading.Lock()
+    _handles = OrderedDict()
+
+    def __new__(cls):
+        if cls._instance == None:
+            with cls._lock:
+                if cls._instance == None:
+                    cls._instance = super(Spans, cls).__new__(cls)
+        return cls._instance
+
+    def read(self, source, nOffset, nSize):
+        if fileStat(source.file) != source.stat:
+            raise ValueError(f'source changed [{source.file}]')
+
+        with self._lock:
+            handle = self._handles.pop(source.file, None)
+            if handle == None:
+                handle = open(source.file, 'rb')
+            self._handles[source.file] = handle
+
+            while len(self._handles) > SPAN_HANDLES:
+                self._handles.popitem(last=False)[1].close()
+
+            handle.seek(nOffset)
+            return handle.read(nSize)
+
+    def clear(self):
+        with self._lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles = OrderedDict()
+
+def fileStat(file):
+    archivePath, memberName = splitArchive(file)
+    stat = os.stat(archivePath or file)
+    return stat.st_size, stat.st_mtime_ns
+
+def fileHash(file):
+    digest = hashlib.blake2b(digest_size=16)
+    with openLog(file) as f:
+        chunk = f.read(BLOCK_SIZE)
+        while len(chunk) > 0:
+            digest.update(chunk)
+            chunk = f.read(BLOCK_SIZE)
+
+    return digest.hexdigest()
+
+# 인코딩 캐시 키 (충전기 경로, zip 멤버는 압축 해제 시의 경로 기준)
+def encodingKey(file):
+    return os.path.dirname(extractedPath(file))
+
+# 인코딩 판별 (충전기 경로 단위 캐시)
+def detectEncoding(file):
+    key = encodingKey(file)
+
+    fileEncoding = Encodings().get(key)
+    if fileEncoding == None:
+        fileEncoding = sampleEncoding(readSample(file))
+        Encodings().set(key, fileEncoding)
+
+    return fileEncoding
+
+def readSample(file):
+    with openLog(file) as f:
+        head = f.read(SAMPLE_SIZE)
+
+        tail = b''
+        if isCompressed(file) == True:
+            # 압축 스트림은 끝까지 읽으며 마지막 샘플만 유지
+            chunk = f.read(SAMPLE_SIZE)
+            while len(chunk) > 0:
+                tail = (tail + chunk)[-SAMPLE_SIZE:]
+                chunk = f.read(SAMPLE_SIZE)
+        else:
+            size = os.fstat(f.fileno()).st_size
+            if size > SAMPLE_SIZE * 2:
+                f.seek(size - SAMPLE_SIZE)
+                tail = f.read(SAMPLE_SIZE)
+            elif size > SAMPLE_SIZE:
+                tail = f.read()
+
+    return head, tail
+
+def sampleEncoding(sample):
+    head, tail = sample
+
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    if isUtf8(head, tail):
+        return 'utf-8'
+
+    return chardet.detect(head + tail)['encoding']
+
+def isUtf8(head, tail):
+    try:
+        # 샘플 경계에서 잘린 멀티바이트 문자는 무시
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+        codecs.getincrementaldecoder('utf-8')().decode(tail.lstrip(bytes(range(0x80, 0xC0))), final=False)
+    except UnicodeDecodeError:
+        return False
+
+    return True
+
+def isWideEncoding(fileEncoding):
+    return fileEncoding != None and fileEncoding.lower().replace('-', '').startswith(('utf16', 'utf32'))
+
+def isCompressed(file):
+    return file.endswith('.gz') or splitArchive(file)[0] != None
+
+# 로그 파일 열기 (zip 멤버, .gz 는 압축 해제 없이 스트림으로 읽음)
+def openLog(file):
+    archivePath, memberName = splitArchive(file)
+    if archivePath != None:
+        # 멤버 스트림이 닫힐 때까지 압축 파일은 열린 상태로 유지됨
+        with zipfile.ZipFile(archivePath) as zipFile:
+            return zipFile.open(memberName)
+
+    if file.endswith('.gz'):
+        return gzip.open(file, 'rb')
+
+    return open(file, 'rb')
+
+# 로그 라인 읽기 (디코딩 실패 시에만 재판별)
+def readLines(file, fileEncoding, offset=0):
+    if isWideEncoding(fileEncoding):
+        with io.TextIOWrapper(openLog(file), encoding=fileEncoding) as f:
+            yield from f
+        return
+
+    with openLog(file) as f:
+        f.seek(offset)
+        for rawLine in f:
+            try:
+                line = rawLine.decode(fileEncoding or 'utf-8')
+            except UnicodeDecodeError:
+                position = f.tell()
+                fallback = chardet.detect(rawLine + f.read(SAMPLE_SIZE))['encoding']
+                f.seek(position)
+
+                if fallback == None or fallback.lower() == (fileEncoding or 'utf-8').lower():
+                    raise
+
+                info(f'readLines - Fallback [{file}] [{fileEncoding}] -> [{fallback}]')
+                fileEncoding = fallback
+                Encodings().set(encodingKey(file), fileEncoding)
+                line = rawLine.decode(fileEncoding)
+
+            yield from splitLine(line)
+
+# 텍스트 모드와 동일한 개행 처리
+def splitLine(line):
+    if line.find('\r') < 0:
+        yield line
+    else:
+        lines = line.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        for subLine in lines[:-1]:
+            yield subLine + '\n'
+        if len(lines[-1]) > 0:
+            yield lines[-1]
+
+def isRecordEncoding(fileEncoding):
+    try:
+        name = codecs.lookup(fileEncoding or 'utf-8').name
+    except LookupError:
+        return False
+
+    return name in RECORD_ENCODINGS or name.startswith(('iso8859-', 'cp125'))
+
+# 키 메시지 마커 + JSON 메시지 패턴
+def compileMarkers(markers):
+    return re.compile(b'|'.join([re.escape(marker.encode('ascii')) for marker in markers] + [JSON_MESSAGE]))
+
+# 분석에 필요한 줄만 디코딩 (줄 번호, 줄, 읽은 스트림 내 (위치, 크기) : 기존 방식으로 읽은 줄은 None)
+# 마커/JSON 메시지 줄, 이어지는 줄과 그 앞 줄, 블록의 마지막 줄 외의 일반 로그는 분석 결과가 없으므로 건너뜀
+def readRecords(file, fileEncoding, pattern):
+    if isRecordEncoding(fileEncoding) == False:
+        for lineNumber, line in enumerate(readLines(file, fileEncoding), 1):
+            yield lineNumber, line, None
+        return
+
+    bBom = codecs.lookup(fileEncoding or 'utf-8').name == 'utf-8-sig'
+
+    lineNumber = 0
+    for blockStart, block in readBlocks(file):
+        if isPlainBlock(block, fileEncoding) == False:
+            # 디코딩 실패/단독 '\r' 이 있는 경우 이후는 기존 방식으로 처리
+            for index, line in enumerate(readLines(file, fileEncoding, blockStart), lineNumber + 1):
+                yield index, line, None
+            return
+
+        prevStart = 0
+        for start in selectLines(block, pattern, bBom):
+            index = lineNumber + block.count(b'\n', prevStart, start) + 1
+            lineNumber, prevStart = index - 1, start
+
+            end = block.find(b'\n', start) + 1
+            if end <= 0:
+                end = len(block)
+
+            for line in splitLine(block[start:end].decode(fileEncoding or 'utf-8')):
+                yield index, line, (blockStart + start, end - start)
+
+        lineNumber += block.count(b'\n', prevStart)
+
+# 줄 단위로 끊은 블록 (시작 위치, 블록) : 일반 파일은 mmap, 압축 스트림은 순차 읽기
+def readBlocks(file):
+    if isCompressed(file) == True:
+        with openLog(file) as f:
+            blockStart = 0
+            block = f.read(BLOCK_SIZE)
+            while len(block) > 0:
+                if block.endswith(b'\n') == False:
+                    block += f.readline()
+
+                yield blockStart, block
+                blockStart += len(block)
+                block = f.read(BLOCK_SIZE)
+        return
+
+    with open(file, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            blockStart = 0
+            while blockStart < size:
+                blockEnd = mm.find(b'\n', min(blockStart + BLOCK_SIZE, size) - 1) + 1
+                if blockEnd <= 0:
+                    blockEnd = size
+
+                yield blockStart, mm[blockStart:blockEnd]
+                blockStart = blockEnd
+
+def isPlainBlock(block, fileEncoding):
+    if block.find(b'\r') >= 0 and block.count(b'\r') != block.count(b'\r\n'):
+        return False
+
+    if block.isascii() == True:
+        return True
+
+    try:
+        block.decode(fileEncoding or 'utf-8')
+    except UnicodeDecodeError:
+        return False
+
+    return True
+
+def isBlank(block, start, end):
+    return block[start:end] in (b'', b'\n', b'\r\n')
+
+def lineStart(block, position):
+    return block.rfind(b'\n', 0, position) + 1
+
+# 블록 내 디코딩 대상 줄 시작 위치
+def selectLines(block, pattern, bBom):
+    starts = set()
+
+    for match in pattern.finditer(block):
+        starts.add(lineStart(block, match.start()))
+
+    # 이어지는 줄과 그 앞의 (빈 줄이 아닌) 줄
+    continuations = [match.start() + 1 for match in CONTINUATION.finditer(block)]
+    firstEnd = block.find(b'\n') + 1 or len(block)
+    if isBlank(block, 0, firstEnd) == False and (block.startswith(b':00][') or block.find(b':00][', 0, firstEnd) < 0):
+        continuations.append(0)
+
+    for start in continuations:
+        starts.add(start)
+
+        end = start - 1
+        while end >= 0:
+            prev = lineStart(block, end)
+            if isBlank(block, prev, end + 1) == False:
+                starts.add(prev)
+                break
+            end = prev - 1
+
+    # 블록의 마지막 (빈 줄이 아닌) 줄 : 다음 블록/파일의 이어지는 줄 처리용
+    end = len(block)
+    while end > 0:
+        prev = lineStart(block, end - 1)
+        if isBlank(block, prev, end) == False:
+            starts.add(prev)
+            break
+        end = prev
+
+    if bBom == True:
+        position = block.find(codecs.BOM_UTF8)
+        while position >= 0:
+            starts.add(lineStart(block, position))
+            position = block.find(codecs.BOM_UTF8, position + 1)
+
+    return sorted(starts)
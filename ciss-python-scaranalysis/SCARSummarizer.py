@@ -1,10 +1,9 @@
-import copy
 import os
 
 from SCARCommon import *
 
-from openpyxl import load_workbook, Workbook, styles, utils
-from parse import *
+from SCARExporter import EXPORTERS, exportPath, isExportFormat, makeExporter
+from SCARWriter import SheetWriter, streamWorkbook
 
 
 def info(log):
@@ -14,6 +13,14 @@ def info(log):
 
     print(f'[{now()}] [SCARSummarizer] {log}')
 
+# 요약 파일 경로 : 기본은 상세 파일의 Summary 시트, 내보내기 형식이나 SUMMARY_SPLIT 이면 별도 파일 (DetailResult.summary.<ext>)
+def summaryPath():
+    if Config().summaryExport != 'xlsx':
+        return exportPath('summary', EXPORTERS[Config().summaryExport].ext)
+    if Config().summarySplit == True or Config().detailExport != 'xlsx':
+        return exportPath('summary', '.xlsx')
+    return Config().detailPath
+
 class SCARSummarizer():
 
     summarizeCompleted = None
@@ -30,16 +37,11 @@ class SCARSummarizer():
         self.strPrevious  = {}
 
         self.workbook     = None
-        self.worksheet    = None
-        self.cellColor    = None
-        self.fontColor    = None
+        self.writer       = None
 
         self.summaryColumn = ['Charger', 'Plug #', 'Card', 'Extra Data', 'Start Date', 'End Date', 'Total Time', 'Charging Time', 'Total kWh',
                             'TransactionId', 'StoppedReason', 'Command', 'FromStatus', 'ToStatus', 'SoC', 'Finish', 'Error', 'ErrorPLC', 'Detail', 'SequenceName1', 'SequenceName2']
 
-        self.borderThin = styles.Side(border_style='thin', color='000000')
-        self.borderThick = styles.Side(border_style='thick', color='000000')
-
     def run(self):
         while True:
             if self.runSummarize == True:
@@ -56,39 +58,102 @@ class SCARSummarizer():
         self.reasonInfos.clear()
         self.transactionInfos.clear()
 
-        self.makeWorkbook()
+        # 데이터만 필요한 경우 엑셀 대신 열 형식 파일로 내보내기
+        if Config().summaryExport != 'xlsx':
+            self.exportSummary()
+        elif summaryPath() != Config().detailPath:
+            self.makeWorkbook()
+        else:
+            self.makeDetail()
 
-    def makeWorkbook(self):
+    def setExport(self, format):
+        if isExportFormat(format) == False:
+            info(f'setExport - Invalid Format [{format}]')
+            return False
+
+        Config().summaryExport = format
+        return True
+
+    # 엑셀 대신 열 형식 파일로 요약 내보내기 (summaryColumn)
+    def exportSummary(self):
         print('')
 
-        info(f'makeWorkbook - Detail [{Config().detailPath}]')
+        try:
+            self.collectSummary()
+
+            exporter = makeExporter(Config().summaryExport, 'summary', self.summaryColumn)
+            try:
+                for summaryInfo in self.sortedSummaries():
+                    exporter.write(self.summaryRow(summaryInfo))
+
+                exporter.close()
+            except Exception:
+                exporter.abort()
+                raise
+
+            if self.summarizeCompleted :
+                self.summarizeCompleted(True)
+        except Exception as e:
+            info(f'exportSummary - Export Error [{e}]')
+            if self.summarizeCompleted :
+                self.summarizeCompleted(False)
 
-        if os.path.exists(Config().detailPath) == False:
+    # 상세 워크북을 불러와 수정하지 않고 상세 시트와 Summary 시트를 한 워크북으로 다시 스트리밍 작성
+    def makeDetail(self):
+        print('')
+
+        # 분석 결과가 없으면 기존 상세 파일을 빈 워크북으로 덮어쓰지 않음
+        if Analyzed().size() <= 0:
+            info(f'makeDetail - No Analyzed Logs [{Config().detailPath}]')
+            if self.summarizeCompleted :
+                self.summarizeCompleted(False)
             return
 
-        if os.path.isdir(Config().detailPath) == False:
-            self.workbook = load_workbook(Config().detailPath)
-        else:
-            info(f'Invalid File State [{Config().detailPath}]')
+        # 상세 파일 작성 시 현재 분석 결과로 Summary 시트를 이미 채운 경우
+        if Analyzed().isSummarized(Config().detailPath) == True:
+            info(f'makeDetail - Summary Up To Date [{Config().detailPath}]')
+            if self.summarizeCompleted :
+                self.summarizeCompleted(True)
             return
 
-        worksheet = None
-        for name in self.workbook.sheetnames:
-            if name == 'Summary':
-                worksheet = self.workbook[name]
-                break
+        from SCARCategorizer import SCARCategorizer     # SCARCategorizer 가 이 모듈을 import
 
-        if worksheet == None:
-            self.workbook.create_sheet('Summary')
+        bCompleted = SCARCategorizer().makeWorkbook()
+        if self.summarizeCompleted :
+            self.summarizeCompleted(bCompleted)
 
-        self.worksheet = self.workbook['Summary']
+    # 상세 워크북 작성 시 첫 시트로 만든 Summary 시트 채우기 (SCARCategorizer)
+    def writeSummary(self, writer):
+        self.summaryInfos.clear()
+        self.reasonInfos.clear()
+        self.transactionInfos.clear()
 
-        # Detail Sheet
+        self.writer = writer
+        self.collectSummary()
+        self.makeSummary()
+        self.writer = None
+
+    # 요약만 별도 파일로 스트리밍 작성 (SUMMARY_SPLIT, DetailResult.summary.xlsx)
+    def makeWorkbook(self):
+        print('')
+
+        strPath = summaryPath()
+        info(f'makeWorkbook - Summary [{strPath}]')
+
+        if os.path.isdir(strPath) == True:
+            info(f'Invalid File State [{strPath}]')
+            return
+
+        self.workbook = streamWorkbook()
+        self.writer = SheetWriter(self.workbook, 'Summary')
+
+        # Summary Sheet
+        self.collectSummary()
         self.makeSummary()
 
         # Completed
         try:
-            self.workbook.save(Config().detailPath)
+            self.workbook.save(strPath)
             if self.summarizeCompleted :
                 self.summarizeCompleted(True)
         except PermissionError:
@@ -96,47 +161,48 @@ class SCARSummarizer():
             if self.summarizeCompleted :
                 self.summarizeCompleted(False)
 
-    def makeSummary(self):
+        self.writer = None
+        self.workbook = None
+
+    def collectSummary(self):
         for srcName, logInfos in Analyzed().getLogs():
-            info(f'makeSummary [{srcName}] [{len(logInfos)}]')
+            info(f'collectSummary [{srcName}] [{len(logInfos)}]')
 
             self.transactionInfos.clear()
             self.reasonInfos.clear()
 
             for index, logInfo in enumerate(logInfos):
-                if type(logInfo) != LogInfo:
+                if isinstance(logInfo, LogRecord) == False:
                     continue
 
                 # info(f'Raw    [{index}] -                 Finish [{logInfo.connector2.strCodeFinish}] Error [{logInfo.connector2.strCodeError}] PLC [{logInfo.connector2.strCodeErrorPLC}]')
 
                 if logInfo.ocppMessage.strMessageId == 'Authorize':
-                    ocppResponse = parse('{date} {response}', logInfo.ocppMessage.strResponse)
+                    ocppResponse = extract('Response', logInfo.ocppMessage.strResponse)
                     if ocppResponse != None and ocppResponse['response'] != 'Accepted':
-                        summaryInfo = SummaryInfo()
-                        summaryInfo.strCharger = srcName
-                        summaryInfo.strConnectorId = '1'
-                        summaryInfo.strCard = logInfo.ocppMessage.strIdTag
-                        summaryInfo.strExtraData = 'Authorization Failure Reason: Card not found'
-                        summaryInfo.strCellColor = 'FF9999'
-                        summaryInfo.strStartDate = convertTime(logInfo.ocppMessage.strResponseTime)
-                        summaryInfo.strEndDate = summaryInfo.strStartDate
-                        summaryInfo.strTarget = logInfo.strTarget
-                        self.summaryInfos.append(copy.deepcopy(summaryInfo))
-
-                        summaryInfo.strConnectorId = '2'
-                        self.summaryInfos.append(copy.deepcopy(summaryInfo))
+                        for strConnectorId in ['1', '2']:
+                            summaryInfo = SummaryInfo()
+                            summaryInfo.strCharger = srcName
+                            summaryInfo.strConnectorId = strConnectorId
+                            summaryInfo.strCard = logInfo.ocppMessage.strIdTag
+                            summaryInfo.strExtraData = 'Authorization Failure Reason: Card not found'
+                            summaryInfo.strCellColor = 'FF9999'
+                            summaryInfo.nStartTime = parseTime(logInfo.ocppMessage.strResponseTime)
+                            summaryInfo.nEndTime = summaryInfo.nStartTime
+                            summaryInfo.strTarget = logInfo.strTarget
+                            self.summaryInfos.append(summaryInfo)
 
                 elif logInfo.ocppMessage.strMessageId == 'TransactionEvent':
                     if logInfo.ocppMessage.strEventType == 'Started':
                         summaryInfo = SummaryInfo()
                         summaryInfo.strCharger = srcName
                         summaryInfo.strConnectorId = logInfo.ocppMessage.strConnectorId
-                        summaryInfo.strStartDate = convertTime(logInfo.strDateTime)
+                        summaryInfo.nStartTime = logInfo.nTime
                         summaryInfo.strStartkWh = logInfo.ocppMessage.strMeterValue
                         summaryInfo.strTransactionId = logInfo.ocppMessage.strTransactionId
                         summaryInfo.strTarget = logInfo.strTarget
 
-                        self.transactionInfos[logInfo.ocppMessage.strTransactionId] = copy.deepcopy(summaryInfo)
+                        self.transactionInfos[logInfo.ocppMessage.strTransactionId] = summaryInfo
 
                         if summaryInfo.strConnectorId in self.reasonInfos:
                             del(self.reasonInfos[summaryInfo.strConnectorId])
@@ -150,27 +216,27 @@ class SCARSummarizer():
                         if logInfo.ocppMessage.strTransactionId not in self.transactionInfos.keys():
                             continue
 
-                        summaryInfo = copy.deepcopy(self.transactionInfos[logInfo.ocppMessage.strTransactionId])
+                        # 진행 중인 거래 정보는 transactionInfos 에서 직접 갱신
+                        summaryInfo = self.transactionInfos[logInfo.ocppMessage.strTransactionId]
                         if logInfo.ocppMessage.strChargingState == 'Charging':
-                            summaryInfo.strChargingDate = convertTime(logInfo.strDateTime)
+                            summaryInfo.nChargingTime = logInfo.nTime
 
                         bBad, strResponse = logInfo.ocppMessage.getBadResponse(bSub=True)
                         if bBad == True and len(strResponse) > 0:
                             summaryInfo.strSubReason = strResponse
 
-                        self.transactionInfos[logInfo.ocppMessage.strTransactionId] = copy.deepcopy(summaryInfo)
-
                     elif logInfo.ocppMessage.strEventType == 'Ended' and logInfo.ocppMessage.bOffline == False:
                         if logInfo.ocppMessage.strTransactionId in self.transactionInfos.keys():
-                            summaryInfo = copy.deepcopy(self.transactionInfos[logInfo.ocppMessage.strTransactionId])
+                            summaryInfo = self.transactionInfos[logInfo.ocppMessage.strTransactionId]
                             summaryInfo.strCard = logInfo.ocppMessage.strIdTag
-                            summaryInfo.strEndDate = convertTime(logInfo.strDateTime)
+                            summaryInfo.nEndTime = logInfo.nTime
                             summaryInfo.strEndkWh = logInfo.ocppMessage.strMeterValue
                             summaryInfo.strStopReason = logInfo.ocppMessage.strStoppedReason
 
+                            # 종료된 거래로 원인 정보 이전 (아래에서 reasonInfos 에서 제거)
                             for connectorId, reasonInfo in self.reasonInfos.items():
                                 if summaryInfo.strConnectorId == connectorId:
-                                    summaryInfo.reasonInfo = copy.deepcopy(reasonInfo)
+                                    summaryInfo.reasonInfo = reasonInfo
                                     break
 
                             # if summaryInfo.strConnectorId in self.reasonInfos:
@@ -178,8 +244,6 @@ class SCARSummarizer():
                             # info(f'Ended  [{index}] - ConnectorId [{summaryInfo.strConnectorId}] Finish [{reasonInfo.strCodeFinish}] Error [{reasonInfo.strCodeError}] PLC [{reasonInfo.strCodeErrorPLC}]')
                             # print('')
 
-                            self.transactionInfos[logInfo.ocppMessage.strTransactionId] = copy.deepcopy(summaryInfo)
-
                             if logInfo.ocppMessage.strStoppedReason == 'StoppedByEV':
                                 summaryInfo.strExtraData = 'Stop Reason: The transaction was stopped by the EV'
                             elif logInfo.ocppMessage.strStoppedReason == 'DeAuthorized':
@@ -296,98 +360,96 @@ class SCARSummarizer():
                     self.reasonInfos['2'].strSequenceName1 = logInfo.connector2.strSequenceName1
                     self.reasonInfos['2'].strSequenceName2 = logInfo.connector2.strSequenceName2
 
-        self.fontColor = None
+    # 표시되는 시작 시간 (초 단위) 순서, 같은 초는 추가된 순서
+    def sortedSummaries(self):
+        summaryInfos = sorted(self.summaryInfos, key=lambda x: x.nStartTime // 1000, reverse=False)
+        decodeDetailCodes([summaryInfo.reasonInfo for summaryInfo in summaryInfos])
+        return summaryInfos
+
+    # 요약 시트 / 내보내기 공통 행 값 (summaryColumn 순서)
+    def summaryRow(self, summaryInfo):
+        reasonInfo = summaryInfo.reasonInfo
+
+        return [summaryInfo.strCharger,                     # 'Charger'
+                summaryInfo.strConnectorId,                 # 'Plug'
+                summaryInfo.strCard,                        # 'Card'
+                summaryInfo.strExtraData,                   # 'Extra Data'
+                summaryInfo.strStartDate,                   # 'Start Date'
+                summaryInfo.strEndDate,                     # 'End Date'
+                secsToStr(summaryInfo.getTotalTime()),      # 'Total Time'
+                secsToStr(summaryInfo.getChargingTime()),   # 'Charging Time'
+                summaryInfo.getTotalkWh(),                  # 'Total kWh'
+                summaryInfo.strTransactionId,               # 'TransactionId'
+                summaryInfo.strStopReason,                  # 'StopReason'
+                reasonInfo.strCommand,                      # 'Command'
+                reasonInfo.strPreviousStatus,               # 'FromStatus'
+                reasonInfo.strCurrentStatus,                # 'ToStatus'
+                reasonInfo.strSoC,                          # 'SoC'
+                reasonInfo.getCodeFinish(),                 # 'Finish'
+                reasonInfo.getCodeError(),                  # 'Error'
+                reasonInfo.getCodeErrorPLC(),               # 'ErrorPLC'
+                reasonInfo.getDetailCode(),                 # 'DetailCode'
+                reasonInfo.getSequenceName1(),              # 'SequenceName1'
+                reasonInfo.getSequenceName2()]              # 'SequenceName2'
 
-        self.worksheet.merge_cells(start_row=2, start_column=3, end_row=2, end_column=10)
-        self.setWorkcell(2, 3, f'Server', color='D8D8D8')
+    def makeSummary(self):
+        self.writer.mergeCells(start_row=2, start_column=3, end_row=2, end_column=10)
+        self.setWorkcell(2, 3, f'Server', style='SCAR Header')
 
-        self.worksheet.cell(2, 11).border = styles.Border(left=self.borderThin)
-        self.worksheet.merge_cells(start_row=2, start_column=11, end_row=2, end_column=20)
-        self.setWorkcell(2, 11, f'System Log', color='D8D8D8')
+        self.writer.mergeCells(start_row=2, start_column=11, end_row=2, end_column=20)
+        self.setWorkcell(2, 11, f'System Log', style='SCAR Header Left')
 
-        self.worksheet.cell(2, 21).border = styles.Border(left=self.borderThin)
-        self.worksheet.merge_cells(start_row=2, start_column=21, end_row=2, end_column=22)  # end_column=50
-        self.setWorkcell(2, 21, f'Sequence Info', color='D8D8D8')
+        self.writer.mergeCells(start_row=2, start_column=21, end_row=2, end_column=22)  # end_column=50
+        self.setWorkcell(2, 21, f'Sequence Info', style='SCAR Header Left')
 
         index = 0
         for column in self.summaryColumn:
-            self.setWorkcell(3, 2 + index, column, color='D8D8D8')
-
-            border = None
             if index == 9 or index == 19:
-                border = self.borderThin
-            self.worksheet.cell(3, 2 + index).border = styles.Border(left=border, bottom=self.borderThick)
+                self.setWorkcell(3, 2 + index, column, style='SCAR Title Left')
+            else:
+                self.setWorkcell(3, 2 + index, column, style='SCAR Title')
 
             index += 1
 
-        index = 0
-        for summaryInfo in sorted(self.summaryInfos, key=lambda x: getattr(x, 'strStartDate'), reverse=False):
-            self.cellColor = None
-            if index % 2 == 1:
-                self.cellColor = 'F2F2F2'
+        self.writer.formats.firstColumn = 2
+        self.writer.formats.stripeRows(4)
 
+        index = 0
+        for summaryInfo in self.sortedSummaries():
+            # 강조 행 배경은 줄무늬보다 우선
             if len(summaryInfo.strCellColor) > 0:
-                self.cellColor = summaryInfo.strCellColor
-
-            self.setWorkcell(4 + index, 2, summaryInfo.strCharger)                      # 'Charger'
-            self.setWorkcell(4 + index, 3, summaryInfo.strConnectorId)                  # 'Plug'
-            self.setWorkcell(4 + index, 4, summaryInfo.strCard)                         # 'Card'
-            self.setWorkcell(4 + index, 5, summaryInfo.strExtraData, link=summaryInfo.getHyperLink())   # 'Extra Data'
-            self.setWorkcell(4 + index, 6, summaryInfo.strStartDate)                    # 'Start Date'
-            self.setWorkcell(4 + index, 7, summaryInfo.strEndDate)                      # 'End Date'
-            self.setWorkcell(4 + index, 8, secsToStr(summaryInfo.getTotalTime()))       # 'Total Time'
-            self.setWorkcell(4 + index, 9, secsToStr(summaryInfo.getChargingTime()))    # 'Charging Time'
-            self.setWorkcell(4 + index, 10, summaryInfo.getTotalkWh())                  # 'Total kWh'
-            self.setWorkcell(4 + index, 11, summaryInfo.strTransactionId)               # 'TransactionId'
-            self.setWorkcell(4 + index, 12, summaryInfo.strStopReason)                  # 'StopReason'
-            self.setWorkcell(4 + index, 13, summaryInfo.reasonInfo.strCommand)          # 'Command'
-            self.setWorkcell(4 + index, 14, summaryInfo.reasonInfo.strPreviousStatus)   # 'FromStatus'
-            self.setWorkcell(4 + index, 15, summaryInfo.reasonInfo.strCurrentStatus)    # 'ToStatus'
-            self.setWorkcell(4 + index, 16, summaryInfo.reasonInfo.strSoC)              # 'SoC'
-            self.setWorkcell(4 + index, 17, summaryInfo.reasonInfo.getCodeFinish())     # 'Finish'
-            self.setWorkcell(4 + index, 18, summaryInfo.reasonInfo.getCodeError())      # 'Error'
-            self.setWorkcell(4 + index, 19, summaryInfo.reasonInfo.getCodeErrorPLC())   # 'ErrorPLC'
-            self.setWorkcell(4 + index, 20, summaryInfo.reasonInfo.getDetailCode())     # 'DetailCode'
-            self.setWorkcell(4 + index, 21, summaryInfo.reasonInfo.getSequenceName1())  # 'SequenceName1'
-            self.setWorkcell(4 + index, 22, summaryInfo.reasonInfo.getSequenceName2())  # 'SequenceName2'
+                self.writer.formats.formatRow(4 + index, fill=summaryInfo.strCellColor)
+
+            for column, value in enumerate(self.summaryRow(summaryInfo), 2):
+                if column == 5:
+                    self.setWorkcell(4 + index, column, value, link=summaryInfo.getHyperLink())
+                elif column == 10 or column == 20:
+                    self.setWorkcell(4 + index, column, value, style='SCAR Cell Right')
+                else:
+                    self.setWorkcell(4 + index, column, value)
 
             # for sequenceIdx, sequenceData in enumerate(summaryInfo.reasonInfo.getSequenceDetail()):
             #     if sequenceIdx >= 29:
             #         break
             #     self.setWorkcell(4 + index, 23 + sequenceIdx, sequenceData)    # 'Sequence'
 
-            self.worksheet.cell(4 + index, 10).border = styles.Border(right=self.borderThin)
-            self.worksheet.cell(4 + index, 20).border = styles.Border(right=self.borderThin)
-
             index += 1
 
-        self.worksheet.auto_filter.ref = f'B3:R{3 + index}'
-        self.worksheet.freeze_panes = 'C4'
-        self.worksheet.sheet_view.zoomScale = 75
-        for column_cells in self.worksheet.columns:
-            length = max(len(str(cell.value)) * 1.1 for cell in column_cells)
-            self.worksheet.column_dimensions[column_cells[0].column_letter].width = length
+        self.writer.autoFilter = f'B3:R{3 + index}'
+        self.writer.freezePanes = 'C4'
+        self.writer.zoomScale = 75
+        self.writer.columnWidths = { 'D' : 20, 'E' : 60 }
+        self.writer.close()
 
-        self.worksheet.column_dimensions['D'].width = 20
-        self.worksheet.column_dimensions['E'].width = 60
-
-    def setWorkcell(self, row, column, text, center=True, color=None, red=False, link=None):
+    def setWorkcell(self, row, column, text, style='SCAR Cell', red=False, link=None):
+        value = None
         if text != None and len(str(text)) > 0:
             if link != None:
-                self.worksheet.cell(row, column, f'=HYPERLINK("{link}", "{text}")')
+                value = f'=HYPERLINK("{link}", "{text}")'
             else:
-                self.worksheet.cell(row, column, text)
-
-        if center == True:
-            self.worksheet.cell(row, column).alignment = styles.Alignment(horizontal='center')
+                value = text
 
         if red == True:
-            self.worksheet.cell(row, column).font = styles.Font(name='맑은 고딕', size=11, bold=True, color='FF0000')
-        elif self.fontColor != None:
-            self.worksheet.cell(row, column).font = styles.Font(name='맑은 고딕', size=11, color=self.fontColor)
-
-        background = self.cellColor
-        if color != None:
-            background = color
-        if background != None:
-            self.worksheet.cell(row, column).fill = styles.PatternFill(start_color=background, end_color=background, fill_type='solid')
+            style = style.replace('SCAR Cell', 'SCAR Bad')
+
+        self.writer.setCell(row, column, value, style=style)
@@ -0,0 +1,273 @@
+import pickle
+import tempfile
+
+from copy import copy
+
+from SCARCommon import *
+
+from openpyxl import Workbook, styles, utils
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles.fonts import DEFAULT_FONT
+
+SPOOL_ROWS = 1024
+
+LAYOUT_MAX_LENGTH  = 100    # 열 너비 계산에 쓰는 최대 글자 수
+LAYOUT_SAMPLE_ROWS = 10000  # 이 행 수를 넘으면 표본 행만 측정
+LAYOUT_SAMPLE_STEP = 10     # 표본 행 간격
+
+HEADER_COLOR = 'D8D8D8'     # 머리글 배경
+STRIPE_COLOR = 'F2F2F2'     # 홀수 행 배경 (조건부 서식)
+BAD_COLOR    = 'FF0000'     # 비정상 응답/상태 글자
+
+def info(log):
+    if log[:1] == '\n':
+        print('')
+        log = log.replace('\n', '')
+
+    print(f'[{now()}] [SCARWriter] {log}')
+
+def makeBorder(edge, bottom=None):
+    thin = styles.Side(border_style='thin', color='000000')
+    return styles.Border(left=thin if edge == 'Left' else None,
+                         right=thin if edge == 'Right' else None,
+                         bottom=styles.Side(border_style=bottom, color='000000') if bottom != None else None)
+
+# 시트 공통 이름 스타일 'SCAR <종류>[ Left|Right]'
+#   Cell   : 가운데 정렬
+#   Bad    : 가운데 정렬 + 굵은 빨간 글자
+#   Header : 가운데 정렬 + 회색 배경
+#   Title  : Header + 굵은 아래 경계선
+def makeStyles():
+    center = styles.Alignment(horizontal='center')
+    header = styles.PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type='solid')
+    bad    = styles.Font(name='맑은 고딕', size=11, bold=True, color=BAD_COLOR)
+
+    namedStyles = []
+    for edge in (None, 'Left', 'Right'):
+        suffix = f' {edge}' if edge != None else ''
+        namedStyles.append(styles.NamedStyle(f'SCAR Cell{suffix}', font=DEFAULT_FONT, alignment=center, border=makeBorder(edge)))
+        namedStyles.append(styles.NamedStyle(f'SCAR Bad{suffix}', font=bad, alignment=center, border=makeBorder(edge)))
+        namedStyles.append(styles.NamedStyle(f'SCAR Header{suffix}', font=DEFAULT_FONT, alignment=center, fill=header, border=makeBorder(edge)))
+        namedStyles.append(styles.NamedStyle(f'SCAR Title{suffix}', font=DEFAULT_FONT, alignment=center, fill=header, border=makeBorder(edge, 'thick')))
+
+    return namedStyles
+
+# 워크북에 없는 이름 스타일만 등록 (기존 파일을 다시 열어도 중복 등록하지 않음)
+def registerStyles(workbook):
+    for namedStyle in makeStyles():
+        if namedStyle.name not in workbook.named_styles:
+            workbook.add_named_style(namedStyle)
+
+# 이름 스타일 -> 스타일 id 배열 캐시 (셀마다 이름으로 스타일 목록을 다시 찾지 않음)
+class StyleCache :
+
+    def __init__(self, workbook):
+        registerStyles(workbook)
+        self.arrays = { namedStyle.name : namedStyle.as_tuple() for namedStyle in workbook._named_styles }
+
+    def apply(self, cell, name):
+        cell._style = copy(self.arrays[name])
+
+# 스트리밍(write-only) 워크북 생성
+def streamWorkbook():
+    workbook = Workbook(write_only=True)
+    registerStyles(workbook)
+    return workbook
+
+# 값을 기록하는 동안 열별 최대 글자 수를 누적하고 마지막에 열 너비만 설정
+# 긴 시트는 LAYOUT_SAMPLE_ROWS 이후 LAYOUT_SAMPLE_STEP 행마다 한 번만 측정
+class SheetLayout :
+
+    def __init__(self):
+        self.lengths = {}
+        self.nRow    = 0
+        self.nRows   = 0
+        self.bSample = True
+
+    def feed(self, row, column, value):
+        if row != self.nRow:
+            self.nRow = row
+            self.nRows += 1
+            self.bSample = self.nRows <= LAYOUT_SAMPLE_ROWS or self.nRows % LAYOUT_SAMPLE_STEP == 0
+
+        if self.bSample == False:
+            return
+
+        length = min(len(str(value)), LAYOUT_MAX_LENGTH)
+        if length > self.lengths.get(column, 0):
+            self.lengths[column] = length
+
+    def maxColumn(self):
+        return max(self.lengths) if len(self.lengths) > 0 else 0
+
+    # 값이 없는 셀은 기존과 동일하게 str(None) 길이로 계산
+    def apply(self, worksheet):
+        for column in range(1, self.maxColumn() + 1):
+            length = max(self.lengths.get(column, 0), len(str(None)))
+            worksheet.column_dimensions[utils.get_column_letter(column)].width = length * 1.1
+
+# 행 단위 배경/글자색을 셀 스타일 대신 시트 조건부 서식으로 기록
+# 같은 서식이 연속된 행은 하나의 범위로 묶고, exclude 열 (빨간 글자 등) 은 범위에서 뺀다
+class SheetFormats :
+
+    def __init__(self):
+        self.rows        = {}       # (font, fill) -> { row : exclude }
+        self.stripe      = None     # (시작 행, 배경색)
+        self.firstColumn = 1        # 서식을 적용할 첫 열
+
+    def stripeRows(self, row, color=STRIPE_COLOR):
+        self.stripe = (row, color)
+
+    def formatRow(self, row, font=None, fill=None, exclude=()):
+        self.rows.setdefault((font, fill), {})[row] = tuple(sorted(exclude))
+
+    def makeRanges(self, rows, firstColumn, lastColumn):
+        ranges = []
+        start = None
+        for row in sorted(rows) + [None]:
+            if start != None and row == end + 1 and rows[row] == rows[start]:
+                end = row
+                continue
+
+            if start != None:
+                column = firstColumn
+                for exclude in rows[start] + (lastColumn + 1,):
+                    if exclude > column:
+                        ranges.append(f'{utils.get_column_letter(column)}{start}:{utils.get_column_letter(exclude - 1)}{end}')
+                    column = exclude + 1
+
+            start = end = row
+
+        return ' '.join(ranges)
+
+    # 먼저 추가한 규칙이 우선하므로 행 서식을 줄무늬보다 먼저 기록
+    def apply(self, worksheet, lastColumn, lastRow):
+        firstColumn = self.firstColumn
+        for (font, fill), rows in self.rows.items():
+            strRange = self.makeRanges(rows, firstColumn, lastColumn)
+            if len(strRange) <= 0:
+                continue
+
+            worksheet.conditional_formatting.add(strRange, FormulaRule(formula=['TRUE'],
+                font=styles.Font(color=font) if font != None else None,
+                fill=styles.PatternFill(start_color=fill, end_color=fill, fill_type='solid') if fill != None else None))
+
+        if self.stripe != None and lastRow >= self.stripe[0]:
+            row, color = self.stripe
+            strRange = f'{utils.get_column_letter(firstColumn)}{row}:{utils.get_column_letter(lastColumn)}{lastRow}'
+            worksheet.conditional_formatting.add(strRange, FormulaRule(formula=[f'MOD(ROW(),2)={(row + 1) % 2}'],
+                fill=styles.PatternFill(start_color=color, end_color=color, fill_type='solid')))
+
+# write-only 시트는 열 너비(<cols>)를 첫 행보다 먼저 기록하므로
+# 행은 임시 파일에 순서대로 스풀링하며 SheetLayout 에 열 너비를 누적하고, close() 에서 한 번에 시트로 흘려보낸다
+class SheetWriter :
+
+    def __init__(self, workbook, title, styleCache=None):
+        self.worksheet   = workbook.create_sheet(title)
+        self.styleCache  = styleCache if styleCache != None else StyleCache(workbook)
+        self.spool       = tempfile.TemporaryFile()
+        self.rows        = []
+        self.nRow        = 0
+        self.cells       = None
+        self.layout      = SheetLayout()
+        self.merged      = []
+        self.formats     = SheetFormats()
+
+        self.freezePanes  = None
+        self.zoomScale    = None
+        self.autoFilter   = None
+        self.columnWidths = {}      # 열 문자 -> 고정 너비 (계산한 너비 대신 사용)
+
+    # 셀 값/이름 스타일 설정 (행은 오름차순으로만 작성)
+    def setCell(self, row, column, value=None, style=None):
+        if row != self.nRow:
+            if row < self.nRow:
+                raise ValueError(f'row {row} already written')
+            self.flushRow()
+            self.nRow = row
+            self.cells = {}
+
+        cell = self.cells.get(column)
+        if cell == None:
+            cell = [None, None]
+            self.cells[column] = cell
+
+        if value != None:
+            cell[0] = value
+        if style != None:
+            cell[1] = style
+
+    def mergeCells(self, start_row, start_column, end_row, end_column):
+        self.merged.append(f'{utils.get_column_letter(start_column)}{start_row}:{utils.get_column_letter(end_column)}{end_row}')
+
+    # 작성 중인 행을 스풀에 넘기며 열 너비 갱신
+    def flushRow(self):
+        if self.cells == None:
+            return
+
+        for column, cell in self.cells.items():
+            self.layout.feed(self.nRow, column, cell[0])
+
+        self.rows.append((self.nRow, [(column, cell[0], cell[1]) for column, cell in sorted(self.cells.items())]))
+        self.cells = None
+
+        if len(self.rows) >= SPOOL_ROWS:
+            self.flushSpool()
+
+    def flushSpool(self):
+        if len(self.rows) > 0:
+            pickle.dump(self.rows, self.spool, pickle.HIGHEST_PROTOCOL)
+            self.rows = []
+
+    def readSpool(self):
+        self.spool.seek(0)
+        while True:
+            try:
+                rows = pickle.load(self.spool)
+            except EOFError:
+                break
+
+            for row in rows:
+                yield row
+
+    def makeCell(self, value, style):
+        cell = WriteOnlyCell(self.worksheet, value)
+        if style != None:
+            self.styleCache.apply(cell, style)
+        return cell
+
+    # 열 너비/병합/틀 고정/필터/조건부 서식 설정 후 스풀된 행을 순서대로 기록
+    def close(self):
+        self.flushRow()
+        self.flushSpool()
+
+        self.layout.apply(self.worksheet)
+        for column, width in self.columnWidths.items():
+            self.worksheet.column_dimensions[column].width = width
+
+        for strRange in self.merged:
+            self.worksheet.merged_cells.add(strRange)
+
+        if self.freezePanes != None:
+            self.worksheet.freeze_panes = self.freezePanes
+        if self.zoomScale != None:
+            self.worksheet.sheet_view.zoomScale = self.zoomScale
+        if self.autoFilter != None:
+            self.worksheet.auto_filter.ref = self.autoFilter
+
+        self.formats.apply(self.worksheet, self.layout.maxColumn(), self.nRow)
+
+        nRow = 1
+        for row, cells in self.readSpool():
+            while nRow < row:
+                self.worksheet.append([])
+                nRow += 1
+
+            values = [None] * cells[-1][0]
+            for column, value, style in cells:
+                values[column - 1] = self.makeCell(value, style)
+            self.worksheet.append(values)
+            nRow += 1
+
+        self.spool.close()
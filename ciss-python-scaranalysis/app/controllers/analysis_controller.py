@@ -1,9 +1,11 @@
 import os
+import threading
 from flask import Blueprint, request, jsonify
 
-from SCARAnalyzer import SCARAnalyzer
+from SCARAnalyzer import SCARAnalyzer, parseWorkers
 from SCARCategorizer import SCARCategorizer
-from SCARSummarizer import SCARSummarizer
+from SCARSummarizer import SCARSummarizer, summaryPath
+from SCARFollower import SCARFollower
 from SCARCommon import Config, LogList, Analyzed, setLogPath, getLogFiles
 from monitoring_service import (
     get_charging_page_data,
@@ -18,6 +20,8 @@ analysis_bp = Blueprint("analysis", __name__)
 analyzer = SCARAnalyzer()
 categorizer = SCARCategorizer()
 summarizer = SCARSummarizer()
+follower = SCARFollower(analyzer)
+follow_thread = None
 
 
 # Callback setup
@@ -62,6 +66,8 @@ def select_folder():
             "fileCount": LogList().fileCount,
             "detailPath": Config().detailPath,
             "hasDetailFile": os.path.exists(Config().detailPath),
+            "summaryPath": summaryPath(),
+            "hasSummaryFile": os.path.exists(summaryPath()),
         }
     )
 
@@ -71,6 +77,16 @@ def analyze():
     if LogList().fileCount == 0:
         return jsonify({"error": "No files to analyze"}), 400
 
+    # Optional engine selection ("thread" | "process")
+    data = request.get_json(silent=True) or {}
+    if "workers" in data and parseWorkers(data["workers"]) is None:
+        return jsonify({"error": f'Invalid workers "{data["workers"]}" (positive integer)'}), 400
+    if "engine" in data and not analyzer.setEngine(data["engine"], data.get("workers")):
+        return jsonify({"error": f'Invalid engine "{data["engine"]}"'}), 400
+    # workers only: applied to the configured engine
+    if "engine" not in data and "workers" in data:
+        analyzer.setEngine(Config().analyzeEngine, data["workers"])
+
     Analyzed().clear()
     analyzer.analyze()
 
@@ -78,6 +94,8 @@ def analyze():
         {
             "status": "analyze_completed",
             "analyzedCount": Analyzed().size(),
+            "engine": Config().analyzeEngine,
+            "workers": Config().analyzeWorkers,
             "dstFiles": list(LogList().dstDicts.values()),
         }
     )
@@ -85,14 +103,28 @@ def analyze():
 
 @analysis_bp.route("/categorize", methods=["POST"])
 def categorize():
+    # Optional per-charger detail workbooks ("shard": true)
+    data = request.get_json(silent=True) or {}
+    if "shard" in data:
+        Config().detailShard = bool(data["shard"])
+
+    # Optional export format ("xlsx" | "csv" | "jsonl" | "parquet")
+    if "export" in data and not categorizer.setExport(data["export"]):
+        return jsonify({"error": f'Invalid export format "{data["export"]}"'}), 400
+
     result = categorizer.saveCategorize()
     return jsonify({"status": "categorize_completed", "result": result})
 
 
 @analysis_bp.route("/summarize", methods=["POST"])
 def summarize():
+    # Optional export format ("xlsx" | "csv" | "jsonl" | "parquet")
+    data = request.get_json(silent=True) or {}
+    if "export" in data and not summarizer.setExport(data["export"]):
+        return jsonify({"error": f'Invalid export format "{data["export"]}"'}), 400
+
     result = summarizer.requestSummarize()
-    return jsonify({"status": "summarize_completed", "result": result})
+    return jsonify({"status": "summarize_completed", "result": result, "summaryPath": summaryPath()})
 
 
 @analysis_bp.route("/monitoring/charging-page", methods=["POST"])
@@ -142,4 +174,56 @@ def monitoring_error_stats():
         data.get("startDate"),
         data.get("endDate"),
     )
-    return jsonify(result)
\ No newline at end of file
+    return jsonify(result)
+
+def _to_dict(obj):
+    if hasattr(obj, "__dict__"):
+        return {key: _to_dict(value) for key, value in vars(obj).items()}
+    if hasattr(obj, "__slots__"):
+        slots = [key for cls in type(obj).__mro__ for key in getattr(cls, "__slots__", ())]
+        return {key: _to_dict(getattr(obj, key)) for key in slots}
+    return obj
+
+
+@analysis_bp.route("/follow/start", methods=["POST"])
+def follow_start():
+    global follow_thread
+
+    if LogList().fileCount == 0:
+        return jsonify({"error": "No files to follow"}), 400
+
+    if follow_thread is not None and follow_thread.is_alive():
+        return jsonify({"error": "Already following"}), 400
+
+    data = request.get_json(silent=True) or {}
+    follow_thread = threading.Thread(target=follower.follow, args=(data.get("interval"),), daemon=True)
+    follow_thread.start()
+
+    return jsonify({"status": "follow_started", "sources": list(LogList().srcDicts.keys())})
+
+
+@analysis_bp.route("/follow/stop", methods=["POST"])
+def follow_stop():
+    follower.stop()
+    if follow_thread is not None:
+        follow_thread.join()
+
+    return jsonify({"status": "follow_stopped", "stats": follower.getStats()})
+
+
+@analysis_bp.route("/follow/events", methods=["GET"])
+def follow_events():
+    since = request.args.get("since", default=0, type=int)
+    events = follower.getEvents(since)
+
+    return jsonify(
+        {
+            "events": [_to_dict(event) for event in events],
+            "lastSeq": events[-1].nSeq if len(events) > 0 else since,
+        }
+    )
+
+
+@analysis_bp.route("/follow/stats", methods=["GET"])
+def follow_stats():
+    return jsonify(follower.getStats())
@@ -0,0 +1,105 @@
+"""분석 스레드 수별 Analyzed 레지스트리 잠금 경합
+
+    python benchmarks/bench_contention.py [--sources 36] [--lines 20000] [--workers 8 32] [--repeat 3]
+
+generate_logs 로 충전기 sources 개의 로그를 만들고, SCARAnalyzer.analyze 의 스레드 엔진과 같이
+충전기마다 analyzeSrc 를 스레드 풀에 제출해 분석한다. Analyzed 의 클래스 잠금을 계수 잠금으로
+바꿔 획득 횟수와 대기가 필요했던 (경합) 횟수를 세고, 작업 수별로 repeat 번 측정한 시간의
+최소/중앙값을 출력한다.
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SCARCommon import *
+from SCARAnalyzer import SCARAnalyzer
+
+from concurrent.futures import ThreadPoolExecutor
+
+from generate_logs import generate
+
+class CountingLock:
+    def __init__(self):
+        self.lock      = threading.Lock()
+        self.acquired  = 0
+        self.contended = 0
+
+    # 계수는 잠금을 잡은 상태에서 증가
+    def acquire(self, blocking=True, timeout=-1):
+        bContended = self.lock.acquire(blocking=False) == False
+        if bContended == True and self.lock.acquire(blocking, timeout) == False:
+            return False
+
+        self.acquired += 1
+        if bContended == True:
+            self.contended += 1
+        return True
+
+    def release(self):
+        self.lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+def analyzeThreads(workers):
+    analyzer = SCARAnalyzer()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(analyzer.analyzeSrc, srcName, srcFiles) for srcName, srcFiles in LogList().srcDicts.items()]
+        for future in futures:
+            future.result()
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyzed 잠금 경합')
+    parser.add_argument('--sources', type=int, default=36)
+    parser.add_argument('--files', type=int, default=1)
+    parser.add_argument('--lines', type=int, default=20000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[8, 32])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        folder = os.path.join(root, 'logs')
+        generate(folder, args.sources, args.files, args.lines)
+
+        getConfig()
+        Config().logPath = folder
+        Config().siteFile = ''
+        Config().manifestFile = ''
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            getLogFiles()
+
+        lock = CountingLock()
+        Analyzed._lock = lock
+
+        print(f'{len(LogList().srcDicts)} sources x {args.files} files x {args.lines} lines, min / median of {args.repeat} repeats')
+        for workers in args.workers:
+            times = []
+            for _ in range(args.repeat):
+                Analyzed().clear()
+                lock.acquired = 0
+                lock.contended = 0
+
+                with contextlib.redirect_stdout(io.StringIO()):
+                    start = time.perf_counter()
+                    analyzeThreads(workers)
+                    times.append(time.perf_counter() - start)
+
+            nLogs = sum(len(logInfos) for srcName, logInfos in Analyzed().getLogs())
+            print(f'  workers {workers:>3}  {min(times):6.2f} / {statistics.median(times):6.2f}s  '
+                  f'locks {lock.acquired}  contended {lock.contended}  events {nLogs}')
+
+if __name__ == '__main__':
+    main()
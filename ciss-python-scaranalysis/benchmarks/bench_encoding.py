@@ -0,0 +1,66 @@
+"""인코딩 판별 후 첫 줄을 읽기까지의 시간 (time-to-first-line)
+
+    python benchmarks/bench_encoding.py [--lines 200000] [--repeat 5]
+
+generate_logs 로 UTF-8 / CP949 로그 파일을 하나씩 만들고 인코딩별로 repeat 번 측정해
+최소/중앙값을 출력한다.
+
+    full    : 이전 방식, 파일 전체를 chardet 으로 판별한 뒤 텍스트로 열어 첫 줄 읽기
+    sample  : detectEncoding (앞/뒤 샘플, UTF-8 우선) + readLines 첫 줄, 충전기 경로 캐시 비움
+    cached  : 같은 충전기 경로의 인코딩 캐시가 있는 경우
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chardet
+
+from SCARReader import Encodings, detectEncoding, readLines
+
+from generate_logs import generate
+
+def firstLineFull(file):
+    with open(file, 'rb') as f:
+        fileEncoding = chardet.detect(f.read())['encoding']
+
+    with open(file, 'r', encoding=fileEncoding) as f:
+        return fileEncoding, f.readline()
+
+def firstLineSample(file):
+    Encodings().clear()
+    return firstLineCached(file)
+
+def firstLineCached(file):
+    fileEncoding = detectEncoding(file)
+    return fileEncoding, next(readLines(file, fileEncoding))
+
+def measure(func, file, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(file)
+        times.append((time.perf_counter() - start) * 1000)
+    return result, times
+
+def main():
+    parser = argparse.ArgumentParser(description='인코딩 판별 time-to-first-line')
+    parser.add_argument('--lines', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        for encoding in ['utf-8', 'cp949']:
+            file = generate(os.path.join(root, encoding), chargers=1, files=1, lines=args.lines, encoding=encoding)[0]
+            print(f'{encoding} {os.path.getsize(file) / 1e6:.1f} MB, min / median of {args.repeat} repeats')
+
+            for name, func in [('full', firstLineFull), ('sample', firstLineSample), ('cached', firstLineCached)]:
+                (fileEncoding, line), times = measure(func, file, args.repeat)
+                print(f'  {name:<7} {min(times):9.2f} / {statistics.median(times):9.2f} ms  [{fileEncoding}]')
+
+if __name__ == '__main__':
+    main()
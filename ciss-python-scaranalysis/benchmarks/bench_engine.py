@@ -0,0 +1,91 @@
+"""분석 엔진별 처리량 (lines/sec) 과 작업 수별 확장성
+
+    python benchmarks/bench_engine.py [<로그 폴더>] [--chargers 8] [--files 2] [--lines 20000] [--workers 1 4 16] [--repeat 3]
+
+로그 폴더를 지정하지 않으면 generate_logs 로 합성 로그를 만든다. SCARAnalyzer.analyze 를
+스레드 엔진 (기준, ANALYZE_WORKERS 기본값) 과 프로세스 엔진 (작업 수별) 으로 repeat 번 실행해
+최소/중앙값 시간의 처리량과 기준 대비 속도 향상을 출력한다.
+프로세스 엔진의 작업 수는 파일 수를 넘지 않으므로 16 작업은 16개 이상의 파일이 필요하다.
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SCARCommon import *
+from SCARAnalyzer import SCARAnalyzer
+
+from generate_logs import generate
+
+def measure(engine, workers, repeat):
+    analyzer = SCARAnalyzer()
+    analyzer.setEngine(engine, workers)
+
+    times = []
+    for _ in range(repeat):
+        Analyzed().clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            analyzer.analyze()
+            times.append(time.perf_counter() - start)
+
+    nLogs = sum(len(logInfos) for srcName, logInfos in Analyzed().getLogs())
+    return times, nLogs
+
+def countLines():
+    nLines = 0
+    for srcFiles in LogList().srcDicts.values():
+        for file in srcFiles:
+            with open(file, 'rb') as f:
+                nLines += sum(1 for _ in f)
+    return nLines
+
+def main():
+    parser = argparse.ArgumentParser(description='분석 엔진별 처리량')
+    parser.add_argument('folder', nargs='?')
+    parser.add_argument('--chargers', type=int, default=8)
+    parser.add_argument('--files', type=int, default=2)
+    parser.add_argument('--lines', type=int, default=20000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        folder = args.folder
+        if folder == None:
+            folder = os.path.join(root, 'logs')
+            generate(folder, args.chargers, args.files, args.lines)
+
+        getConfig()
+        Config().logPath = folder
+        Config().siteFile = ''
+        Config().manifestFile = ''
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            getLogFiles()
+
+        nFiles = sum(len(srcFiles) for srcFiles in LogList().srcDicts.values())
+        nLines = countLines()
+        print(f'{len(LogList().srcDicts)} chargers, {nFiles} files, {nLines} lines, {os.cpu_count()} cpus, min / median of {args.repeat} repeats')
+
+        # 기준 : 스레드 엔진, ANALYZE_WORKERS 기본값 (CPU 수 x 2)
+        Config().analyzeWorkers = 0
+        baseline, nEvents = measure('thread', None, args.repeat)
+        results = [('thread', baseline, nEvents)]
+        for workers in args.workers:
+            times, nLogs = measure('process', workers, args.repeat)
+            results.append((f'process {workers}', times, nLogs))
+
+        for name, times, nLogs in results:
+            print(f'  {name:<11} {nLines / min(times) / 1e3:8.1f} / {nLines / statistics.median(times) / 1e3:8.1f} K lines/s  '
+                  f'speedup {statistics.median(baseline) / statistics.median(times):5.2f}x  '
+                  f'events {nLogs}{"" if nLogs == nEvents else " (differs from thread)"}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""형식별 필드 추출 마이크로 벤치마크 (extract vs parse)
+
+    python benchmarks/bench_extract.py [--number 2000] [--repeat 5]
+
+tests/extract_golden.json 의 형식별 입력을 사용해 호출 1회당 시간을 repeat 번 측정하고
+최소/중앙값을 출력한다. parse 가 설치된 경우 이전 방식 (호출마다 parse()) 과
+미리 컴파일한 parse.compile().parse() 도 함께 측정한다.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SCARCommon import EXTRACT_FORMATS, extract
+
+try:
+    import parse
+except ImportError:
+    parse = None
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'extract_golden.json')
+
+# 입력 목록 전체를 number 번 처리한 시간의 호출 1회당 us (repeat 번)
+def measure(func, texts, number, repeat):
+    def run():
+        for text in texts:
+            func(text)
+
+    return [time / number / len(texts) * 1e6 for time in timeit.repeat(run, number=number, repeat=repeat)]
+
+def report(name, times):
+    return f'{name} {min(times):7.2f} / {statistics.median(times):7.2f}us'
+
+def main():
+    parser = argparse.ArgumentParser(description='형식별 필드 추출 마이크로 벤치마크')
+    parser.add_argument('--number', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with open(GOLDEN_PATH, encoding='utf-8') as f:
+        golden = json.load(f)
+
+    print(f'per call, min / median of {args.repeat} repeats')
+    for key, format in EXTRACT_FORMATS.items():
+        texts = [case['text'] for case in golden if case['key'] == key]
+
+        line = f'{key:<17} ' + report('extract', measure(lambda text: extract(key, text), texts, args.number, args.repeat))
+        if parse != None:
+            compiled = parse.compile(format)
+            line += '  ' + report('parse', measure(lambda text: parse.parse(format, text), texts, args.number, args.repeat))
+            line += '  ' + report('compiled', measure(compiled.parse, texts, args.number, args.repeat))
+
+        print(line)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""키 메시지 매칭 처리량 (lines/sec)
+
+    python benchmarks/bench_keymatch.py [--lines 100000] [--repeat 5]
+
+generate_logs 로 만든 로그 줄에 SCARAnalyzer.keyMsgs 마커를 매칭해 repeat 번 측정하고
+최소/중앙값/최대 처리량을 출력한다. 두 방식의 매칭 결과 (키 목록 위치) 가 같은지도 확인한다.
+
+    find    : 이전 방식, 키마다 message.find() 를 호출해 목록상 첫 키 선택
+    matcher : KeyMatcher, 전체 키를 하나의 정규식으로 1회 탐색
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SCARAnalyzer import SCARAnalyzer
+from SCARCommon import KeyMatcher
+
+from generate_logs import generate
+
+def matchFind(keys, message):
+    for index, key in enumerate(keys):
+        if message.find(key) >= 0:
+            return index
+    return -1
+
+def measure(func, lines, repeat):
+    rates = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [func(line) for line in lines]
+        rates.append(len(lines) / (time.perf_counter() - start))
+    return results, rates
+
+def main():
+    parser = argparse.ArgumentParser(description='키 메시지 매칭 처리량')
+    parser.add_argument('--lines', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        lines = []
+        for path in generate(root, chargers=1, files=1, lines=args.lines):
+            with open(path, encoding='utf-8') as f:
+                lines += f.readlines()
+
+    keys = [keyMsg[0] for keyMsg in SCARAnalyzer().keyMsgs]
+    keyMatcher = KeyMatcher(keys)
+
+    found, findRates = measure(lambda line: matchFind(keys, line), lines, args.repeat)
+    matched, matcherRates = measure(keyMatcher.match, lines, args.repeat)
+
+    print(f'{len(lines)} lines, {len(keys)} keys, {sum(1 for index in matched if index >= 0)} matched, same={found == matched}')
+    print(f'min / median / max of {args.repeat} repeats')
+    for name, rates in [('find', findRates), ('matcher', matcherRates)]:
+        print(f'  {name:<8} {min(rates) / 1e6:6.2f} / {statistics.median(rates) / 1e6:6.2f} / {max(rates) / 1e6:6.2f} M lines/s')
+
+if __name__ == '__main__':
+    main()
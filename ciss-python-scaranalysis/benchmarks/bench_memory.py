@@ -0,0 +1,98 @@
+"""분석 결과 이벤트당 메모리 (bytes/event, tracemalloc)
+
+    python benchmarks/bench_memory.py [<로그 폴더>] [--chargers 3] [--files 2] [--lines 30000] [--repeat 3]
+
+로그 폴더를 지정하지 않으면 generate_logs 로 합성 로그를 만든다. 분석 후 Analyzed 에 남는
+메모리에서 결과 로그 줄 (rawLogs) 과 요청/응답 대조 표를 뺀 값을 이벤트 수로 나눠 출력한다.
+문자열 intern 표 등 프로세스 상태가 누적되지 않도록 측정마다 새 프로세스에서 분석하고,
+LAZY_EVENTS 꺼짐/켜짐 각각 repeat 번 측정한 최소/중앙값을 출력한다.
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SCARCommon import *
+from SCARAnalyzer import SCARAnalyzer
+
+from generate_logs import generate
+
+# 새 프로세스에서 1회 분석 후 (이벤트 수, 남은 byte, 최대 byte) 출력
+def measure(folder, lazyEvents):
+    getConfig()
+    Config().logPath = folder
+    Config().siteFile = ''
+    Config().manifestFile = ''
+    Config().lazyEvents = lazyEvents
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        getLogFiles()
+
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+
+        SCARAnalyzer().analyze()
+
+        # 이벤트 레코드만 남김 (결과 로그 줄, 요청/응답 대조 표 제외)
+        for analyzeInfo in Analyzed().get_all().values():
+            analyzeInfo.rawLogs      = []
+            analyzeInfo.ocppUUIDs    = {}
+            analyzeInfo.requests     = {}
+            analyzeInfo.requestTimes = {}
+            analyzeInfo.prevLog      = []
+
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    nEvents = sum(len(logInfos) for srcName, logInfos in Analyzed().getLogs())
+    print(json.dumps({ 'events' : nEvents, 'retained' : current - before, 'peak' : peak - before }))
+
+def run(folder, lazyEvents):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), folder, '--measure', str(int(lazyEvents))],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description='분석 결과 이벤트당 메모리')
+    parser.add_argument('folder', nargs='?')
+    parser.add_argument('--chargers', type=int, default=3)
+    parser.add_argument('--files', type=int, default=2)
+    parser.add_argument('--lines', type=int, default=30000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--measure', type=int, choices=[0, 1], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure != None:
+        measure(args.folder, args.measure == 1)
+        return
+
+    with tempfile.TemporaryDirectory() as root:
+        folder = args.folder
+        if folder == None:
+            folder = os.path.join(root, 'logs')
+            generate(folder, args.chargers, args.files, args.lines)
+
+        print(f'min / median of {args.repeat} repeats')
+        for lazyEvents in [False, True]:
+            results = [run(folder, lazyEvents) for _ in range(args.repeat)]
+            nEvents = results[0]['events']
+            retained = [result['retained'] / nEvents for result in results]
+            peak = [result['peak'] / 1e6 for result in results]
+
+            print(f'  lazy {str(lazyEvents):<5} events {nEvents}  '
+                  f'retained {min(retained):7.0f} / {statistics.median(retained):7.0f} bytes/event  '
+                  f'peak {min(peak):6.1f} / {statistics.median(peak):6.1f} MB')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""/categorize + /summarize 경로 반복 측정
+
+    python benchmarks/bench_summary.py [<로그 폴더>] [--repeat 5] [--chargers 3] [--files 2] [--lines 30000]
+
+로그 폴더를 지정하지 않으면 generate_logs 로 합성 로그를 만든다. 한 번 분석한 뒤
+요약 배치 방식별로 categorize / summarize 를 반복 실행해 최소/중앙값/최대 시간을 출력한다.
+
+    sheet  : 기본값, categorize 가 Summary 시트를 상세 워크북과 함께 스트리밍 작성 (summarize 는 확인만)
+    stale  : 기본값, 상세 파일이 바뀐 뒤 summarize 가 상세/Summary 시트를 다시 스트리밍 작성
+    split  : SUMMARY_SPLIT, summarize 가 요약만 DetailResult.summary.xlsx 로 작성
+    reopen : 참고용, 이전 방식처럼 상세 워크북을 불러와 다시 저장하는 시간 (load_workbook + save)
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SCARCommon import *
+from SCARAnalyzer import SCARAnalyzer
+from SCARCategorizer import SCARCategorizer
+from SCARSummarizer import SCARSummarizer
+
+from openpyxl import load_workbook
+
+from generate_logs import generate
+
+def measure(func):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+def reopen():
+    workbook = load_workbook(Config().detailPath)
+    workbook.save(Config().detailPath)
+
+def report(name, times):
+    print(f'  {name:<10} min {min(times):7.2f}s  median {statistics.median(times):7.2f}s  max {max(times):7.2f}s')
+
+def main():
+    parser = argparse.ArgumentParser(description='/categorize + /summarize 반복 측정')
+    parser.add_argument('folder', nargs='?')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--chargers', type=int, default=3)
+    parser.add_argument('--files', type=int, default=2)
+    parser.add_argument('--lines', type=int, default=30000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        folder = args.folder
+        if folder == None:
+            folder = os.path.join(root, 'logs')
+            generate(folder, args.chargers, args.files, args.lines)
+
+        getConfig()
+        Config().logPath = folder
+        Config().siteFile = ''
+        Config().manifestFile = ''
+        Config().detailPath = os.path.join(root, Config().detailFile)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            getLogFiles()
+            SCARAnalyzer().analyze()
+
+        nLogs = sum(len(logInfos) for srcName, logInfos in Analyzed().getLogs())
+        print(f'{Analyzed().size()} chargers, {nLogs} events, repeat {args.repeat}')
+
+        for mode in ['sheet', 'stale', 'split']:
+            Config().summarySplit = mode == 'split'
+
+            times = { 'categorize' : [], 'summarize' : [], 'total' : [] }
+            for _ in range(args.repeat):
+                categorize = measure(SCARCategorizer().makeWorkbook)
+                if mode == 'stale':
+                    os.utime(Config().detailPath)
+                summarize = measure(SCARSummarizer().summarize)
+                times['categorize'].append(categorize)
+                times['summarize'].append(summarize)
+                times['total'].append(categorize + summarize)
+
+            print(mode)
+            for name, values in times.items():
+                report(name, values)
+
+        Config().summarySplit = False
+        measure(SCARCategorizer().makeWorkbook)
+        print('reopen')
+        report('summarize', [measure(reopen) for _ in range(args.repeat)])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""합성 충전기 로그 생성 (벤치마크 입력)
+
+    python benchmarks/generate_logs.py <출력 폴더> [--chargers 4] [--files 3] [--lines 50000] [--seed 1] [--encoding utf-8]
+
+<출력 폴더>/<충전기>/<날짜>_<충전기>_sys.log 형식으로 충전기별 회전 로그 파일을 만든다.
+대부분은 키 메시지가 없는 일반 줄이고, 일정 비율로 이벤트/상태/코드 줄과
+여러 줄로 기록되는 OCPP 요청/응답 (Authorize, TransactionEvent, StatusNotification) 을 섞는다.
+응답 일부는 다음 파일에 기록되어 파일 간 요청/응답 연결도 포함된다.
+일반 줄에는 한글 HMI 메시지가 섞여 있어 --encoding cp949 로 인코딩 판별 입력도 만들 수 있다.
+"""
+import argparse
+import json
+import os
+import random
+
+from datetime import datetime, timedelta
+
+QUIET_LINES = [ '[INFO][ocpp.cpp:812] [F1] heartbeat interval 300',
+                '[DEBUG][hmi.cpp:221] [F1] screen refresh idle',
+                '[INFO][meter.cpp:97] [F1] meter voltage 220.4 current 31.8',
+                '[DEBUG][net.cpp:55] [F1] lte signal -71 dBm',
+                '[INFO][dspmanager.cpp:310] [F1] dsp keepalive',
+                '[INFO][hmi.cpp:230] [F1] 화면 전환 : 충전 대기' ]
+
+EVENT_LINES = [ '[INFO][main.cpp:42] [F1] CORE LIB START',
+                '[INFO][ws.cpp:120] [F1] ws connected',
+                '[INFO][ws.cpp:131] [F1] ws disconnected',
+                '[INFO][hmi.cpp:400] [F1] Push Stop Button',
+                '[INFO][io.cpp:77] [F1] io Emergency Button emeStatus {emergency}',
+                '[INFO][plug.cpp:51] [F1] connector, Plug in for id {connector}',
+                '[INFO][plug.cpp:58] [F1] connector, Plug Out for id {connector}',
+                '[INFO][dspmanager.cpp:220] [F1] {command}',
+                '[INFO][mb.cpp:300] [F1] mb RECV MAINBOARD STATUS index (3) connectorId({connector}) len 12',
+                '[INFO][mb.cpp:301] [F1] evse prev status : {previous}',
+                '[INFO][mb.cpp:302] [F1] evse aftr status : {current}',
+                '[INFO][mb.cpp:350] [F1] mbStatusProcessing connectorId [{connector}] errorCode [{error}] errorCodePLC [0] finishCode [{finish}] done',
+                '[INFO][seq.cpp:90] [F1] seq ConnectorId [{connector}] Sequence Name1 [{bits1}] [11] Sequence Name2 [{bits2}] [3]' ]
+
+STATUSES  = ['idle', 'plugged', 'charging', 'finish', 'thankYou', 'fault']
+COMMANDS  = ['init', 'CommunicationStart', 'start', 'stop']
+RESPONSES = ['Accepted'] * 9 + ['Invalid']
+
+def formatTime(time):
+    return time.strftime('%Y-%m-%d %H:%M:%S.') + f'{time.microsecond // 1000:03d}-05:00'
+
+# 여러 줄 OCPP 프레임 (요청/응답 표시 줄 다음에 JSON, ']' 줄로 끝남)
+def frameLines(strTime, arrow, frame):
+    text = json.dumps(frame, separators=(',', ':'))
+    return [f'[{strTime}][INFO][ocpp.cpp:500] [F3] {arrow} [', text[1:-1], ']']
+
+def requestFrame(rng, uuid, connector):
+    kind = rng.random()
+    if kind < 0.4:
+        return [2, uuid, 'Authorize', { 'idToken' : { 'idToken' : f'TAG{rng.randrange(1000):04d}', 'type' : 'ISO14443' } }]
+    if kind < 0.8:
+        return [2, uuid, 'TransactionEvent', { 'eventType' : rng.choice(['Started', 'Updated', 'Ended']),
+                                               'timestamp' : '2025-01-01T00:00:00Z',
+                                               'triggerReason' : rng.choice(['CablePluggedIn', 'Authorized', 'StopAuthorized']),
+                                               'offline' : rng.random() < 0.05,
+                                               'evse' : { 'id' : 1, 'connectorId' : connector },
+                                               'transactionInfo' : { 'transactionId' : f'TX{rng.randrange(100000):06d}',
+                                                                     'chargingState' : rng.choice(['EVConnected', 'Charging', 'Idle']) },
+                                               'meterValue' : [{ 'sampledValue' : [{ 'measurand' : 'Energy.Active.Import.Register', 'value' : rng.randrange(100000) },
+                                                                                   { 'measurand' : 'SoC', 'value' : rng.randrange(1, 100) }] }] }]
+    return [2, uuid, 'StatusNotification', { 'connectorId' : connector, 'connectorStatus' : rng.choice(['Available', 'Occupied', 'Faulted']) }]
+
+def responseFrame(rng, uuid):
+    return [3, uuid, { 'idTokenInfo' : { 'status' : rng.choice(RESPONSES) } }]
+
+def eventLine(rng, strTime):
+    line = rng.choice(EVENT_LINES).format(emergency=rng.choice(['0', '1']),
+                                          connector=rng.choice([1, 2]),
+                                          command=rng.choice(COMMANDS),
+                                          previous=rng.choice(STATUSES),
+                                          current=rng.choice(STATUSES),
+                                          error=rng.choice(['0', '0', '0', '110', '231']),
+                                          finish=rng.choice(['0', '1', '2', '9']),
+                                          bits1=''.join(rng.choice('01') for _ in range(16)),
+                                          bits2=''.join(rng.choice('01') for _ in range(16)))
+    return f'[{strTime}]{line}'
+
+# 충전기 1대의 회전 로그 (files 개, 파일당 약 lines 줄)
+def writeCharger(folder, charger, files, lines, rng, start, encoding='utf-8'):
+    os.makedirs(folder, exist_ok=True)
+
+    time = start
+    pending = []
+    nSeq = 0
+    paths = []
+    for nFile in range(files):
+        day = start + timedelta(days=nFile)
+        path = os.path.join(folder, f'{day:%Y%m%d}_{charger}_sys.log')
+        with open(path, 'w', encoding=encoding, newline='\n') as f:
+            nLines = 0
+            while nLines < lines:
+                time += timedelta(milliseconds=rng.randrange(5, 400))
+                strTime = formatTime(time)
+                kind = rng.random()
+
+                if kind < 0.80:
+                    out = [f'[{strTime}]{rng.choice(QUIET_LINES)}']
+                elif kind < 0.90:
+                    out = [eventLine(rng, strTime)]
+                elif kind < 0.96 or len(pending) <= 0:
+                    nSeq += 1
+                    uuid = f'{charger}-{nSeq:08d}-{rng.randrange(1 << 32):08x}'
+                    out = frameLines(strTime, '================>', requestFrame(rng, uuid, rng.choice([1, 2])))
+                    pending.append(uuid)
+                else:
+                    uuid = pending.pop(rng.randrange(len(pending)))
+                    out = frameLines(strTime, '<================', responseFrame(rng, uuid))
+
+                f.write('\n'.join(out) + '\n')
+                nLines += len(out)
+
+        paths.append(path)
+
+    return paths
+
+def generate(root, chargers=4, files=3, lines=50000, seed=1, encoding='utf-8'):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+
+    paths = []
+    for nCharger in range(chargers):
+        charger = f'CH{nCharger + 1:03d}'
+        paths += writeCharger(os.path.join(root, charger), charger, files, lines, rng, start, encoding)
+
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 충전기 로그 생성')
+    parser.add_argument('root')
+    parser.add_argument('--chargers', type=int, default=4)
+    parser.add_argument('--files', type=int, default=3)
+    parser.add_argument('--lines', type=int, default=50000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--encoding', default='utf-8')
+    args = parser.parse_args()
+
+    paths = generate(args.root, args.chargers, args.files, args.lines, args.seed, args.encoding)
+    print(f'{len(paths)} files, {sum(os.path.getsize(path) for path in paths) / 1e6:.1f} MB -> {args.root}')
+
+if __name__ == '__main__':
+    main()
@@ -13,6 +13,15 @@ from typing import Any, Dict, List, Optional
 from bson import ObjectId
 
 from mongodb import get_collection, is_db_enabled
+from SCARCommon import CodeTable
+
+
+_FAIL_FLAGS = {
+    "User": "isUserFail",
+    "Server": "isServerFail",
+    "EV": "isEVFail",
+    "EVSE": "isEVSEFail",
+}
 
 
 def _parse_date(value: Optional[str]) -> Optional[datetime]:
@@ -32,6 +41,17 @@ def _start_of_next_day(dt: datetime) -> datetime:
     return _start_of_day(dt) + timedelta(days=1)
 
 
+def _error_type_table(error_codes: Optional[List[Dict[str, str]]]) -> CodeTable:
+    """Map each error code (case-insensitive) to the failure flags it sets."""
+
+    flags: Dict[str, List[str]] = {}
+    for ec in error_codes or []:
+        key = _FAIL_FLAGS.get(ec.get("type"))
+        if key:
+            flags.setdefault(ec.get("code", "").lower(), []).append(key)
+    return CodeTable(flags, bIgnoreCase=True)
+
+
 def _map_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
     result = dict(doc)
     result["_id"] = str(doc.get("_id", ObjectId()))
@@ -190,6 +210,7 @@ def get_charging_sessions(
     query = _build_common_query(serial_nos, start, end)
     raw_entries = list(coll.find(query).sort("generatedAt", 1))
     entries = [_map_doc(doc) for doc in raw_entries]
+    error_types = _error_type_table(error_codes)
 
     sessions: List[List[Dict[str, Any]]] = []
     session_start_l: Optional[int] = None
@@ -216,17 +237,9 @@ def get_charging_sessions(
                 f"isEVFail{'L' if is_left else 'R'}": False,
                 f"isEVSEFail{'L' if is_left else 'R'}": False,
             }
-            if "fault" in state and error_codes:
-                for ec in error_codes:
-                    if err == ec.get("code", "").lower():
-                        key = {
-                            "User": "isUserFail",
-                            "Server": "isServerFail",
-                            "EV": "isEVFail",
-                            "EVSE": "isEVSEFail",
-                        }.get(ec.get("type"))
-                        if key:
-                            flags[f"{key}{'L' if is_left else 'R'}"] = True
+            if "fault" in state:
+                for key in error_types.decode(err, ()):
+                    flags[f"{key}{'L' if is_left else 'R'}"] = True
             session_rows: List[Dict[str, Any]] = []
             for row in entries[start_idx : i + 1]:
                 row_copy = dict(row)
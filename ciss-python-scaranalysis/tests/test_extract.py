@@ -0,0 +1,145 @@
+"""extract() 결과를 parse 패키지의 parse() 결과 (골든 출력) 와 비교
+
+골든 출력 (extract_golden.json) 은 parse 가 설치된 환경에서 CASES 로 다시 기록한다.
+
+    python tests/test_extract.py
+"""
+import json
+import os
+import sys
+
+import pytest
+
+# python tests/test_extract.py 로 기록할 때도 SCAR 모듈을 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SCARCommon import EXTRACT_FORMATS, extract
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extract_golden.json')
+
+# 형식별 입력 : 분석 로그의 메시지 / 시간 / 응답 / 파일 이름 (일치하지 않는 경우 포함)
+CASES = { 'Emergency'   : [ '[F1] io Emergency Button emeStatus 1',
+                            '[F1] io Emergency Button emeStatus 0',
+                            '[F1] io emergency button EMESTATUS 1',
+                            'x Emergency Button emeStatus 1 extra',
+                            'Emergency Button emeStatus 1',
+                            '[F1] io Emergency Button emeStatus ' ],
+          'Nayax'       : [ 'VPOS -> HMI NAYAX < Vend Approved',
+                            'VPOS -> HMI NAYAX < Vend Declined by issuer',
+                            'vpos -> hmi nayax < vend approved',
+                            '[F1] VPOS -> HMI NAYAX < Vend Approved',
+                            'VPOS -> HMI NAYAX < Vend ' ],
+          'PlugIn'      : [ '[F1] connector, Plug in for id 1',
+                            '[F1] connector, Plug in for id 2',
+                            '[F1] connector, PLUG IN FOR ID 2',
+                            '[F1] connector, Plug in for id 1 (retry)',
+                            'Plug in for id 1',
+                            '[F1] connector, Plug Out for id 1' ],
+          'PlugOut'     : [ '[F1] connector, Plug Out for id 1',
+                            '[F1] connector, Plug Out for id 2',
+                            '[F1] connector, plug out for id 2',
+                            'Plug Out for id 1',
+                            '[F1] connector, Plug in for id 1' ],
+          'Mainboard'   : [ '[F1] mb RECV MAINBOARD STATUS index (3) connectorId(1) len 12',
+                            '[F1] mb RECV MAINBOARD STATUS index (12) connectorId(2) len 8',
+                            '[F1] mb recv mainboard status index (3) connectorId(1)x',
+                            '[F1] mb RECV MAINBOARD STATUS index (3) connectorId(1)',
+                            'RECV MAINBOARD STATUS index (3) connectorId(1) len 12',
+                            '[F1] mb RECV MAINBOARD STATUS index () connectorId(1) len 12' ],
+          'EvsePrev'    : [ 'evse prev status : idle',
+                            'evse prev status : thankYou',
+                            'EVSE PREV STATUS : charging',
+                            'evse prev status : finish : extra',
+                            '[F1] evse prev status : idle',
+                            'evse prev status : ' ],
+          'EvseAftr'    : [ 'evse aftr status : charging',
+                            'evse aftr status : fault',
+                            'Evse Aftr Status : plugged',
+                            '[F1] evse aftr status : charging',
+                            'evse prev status : charging' ],
+          'ConnectorId' : [ '[F1] mbStatusProcessing connectorId [1] errorCode [0] errorCodePLC [0] finishCode [2] done',
+                            '[F1] mbStatusProcessing connectorId [2]x',
+                            '[F1] connectorId [1]',
+                            '[F1] CONNECTORID [2] tail',
+                            '[F1] connectorId [1] then connectorId [2] tail',
+                            '[F1] connectorId : [1] tail' ],
+          'ConnectorIdColon' : [ '[F1] status connectorId : [1] ready',
+                                 '[F1] status connectorId : [2] ready',
+                                 '[F1] status connectorid : [2]x',
+                                 '[F1] status connectorId : [1]',
+                                 '[F1] status connectorId [1] ready' ],
+          'Code'        : [ '[F1] mbStatusProcessing connectorId [1] errorCode [0] errorCodePLC [0] finishCode [2] done',
+                            '[F1] mbStatusProcessing connectorId [2] errorCode [110] errorCodePLC [7] finishCode [9] done',
+                            '[F1] mbStatusProcessing connectorId [1] ERRORCODE [231] ERRORCODEPLC [0] FINISHCODE [1] x',
+                            '[F1] errorCode [0] errorCodePLC [0] finishCode [2]',
+                            '[F1] errorCode [1] errorCodePLC [2] finishCode [3] errorCode [4] errorCodePLC [5] finishCode [6] end',
+                            '[F1] errorCode [0] finishCode [2] done' ],
+          'Sequence'    : [ '[F1] seq ConnectorId [1] Sequence Name1 [0101010101010101] [11] Sequence Name2 [1100110011001100] [3]',
+                            '[F1] seq ConnectorId [2] Sequence Name1 [0000000000000000] [0] Sequence Name2 [1111111111111111] [65535]',
+                            '[F1] seq connectorid [1] sequence name1 [01] [1] sequence name2 [10] [2]',
+                            'ConnectorId [1] Sequence Name1 [01] [1] Sequence Name2 [10] [2]',
+                            '[F1] seq ConnectorId [1] Sequence Name1 [01] [1] Sequence Name2 [10] [2] tail',
+                            '[F1] seq ConnectorId [1] Sequence Name1 [01] Sequence Name2 [10] [2]' ],
+          'ShortTime'   : [ '2025-01-01 14:00:23.120-05:00',
+                            '2025-01-01 14:00:23.120+09:00',
+                            '2025-01-01 14:00:23-05:00',
+                            '2025-01-01  14:00:23.120-05:00',
+                            '2025-01-01T14:00:23.120-05:00',
+                            '' ],
+          'Response'    : [ '14:00:23.120 Accepted',
+                            '14:00:23.120 Invalid',
+                            '14:00:23.120 Rejected by billing service',
+                            '14:00:23.120 ',
+                            'Accepted',
+                            '' ],
+          'FileName'    : [ '20250101_CH001_sys.log',
+                            '20250101_CH001_sys_1.log',
+                            '20250101_CH_001_sys.log',
+                            '20250101-CH001-sys.log',
+                            '20250101_CH001_' ] }
+
+def named(match):
+    return None if match == None else match.groupdict()
+
+# 기록 전에는 빈 목록 (test_golden_covers_formats 실패)
+def loadGolden():
+    if os.path.exists(GOLDEN_PATH) == False:
+        return []
+
+    with open(GOLDEN_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+GOLDEN = loadGolden()
+
+@pytest.mark.parametrize('key, text, expected', [(case['key'], case['text'], case['named']) for case in GOLDEN])
+def test_extract_matches_parse(key, text, expected):
+    assert named(extract(key, text)) == expected
+
+# 골든 출력이 현재 CASES 로 기록되었고 모든 형식의 일치 / 불일치 입력을 포함하는지
+def test_golden_covers_formats():
+    assert [(case['key'], case['text']) for case in GOLDEN] == [(key, text) for key, texts in CASES.items() for text in texts]
+    assert set(CASES) == set(EXTRACT_FORMATS)
+
+    for key in EXTRACT_FORMATS:
+        results = [case['named'] for case in GOLDEN if case['key'] == key]
+        assert any(result != None for result in results), key
+        assert any(result == None for result in results), key
+
+def record():
+    import parse
+
+    golden = []
+    for key, texts in CASES.items():
+        parser = parse.compile(EXTRACT_FORMATS[key])
+        for text in texts:
+            result = parser.parse(text)
+            golden.append({ 'key' : key, 'text' : text, 'named' : None if result == None else dict(result.named) })
+
+    with open(GOLDEN_PATH, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(golden, f, ensure_ascii=False, indent=1)
+        f.write('\n')
+
+    print(f'{len(golden)} cases -> {GOLDEN_PATH}')
+
+if __name__ == '__main__':
+    record()
@@ -0,0 +1,96 @@
+"""decodeFrame 의 프레임당 JSON 디코딩 횟수와 unescapeJson 변환 결과
+
+orjson / 표준 json 의 loads 호출을 세어 프레임마다 최대 1회만 디코딩하는지 확인한다.
+unescapeJson 은 이전 방식 (str.replace 6회) 과 같은 결과인지 비교한다.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import SCARCommon
+
+from SCARCommon import SKIP_METER_VALUE_PERIODIC, decodeFrame, isJsonText, unescapeJson
+
+REQUEST      = '[2,"CH001-0001-ab","Authorize",{"idToken":{"idToken":"0123","type":"ISO14443"}}]'
+RESPONSE     = '[3,"CH001-0001-ab",{"idTokenInfo":{"status":"Accepted"}}]'
+ESCAPED      = '"[3,\\"CH001-0001-ab\\",{\\"idTokenInfo\\":{\\"status\\":\\"Accepted\\"}}]"'
+EMBEDDED     = '[3,"CH001-0001-ab",{"data":"{\\"status\\":\\"Accepted\\"}"}]'
+INVALID      = '"[3,\\"CH001-0001-ab\\",{\\"idTokenInfo\\":{\\"status\\":\\"Accepted\\"}}]" tail'
+UNBALANCED   = '[3,"CH001-0001-ab","{\\"idTokenInfo\\":{\\"status\\":\\"Accepted"}}]'
+NOISE        = 'evse aftr status : charging'
+PERIODIC     = '[2,"CH001-0002-cd","TransactionEvent",{"eventType":"Updated","triggerReason":"MeterValuePeriodic"}]'
+
+class CountingBackend:
+    def __init__(self, decode):
+        self.decode = decode
+        self.count  = 0
+
+    def loads(self, text):
+        self.count += 1
+        return self.decode(text)
+
+# orjson (설치된 경우) / 표준 json 각각 loads 호출 수 계수
+@pytest.fixture(params=['orjson', 'json'])
+def backend(request, monkeypatch):
+    if request.param == 'orjson' and SCARCommon.orjson == None:
+        pytest.skip('orjson not installed')
+
+    counter = CountingBackend(json.loads)
+    if request.param == 'orjson':
+        counter = CountingBackend(SCARCommon.orjson.loads)
+        monkeypatch.setattr(SCARCommon, 'orjson', counter)
+    else:
+        monkeypatch.setattr(SCARCommon, 'orjson', None)
+        monkeypatch.setattr(SCARCommon.json, 'loads', counter.loads)
+    return counter
+
+@pytest.mark.parametrize('log, res, bStrict', [(REQUEST, False, False),
+                                               (RESPONSE, True, False),
+                                               (RESPONSE, True, True),
+                                               (ESCAPED, True, False),
+                                               (ESCAPED, True, True),
+                                               (EMBEDDED, True, True)])
+def test_decode_once(backend, log, res, bStrict):
+    frame = decodeFrame(log, res=res, bStrict=bStrict)
+
+    assert frame != None
+    assert frame.strUUID == 'CH001-0001-ab'
+    assert backend.count == 1
+
+@pytest.mark.parametrize('log', [INVALID, UNBALANCED])
+def test_strict_rejects_without_decode(backend, log):
+    assert decodeFrame(log, res=True, bStrict=True) == None
+    assert backend.count == 0
+
+def test_no_decode(backend):
+    assert decodeFrame(NOISE, res=True, bStrict=True) == None
+    assert decodeFrame(PERIODIC, skip=SKIP_METER_VALUE_PERIODIC).bSkipped == True
+    assert backend.count == 0
+
+# 이전 방식 (역슬래시가 있으면 \\" 와 \" 를 " 로, 괄호에 붙은 따옴표 제거)
+def unescapeReplace(log):
+    if log.find('\\') >= 0:
+        log = log.replace('\\\\"', '"')
+        log = log.replace('\\"', '"')
+    log = log.replace('"[', '[')
+    log = log.replace(']"', ']')
+    log = log.replace('"{', '{')
+    log = log.replace('}"', '}')
+    return log
+
+@pytest.mark.parametrize('log', [REQUEST, RESPONSE, ESCAPED, EMBEDDED, INVALID, UNBALANCED, NOISE, '',
+                                 '\\\\\\"[', ']\\\\\\"\\"', '\\\\\\\\"\\"', '{\\\\\\"["a"', '"]"[', '}\\"{'])
+def test_unescape_matches_replace(log):
+    assert unescapeJson(log) == unescapeReplace(log)
+
+@pytest.mark.parametrize('text', ['"a"', '[]', '{}', ' [1, -2.5e3, true, null, "x"] ', '{"a":[{"b":{}}],"c":"\\u00e9"}', '[NaN,-Infinity]'])
+def test_json_text_valid(text):
+    assert isJsonText(text) == True
+
+@pytest.mark.parametrize('text', ['', 'x', '[', '[1,]', '[1 2]', '{"a"}', '{1:2}', '["a"]]', '"a" "b"', '["\\x"]', '[01]', '{"a":1,}'])
+def test_json_text_invalid(text):
+    assert isJsonText(text) == False
@@ -0,0 +1,115 @@
+"""분석 레코드 (LogInfo / ConnectorInfo / OCPPMessageInfo) 의 레코드당 메모리 상한 (tracemalloc)
+
+__slots__ 와 공유 빈 블록 (EMPTY_CONNECTOR / EMPTY_MESSAGE) 을 쓰는 현재 클래스와
+이전 방식 (인스턴스마다 __dict__, 빈 커넥터/메시지도 매번 생성) 의 같은 레코드 구성을 비교한다.
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SCARCommon import ConnectorInfo, LogInfo, OCPPMessageInfo, internStr
+
+RECORDS = 20000
+
+MAX_BYTES_PER_RECORD = 250     # 현재 클래스의 레코드당 상한 (byte)
+MAX_RATIO            = 0.5     # 이전 방식 대비 상한
+
+# 이전 방식 클래스 (__slots__ 없음, 빈 블록 공유 없음)
+class DictConnectorInfo:
+    def __init__(self):
+        self.nConnection       = 0
+        self.strPreviousStatus = ''
+        self.strCurrentStatus  = ''
+        self.strNotification   = ''
+        self.strCodeFinish     = ''
+        self.strCodeError      = ''
+        self.strCodeErrorPLC   = ''
+        self.strSequenceName1  = ''
+        self.strSequenceName2  = ''
+
+class DictOCPPMessageInfo:
+    def __init__(self):
+        self.strMessageId     = ''
+        self.strResponse      = ''
+        self.strResponseTime  = ''
+        self.strUUID          = ''
+        self.strConnectorId   = ''
+        self.strEventType     = ''
+        self.strChargingState = ''
+        self.strStoppedReason = ''
+        self.strTriggerReason = ''
+        self.strTransactionId = ''
+        self.strIdTag         = ''
+        self.strSoC           = ''
+        self.strMeterValue    = ''
+        self.strTimestamp     = ''
+        self.bOffline         = False
+
+class DictLogInfo:
+    def __init__(self):
+        self.strDateTime  = ''
+        self.nTime        = None
+        self.strEVSEEvent = ''
+        self.strCommand   = ''
+        self.strTarget    = ''
+        self.connector1   = DictConnectorInfo()
+        self.connector2   = DictConnectorInfo()
+        self.ocppMessage  = DictOCPPMessageInfo()
+
+# 분석 결과와 비슷한 구성 : 이벤트 60%, 커넥터 상태/코드 25%, OCPP 메시지 15%
+# 문자열 값은 측정 전에 만들어 두 방식 모두 레코드 객체 크기만 비교
+def makeValues(count):
+    values = []
+    for index in range(count):
+        values.append((f'2025-01-01 {index // 3600 % 24:02d}:{index // 60 % 60:02d}:{index % 60:02d}.{index % 1000:03d}-05:00',
+                       1735707600000 + index * 137,
+                       f'charger-{index:08d}-uuid'))
+    return values
+
+# 값을 설정하는 커넥터/메시지는 두 방식 모두 새 객체를 할당 (분석기와 동일)
+def fillRecord(logInfo, index, dateTime, nTime, uuid, connectorInfo, messageInfo):
+    logInfo.strDateTime = dateTime
+    logInfo.nTime       = nTime
+
+    kind = index % 20
+    if kind < 12:
+        logInfo.strEVSEEvent = internStr('Plug In')
+    elif kind < 17:
+        connector = connectorInfo()
+        connector.strCurrentStatus = internStr('charging')
+        connector.strCodeFinish    = internStr('2')
+        logInfo.connector1 = connector
+    else:
+        message = messageInfo()
+        message.strMessageId = internStr('TransactionEvent')
+        message.strEventType = internStr('Started')
+        message.strUUID      = uuid
+        logInfo.ocppMessage = message
+
+    return logInfo
+
+def bytesPerRecord(makeLog, connectorInfo, messageInfo):
+    values = makeValues(RECORDS)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        records = [fillRecord(makeLog(), index, *value, connectorInfo, messageInfo) for index, value in enumerate(values)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert len(records) == RECORDS
+    return (after - before) / RECORDS
+
+def test_record_bytes():
+    slotted = bytesPerRecord(LogInfo, ConnectorInfo, OCPPMessageInfo)
+    baseline = bytesPerRecord(DictLogInfo, DictConnectorInfo, DictOCPPMessageInfo)
+    print(f'bytes/record : slots {slotted:.0f}, dict {baseline:.0f}')
+
+    assert slotted <= MAX_BYTES_PER_RECORD
+    assert slotted <= baseline * MAX_RATIO